@@ -0,0 +1,207 @@
+# analytics.py
+"""
+InnovateHer 2026 - The Equity Gap: Usage Analytics
+Routes drop small events (route, normalized role, chat category, latency,
+fallback used) into an in-memory ring buffer; recording never blocks and never
+touches disk. A background writer drains the buffer into SQLite in batches.
+summary() powers the admin report, and top_roles() drives cache prewarming.
+Events older than ANALYTICS_RETENTION_DAYS are pruned by the same writer.
+No salaries or message text are recorded.
+Exposes: record(...), summary(hours, limit), top_roles(limit, hours), flush(), prune()
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+
+_ENABLED = os.getenv("ANALYTICS", "1") != "0"
+_DB_PATH = os.getenv(
+    "ANALYTICS_DB_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "analytics.db"),
+)
+_BUFFER_SIZE = int(os.getenv("ANALYTICS_BUFFER", "10000"))
+_BATCH_SIZE = 1000
+_FLUSH_SECONDS = float(os.getenv("ANALYTICS_FLUSH_SECONDS", "5"))
+_RETENTION_DAYS = float(os.getenv("ANALYTICS_RETENTION_DAYS", "30"))  # 0 keeps everything
+_PRUNE_SECONDS = 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS EVENTS (
+    TS         REAL,
+    ROUTE      TEXT,
+    STATUS     INTEGER,
+    LATENCY_MS REAL,
+    ROLE_KEY   TEXT,
+    CATEGORY   TEXT,
+    FALLBACK   TEXT
+);
+CREATE INDEX IF NOT EXISTS IDX_EVENTS_TS ON EVENTS (TS);
+"""
+
+
+# ============================================
+# RING BUFFER (request path)
+# ============================================
+
+# deque(maxlen) drops the oldest event when full: producers never wait
+_buffer: deque = deque(maxlen=_BUFFER_SIZE)
+_wake = threading.Event()
+_writer = None
+_writer_lock = threading.Lock()
+dropped = 0
+
+
+def record(route: str, status: int, latency_ms: float, role_key: str = None,
+           category: str = None, fallback: str = None) -> None:
+    """Queue one event (O(1), lock-free append)."""
+    global dropped
+    if not _ENABLED:
+        return
+    if len(_buffer) == _buffer.maxlen:
+        dropped += 1
+    _buffer.append((time.time(), route, status, round(latency_ms, 2), role_key, category, fallback))
+    if len(_buffer) >= _BATCH_SIZE:
+        _wake.set()
+    _ensure_writer()
+
+
+# ============================================
+# WRITE-BEHIND (background thread)
+# ============================================
+
+_conn = None
+_conn_lock = threading.Lock()
+
+
+def _connect() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(_DB_PATH, check_same_thread=False)
+        _conn.executescript(_SCHEMA)
+    return _conn
+
+
+def flush() -> int:
+    """Write everything buffered so far, in batches. Returns events written."""
+    written = 0
+    with _conn_lock:
+        conn = _connect()
+        while _buffer:
+            batch = []
+            while _buffer and len(batch) < _BATCH_SIZE:
+                batch.append(_buffer.popleft())
+            with conn:
+                conn.executemany("INSERT INTO EVENTS VALUES (?, ?, ?, ?, ?, ?, ?)", batch)
+            written += len(batch)
+    return written
+
+
+def prune() -> int:
+    """Delete events older than the retention window, a batch per transaction. Returns events deleted."""
+    if _RETENTION_DAYS <= 0:
+        return 0
+    cutoff = time.time() - _RETENTION_DAYS * 86400
+    deleted = 0
+    while True:
+        # Short transactions: flush() and the admin report interleave between batches
+        with _conn_lock:
+            conn = _connect()
+            with conn:
+                n = conn.execute(
+                    "DELETE FROM EVENTS WHERE rowid IN (SELECT rowid FROM EVENTS WHERE TS < ? LIMIT ?)",
+                    (cutoff, _BATCH_SIZE),
+                ).rowcount
+        deleted += n
+        if n < _BATCH_SIZE:
+            return deleted
+
+
+def _write_loop() -> None:
+    pruned_at = 0.0
+    while True:
+        _wake.wait(_FLUSH_SECONDS)
+        _wake.clear()
+        try:
+            flush()
+            if time.monotonic() - pruned_at >= _PRUNE_SECONDS:
+                pruned_at = time.monotonic()
+                prune()
+        except sqlite3.Error:
+            time.sleep(_FLUSH_SECONDS)  # disk trouble: events stay in (or fall off) the ring
+
+
+def _ensure_writer() -> None:
+    global _writer
+    if _writer is None or not _writer.is_alive():
+        with _writer_lock:
+            if _writer is None or not _writer.is_alive():
+                _writer = threading.Thread(target=_write_loop, name="analytics-writer", daemon=True)
+                _writer.start()
+
+
+# ============================================
+# AGGREGATION
+# ============================================
+
+def _rows(sql: str, params: tuple) -> list[tuple]:
+    flush()
+    with _conn_lock:
+        return _connect().execute(sql, params).fetchall()
+
+
+def top_roles(limit: int = 20, hours: float = 24 * 7) -> list[str]:
+    """Most requested normalized roles in the window (prewarm candidates)."""
+    if not _ENABLED or not os.path.exists(_DB_PATH):
+        return []
+    rows = _rows(
+        "SELECT ROLE_KEY, COUNT(*) AS n FROM EVENTS WHERE TS >= ? AND ROLE_KEY IS NOT NULL "
+        "GROUP BY ROLE_KEY ORDER BY n DESC LIMIT ?",
+        (time.time() - hours * 3600, limit),
+    )
+    return [role for role, _n in rows]
+
+
+def summary(hours: float = 24, limit: int = 10) -> dict:
+    if not _ENABLED:
+        return {"enabled": False}
+    since = time.time() - hours * 3600
+    routes = _rows(
+        "SELECT ROUTE, COUNT(*), AVG(LATENCY_MS), MAX(LATENCY_MS), "
+        "SUM(FALLBACK IS NOT NULL), SUM(STATUS >= 500) "
+        "FROM EVENTS WHERE TS >= ? GROUP BY ROUTE ORDER BY COUNT(*) DESC",
+        (since,),
+    )
+    fallbacks = _rows(
+        "SELECT ROUTE, FALLBACK, COUNT(*) FROM EVENTS WHERE TS >= ? AND FALLBACK IS NOT NULL "
+        "GROUP BY ROUTE, FALLBACK ORDER BY COUNT(*) DESC",
+        (since,),
+    )
+    roles = _rows(
+        "SELECT ROLE_KEY, COUNT(*) FROM EVENTS WHERE TS >= ? AND ROLE_KEY IS NOT NULL "
+        "GROUP BY ROLE_KEY ORDER BY COUNT(*) DESC LIMIT ?",
+        (since, limit),
+    )
+    categories = _rows(
+        "SELECT CATEGORY, COUNT(*) FROM EVENTS WHERE TS >= ? AND CATEGORY IS NOT NULL "
+        "GROUP BY CATEGORY ORDER BY COUNT(*) DESC LIMIT ?",
+        (since, limit),
+    )
+    return {
+        "enabled": True,
+        "window_hours": hours,
+        "routes": [
+            {
+                "route": route, "requests": n,
+                "avg_latency_ms": round(avg or 0, 2), "max_latency_ms": round(mx or 0, 2),
+                "fallback_rate": round((fb or 0) / n, 4), "error_rate": round((err or 0) / n, 4),
+            }
+            for route, n, avg, mx, fb, err in routes
+        ],
+        "fallbacks": [{"route": r, "fallback": f, "count": n} for r, f, n in fallbacks],
+        "top_roles": [{"role": r, "count": n} for r, n in roles],
+        "top_categories": [{"category": c, "count": n} for c, n in categories],
+        "buffered": len(_buffer),
+        "dropped": dropped,
+        "retention_days": _RETENTION_DAYS,
+    }
@@ -2,17 +2,143 @@
 """
 InnovateHer 2026 - The Equity Gap: Unified Flask API
 PORT 8000 | Endpoints: /api/gap-check, /api/simulate, /api/chat, /api/lifetime
+GET /api/lifetime and GET /api/simulate are cacheable (strong ETag + Cache-Control)
+Add format=compact (query or body) to /api/lifetime and /api/simulate for delta-encoded arrays
+SERVE_FRONTEND=1 also serves the built frontend/dist from this process
+GET /api/simulate/surface returns the whole months x spend x savings cost grid
+POST /api/career-path runs an event timeline (breaks, promotions, switches, raises)
+POST /api/salaries/submit accepts opt-in crowd salaries (batched into SALARIES)
+/api/gap-check and /api/lifetime include 95% bootstrap intervals on the gender gap
+Gemini, MongoDB and Nessie calls run in bounded bulkheads; /api/chat is rate-limited per client
+POST /api/jobs runs long simulations in the background (poll /api/jobs/<id> or SSE /events)
+PROFILING=1 samples requests into collapsed-stack files; /api/admin/* needs ADMIN_TOKEN
+Benchmarks, tips and chat replies share a two-tier cache (in-process L1 + REDIS_URL L2)
+Every route has a latency budget (ROUTE_BUDGET_<ENDPOINT>); backend calls time out within it
+Usage events (route, role, category, latency, fallback) feed /api/admin/analytics and cache prewarming
+Without Gemini (missing, slow, saturated, rate-limited) chat answers from local coach templates
+POST /api/session/overview returns gap, lifetime, simulation and an opening tip in one round trip
+POST /api/offers/compare ranks offer packages by NPV over several horizons and discount rates
+POST /api/audit fits an employer's payroll CSV for the controlled (fixed-effects) gender gap
+GET /api/export/aggregates streams role/level/location/gender aggregates as NDJSON or CSV
+Every Snowflake / SQLite / Mongo call is fingerprinted into a query ledger; /api/admin/queries ranks them
+After /api/gap-check or /api/session/overview, idle capacity prefetches the role's /api/lifetime body and chat tips
 """
 
+import hmac
+import itertools
 import os
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FuturesTimeout
 from dotenv import load_dotenv
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify, send_file
 from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.middleware.proxy_fix import ProxyFix
+
+import analytics
+from bulkhead import BulkheadFull, RateLimiter, get_bulkhead
+from cache import get_cache
+import cache
+from deadline import DeadlineExceeded, budget, set_budget, timeout_for
+from http_cache import conditional_json, make_etag, redirect_to_canonical
+from http_codec import compact_encode, encode_stream, init_codec, wants_compact
+from static_frontend import init_frontend
+from profiling import init_profiling
+from coach_templates import compose_reply
+from career_path import get_career_path, parse_events, parse_params
+import jobs
+import prefetch
+import profiling
+import query_ledger
 
 load_dotenv()
 
 app = Flask(__name__)
+# Behind N trusted reverse proxies, remote_addr is the address the outermost one saw
+# (never a hop the client wrote itself); 0 = clients connect directly
+_TRUSTED_PROXY_HOPS = int(os.getenv("TRUSTED_PROXY_HOPS", "0"))
+if _TRUSTED_PROXY_HOPS > 0:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=_TRUSTED_PROXY_HOPS)
 CORS(app)
+init_codec(app)
+init_profiling(app)
+
+# ============================================
+# LATENCY BUDGETS (seconds per endpoint; ROUTE_BUDGET_<ENDPOINT> overrides)
+# ============================================
+
+_ROUTE_BUDGETS = {
+    "gap_check": 3.0,
+    "lifetime": 4.0,
+    "lifetime_cached": 4.0,
+    "simulate": 12.0,
+    "simulate_cached": 4.0,
+    "simulate_surface": 5.0,
+    "career_path": 3.0,
+    "chat": 10.0,
+    "session_overview": 8.0,
+    "audit": 30.0,
+    "export_aggregates": 30.0,  # until the first batch; the stream itself is unbounded
+}
+_NO_BUDGET = {"jobs_events", "static", "admin_profile", "admin_profile_file"}
+_DEFAULT_BUDGET = float(os.getenv("ROUTE_BUDGET_DEFAULT", "10"))
+_JOB_BUDGET = float(os.getenv("JOB_BUDGET_SECONDS", "120"))
+
+
+@app.before_request
+def _start_budget():
+    endpoint = request.endpoint or ""
+    if endpoint in _NO_BUDGET:
+        set_budget(None)
+        return
+    seconds = _ROUTE_BUDGETS.get(endpoint, _DEFAULT_BUDGET)
+    set_budget(float(os.getenv(f"ROUTE_BUDGET_{endpoint.upper()}", seconds)))
+
+
+@app.teardown_request
+def _clear_budget(_exc):
+    set_budget(None)
+
+
+# Foreground load gates speculative prefetch (see prefetch.py)
+@app.before_request
+def _foreground_started():
+    g.foreground = True
+    prefetch.foreground_started()
+
+
+@app.teardown_request
+def _foreground_finished(_exc):
+    if g.pop("foreground", False):
+        prefetch.foreground_finished()
+
+
+# ============================================
+# USAGE ANALYTICS (non-blocking; see analytics.py)
+# ============================================
+
+def _note(**fields) -> None:
+    """Attach analytics fields (role_key, category, fallback) to the current request's event."""
+    g.setdefault("analytics", {}).update(fields)
+
+
+@app.before_request
+def _start_timer():
+    g.started = time.perf_counter()
+
+
+@app.after_request
+def _record_event(response):
+    endpoint = request.endpoint or ""
+    if request.path.startswith("/api/") and not endpoint.startswith("admin_") and "started" in g:
+        analytics.record(
+            endpoint or request.path,
+            response.status_code,
+            (time.perf_counter() - g.started) * 1000,
+            **g.get("analytics", {}),
+        )
+    return response
 
 # ============================================
 # GEMINI AI (optional, graceful degradation)
@@ -54,7 +180,7 @@ except Exception:
 # SAFE IMPORTS WITH DETERMINISTIC FALLBACKS
 # ============================================
 
-# truth_engine.py (Snowflake salary benchmarks) — DO NOT EDIT that file
+# truth_engine.py (salary benchmarks via salary_backend: Snowflake or embedded SQLite)
 try:
     from truth_engine import get_market_benchmark
 except Exception:
@@ -84,25 +210,59 @@ except Exception:
 
 # bank_sim.py (Career break simulator)
 try:
-    from bank_sim import run_simulation
+    from bank_sim import run_simulation, run_deterministic_simulation, compound_opportunity_cost
 except Exception:
-    def run_simulation(months: int, spend: float, savings: float = None) -> dict:
+    def run_deterministic_simulation(months: int, spend: float, savings: float = None, on_progress=None) -> dict:
         months = max(1, min(24, int(months)))
         spend = max(0, float(spend))
         balance = float(savings) if savings is not None else 25000
         starting = balance
         chart_data = [int(balance)]
-        for _ in range(months):
+        for month in range(1, months + 1):
             balance = max(0, balance - spend)
             chart_data.append(int(balance))
+            if on_progress:
+                on_progress(month, int(balance))
         lost = int(starting) - chart_data[-1]
         return {"lost": int(lost), "chart_data": chart_data}
 
+    run_simulation = run_deterministic_simulation
+
+    def compound_opportunity_cost(chart_data: list) -> int:
+        return int((chart_data[0] - chart_data[-1]) * 3.3) if chart_data else 0
+
+
+# break_surface.py (Vectorized career break grid — needs NumPy)
+try:
+    from break_surface import (
+        compute_surface, axis_length, grid_axis, MAX_CELLS as _SURFACE_MAX_CELLS, MAX_DOLLARS as _SURFACE_MAX_DOLLARS,
+    )
+except Exception:
+    compute_surface = None
+    _SURFACE_MAX_DOLLARS = 100_000_000
+
+
+# offers.py (Vectorized offer-package NPV — needs NumPy)
+try:
+    from offers import compare_offers, parse_grid, parse_offers
+except Exception:
+    compare_offers = None
+
+
+# audit.py (Employer payroll audit — needs NumPy)
+try:
+    from audit import AuditError, fit_audit, read_payroll
+except Exception:
+    fit_audit = None
+
 
 # gender_engine.py (Gender-disaggregated Snowflake queries)
 try:
     from gender_engine import get_gender_benchmark, compute_lifetime_impact
+    from salary_backend import get_backend as _get_salary_backend
+    _BENCHMARK_SOURCE = _get_salary_backend().name
 except Exception:
+    _BENCHMARK_SOURCE = "mock"
     _MOCK_GENDER = {
         "software engineer": (134000, 121000),
         "data analyst": (89000, 79000),
@@ -158,9 +318,66 @@ except Exception:
         }
 
 
+# gap_stats.py (Bootstrap intervals on the gender gap — needs NumPy and raw salaries)
+try:
+    from gap_stats import gap_confidence
+    if _BENCHMARK_SOURCE == "mock":
+        raise ImportError("no salary backend")
+except Exception:
+    gap_confidence = None
+
+
+# salary_backend.py (Title keys; the Snowflake connector itself is imported on first use)
+try:
+    from salary_backend import normalize_title, summary_signature
+except Exception:
+    def normalize_title(role: str) -> str:
+        return " ".join(str(role).split()).upper()
+
+    summary_signature = None
+
+
+# salary_submissions.py (Opt-in crowd salaries, batched into SALARIES)
+try:
+    import salary_submissions
+except Exception:
+    salary_submissions = None
+
+
+def _role_generation(role: str) -> int:
+    """Crowd-submission generation for role (0 without submissions): part of cache keys and ETags."""
+    return salary_submissions.role_generation(role) if salary_submissions is not None else 0
+
+
+def _role_version(role: str) -> str:
+    """
+    Data version of role's aggregates for ETags and cache keys: its submission
+    generation plus its summary signature, which a bulk ingest (another
+    process) changes once the aggregate cache lets go of the old rows.
+    """
+    generation = _role_generation(role)
+    if summary_signature is None or _BENCHMARK_SOURCE == "mock":
+        return str(generation)
+    try:
+        return f"{generation}:{summary_signature(role)}"
+    except Exception:
+        return f"{generation}:unavailable"
+
+
+# export.py (Streaming aggregate exports)
+try:
+    from export import (
+        BATCH_SIZE as _EXPORT_BATCH_SIZE, CONTENT_TYPES as _EXPORT_TYPES, MIN_GROUP_SIZE as _MIN_GROUP_SIZE,
+        export_chunks, parse_export_params,
+    )
+except Exception:
+    export_chunks = None
+    _MIN_GROUP_SIZE = int(os.getenv("EXPORT_MIN_GROUP_SIZE", "5"))
+
+
 # negotiation_db.py (MongoDB knowledge base)
 try:
-    from negotiation_db import get_tip
+    from negotiation_db import get_tip, warm_tips, _classify_message as classify_message
 except Exception:
     def get_tip(context: dict) -> str:
         return (
@@ -168,6 +385,305 @@ except Exception:
             "role?' before revealing any numbers. (Source: Harvard Business Review)"
         )
 
+    def classify_message(message: str) -> str:
+        return "general"
+
+    def warm_tips(category: str) -> bool:
+        return False
+
+
+# ============================================
+# HTTP CACHING (GET variants of deterministic endpoints)
+# ============================================
+
+# Bump SALARIES_DATA_VERSION whenever SALARIES is reseeded so cached
+# /api/lifetime ETags stop matching.
+_DATA_VERSION = f"{os.getenv('SALARIES_DATA_VERSION', 'seed-2026-02')}:{_BENCHMARK_SOURCE}"
+_SIM_VERSION = "sim-2"  # bump when simulation math changes
+_LIFETIME_MAX_AGE = int(os.getenv("LIFETIME_CACHE_SECONDS", "300"))
+_SIMULATE_MAX_AGE = int(os.getenv("SIMULATE_CACHE_SECONDS", "86400"))
+
+
+def _parse_lifetime_params(source) -> tuple[str, int]:
+    """Normalize (role, years) from a JSON body or query args."""
+    role = " ".join(str(source.get("role", "")).split())
+    try:
+        years = int(source.get("years", 30))
+    except (TypeError, ValueError):
+        years = 30
+    return role, max(1, min(40, years))
+
+
+def _parse_simulate_params(source) -> tuple[int, float, float]:
+    """Normalize (months, monthly_spend, savings) from a JSON body or query args."""
+    try:
+        months = int(source.get("months", 6))
+    except (TypeError, ValueError):
+        months = 6
+    months = max(1, min(24, months))
+
+    try:
+        monthly_spend = float(source.get("monthly_spend", 2000))
+    except (TypeError, ValueError):
+        monthly_spend = 2000
+    monthly_spend = max(0, monthly_spend)
+
+    try:
+        savings = float(source.get("savings", 25000))
+    except (TypeError, ValueError):
+        savings = 25000
+    savings = max(0, savings)
+
+    return months, monthly_spend, savings
+
+
+def _gap_intervals(role: str) -> dict:
+    """gap_ci / gap_percent_ci fields for role; empty when unavailable (never fails the request)."""
+    if gap_confidence is None:
+        return {}
+    try:
+        return gap_confidence(role, version=_DATA_VERSION) or {}
+    except Exception:
+        return {}
+
+
+def _gap_payload(role: str, current_salary: float, benchmark: dict, gb: dict, ci: dict) -> dict:
+    """The /api/gap-check body from already-resolved market and gender benchmarks."""
+    if not benchmark.get("success"):
+        _note(fallback="market_default")
+        market_average = 90000
+    else:
+        market_average = benchmark.get("average_salary", 90000)
+
+    gap_amount = max(0, market_average - current_salary)
+    verdict = "UNDERPAID" if gap_amount > 0 else "FAIR RATE"
+
+    if verdict == "UNDERPAID":
+        message = f"You are leaving ${gap_amount:,} on the table."
+    else:
+        message = "Your salary is competitive with market rates. Keep negotiating to stay ahead!"
+
+    # Enrich with gender-disaggregated data
+    gender_data = {}
+    if gb and gb.get("success"):
+        gender_data = {
+            "male_avg": gb["male_avg"],
+            "female_avg": gb["female_avg"],
+            "gender_gap": gb["gap"],
+            "gender_gap_percent": gb["gap_percent"],
+        }
+        if ci:
+            gender_data["gender_gap_ci"] = ci["gap_ci"]
+            gender_data["gender_gap_percent_ci"] = ci["gap_percent_ci"]
+
+    return {
+        "verdict": verdict,
+        "gap_amount": int(gap_amount),
+        "market_average": int(market_average),
+        "message": message,
+        **gender_data,
+    }
+
+
+def _lifetime_payload(role: str, years: int, gb: dict = None, ci: dict = None) -> tuple[dict, int]:
+    """Build the /api/lifetime response body and status (benchmark/intervals fetched unless given)."""
+    _note(role_key=normalize_title(role))
+    # Get gender-disaggregated benchmark from Snowflake
+    if gb is None:
+        gb = get_gender_benchmark(role)
+
+    if not gb.get("success"):
+        return {
+            "success": False,
+            "error": gb.get("error", "No data found for this role."),
+        }, 404
+
+    # Compute 30-year compound impact
+    impact = compute_lifetime_impact(gb["male_avg"], gb["female_avg"], years)
+
+    return {
+        "success": True,
+        "role": role,
+        "male_avg": gb["male_avg"],
+        "female_avg": gb["female_avg"],
+        "gap": gb["gap"],
+        "gap_percent": gb["gap_percent"],
+        "male_count": gb.get("male_count", 0),
+        "female_count": gb.get("female_count", 0),
+        "male_range": gb.get("male_range", {}),
+        "female_range": gb.get("female_range", {}),
+        **(_gap_intervals(role) if ci is None else ci),
+        **impact,
+    }, 200
+
+
+def _simulate_payload(result: dict, months: int, monthly_spend: float, savings: float) -> dict:
+    """Shape a run_simulation() result into the /api/simulate response body."""
+    lost = result.get("lost", int(months * monthly_spend))
+    chart_data = result.get("chart_data", [int(savings)])
+
+    compound_loss = compound_opportunity_cost(chart_data)
+    message = (
+        f"A {months}-month break costs you ${lost:,} in cash "
+        f"+ ${compound_loss:,} in future compound interest."
+    )
+
+    return {
+        "lost": int(lost),
+        "compound_loss": compound_loss,
+        "chart_data": chart_data,
+        "message": message,
+    }
+
+
+def _parse_surface_params(source) -> dict:
+    """Normalize the spend / savings axes for /api/simulate/surface (whole dollars)."""
+    defaults = {
+        "spend_min": 500, "spend_max": 6000, "spend_step": 250,
+        "savings_min": 0, "savings_max": 100000, "savings_step": 5000,
+    }
+    params = {}
+    for key, default in defaults.items():
+        try:
+            params[key] = min(_SURFACE_MAX_DOLLARS, max(0, int(round(float(source.get(key, default))))))
+        except (TypeError, ValueError, OverflowError):
+            params[key] = default
+    params["spend_step"] = max(1, params["spend_step"])
+    params["savings_step"] = max(1, params["savings_step"])
+    return params
+
+
+# ============================================
+# ADMISSION CONTROL
+# ============================================
+
+# Seconds a request waits on its bulkhead before serving the fallback
+_CHAT_TIMEOUT = float(os.getenv("CHAT_TIMEOUT_SECONDS", "20"))
+_NESSIE_TIMEOUT = float(os.getenv("NESSIE_TIMEOUT_SECONDS", "30"))
+_chat_limiter = RateLimiter(
+    per_minute=float(os.getenv("CHAT_RATE_PER_MINUTE", "20")),
+    burst=int(os.getenv("CHAT_RATE_BURST", "5")),
+)
+# Crowd salaries feed live benchmarks: one client cannot flood them
+_submit_limiter = RateLimiter(
+    per_minute=float(os.getenv("SUBMIT_RATE_PER_MINUTE", "3")),
+    burst=int(os.getenv("SUBMIT_RATE_BURST", "2")),
+)
+# Each payroll audit holds a whole upload in memory while it fits
+_audit_limiter = RateLimiter(
+    per_minute=float(os.getenv("AUDIT_RATE_PER_MINUTE", "6")),
+    burst=int(os.getenv("AUDIT_RATE_BURST", "2")),
+)
+
+
+def _simulate_job(params: dict, progress) -> dict:
+    """jobs handler: live simulation with one progress event per simulated month."""
+    months, monthly_spend, savings = _parse_simulate_params(params)
+    with budget(_JOB_BUDGET):
+        result = run_simulation(
+            months, monthly_spend, savings,
+            on_progress=lambda month, balance: progress({"month": month, "months": months, "balance": balance}),
+        )
+    return _simulate_payload(result, months, monthly_spend, savings)
+
+
+jobs.register("simulate", _simulate_job)
+
+
+# Identical question + profile + history gets the same coaching reply on any node
+_chat_cache = get_cache(
+    "chat",
+    version=os.getenv("CHAT_CACHE_VERSION", "chat-1:gemini-2.5-flash"),
+    l1_ttl=300,
+    l2_ttl=float(os.getenv("CHAT_CACHE_SECONDS", "3600")),
+)
+
+
+def _start(bulkhead: str, fn, *args) -> Future | None:
+    """Schedule one part of a fan-out on a bulkhead; None when it is saturated."""
+    try:
+        return get_bulkhead(bulkhead).submit(fn, *args)
+    except BulkheadFull:
+        return None
+
+
+def _settle(future: Future | None, timeout: float = None) -> tuple:
+    """(result, None), or (None, reason) when the part was rejected, too slow, or failed."""
+    if future is None:
+        return None, "saturated"
+    try:
+        return future.result(timeout_for(timeout)), None
+    except (DeadlineExceeded, FuturesTimeout):
+        return None, "timeout"
+    except Exception:
+        return None, "error"
+
+
+# ============================================
+# SPECULATIVE PREFETCH (follow-ups of a gap-check)
+# ============================================
+
+# Long enough for the user to open the lifetime page; short enough to never matter for staleness
+_PREFETCH_TTL = float(os.getenv("PREFETCH_TTL_SECONDS", "120"))
+_PREFETCH_YEARS = 30  # the lifetime page's default
+_prefetched = get_cache("prefetch", version=_DATA_VERSION, l1_ttl=_PREFETCH_TTL, l2_ttl=_PREFETCH_TTL)
+
+
+def _prefetch_key(role: str, years: int) -> list:
+    return ["lifetime", normalize_title(role), years, _role_version(role)]
+
+
+def _schedule_prefetch(role: str, gb: dict, ci: dict, verdict: str, lifetime: tuple = None) -> None:
+    """
+    Warm what usually follows a gap-check or session overview for role: the tips
+    for the chat category it is likely to open with, then the default
+    /api/lifetime body (from the gender benchmark and intervals this request
+    already has). lifetime=(years, body) stores a body the request already built.
+    """
+    if _BENCHMARK_SOURCE == "mock":
+        return
+
+    def tips():
+        warm_tips("salary" if verdict == "UNDERPAID" else "general")
+
+    def build_lifetime():
+        with app.app_context():  # _lifetime_payload notes analytics fields on g
+            benchmark = gb if gb.get("success") else get_gender_benchmark(role)
+            payload, status = _lifetime_payload(role, _PREFETCH_YEARS, benchmark, ci if gb.get("success") else None)
+        if status == 200:
+            _prefetched.set(_prefetch_key(role, _PREFETCH_YEARS), payload)
+
+    steps = [("tips", tips)]
+    if lifetime is not None:
+        _prefetched.set(_prefetch_key(role, lifetime[0]), lifetime[1])
+    if lifetime is None or lifetime[0] != _PREFETCH_YEARS:
+        steps.append(("lifetime", build_lifetime))
+    prefetch.schedule(normalize_title(role), steps)
+
+
+def _lifetime_response(role: str, years: int) -> tuple[dict, int]:
+    """The /api/lifetime body, from the prefetch cache when a gap-check or overview warmed it."""
+    payload = _prefetched.get(_prefetch_key(role, years))
+    if payload is not None:
+        _note(role_key=normalize_title(role))
+        return payload, 200
+    # Computing it here anyway: a still-pending prefetch for this role is wasted work
+    prefetch.cancel(normalize_title(role))
+    return _lifetime_payload(role, years)
+
+
+def _benchmarks(role: str) -> tuple[dict, dict]:
+    """
+    (market, gender) benchmarks for role from one summary read: run back to back
+    on one thread, the gender lookup finds the rows the market lookup just cached.
+    """
+    return get_market_benchmark(role), get_gender_benchmark(role)
+
+
+def _client_key() -> str:
+    """Rate-limit identity: the peer address (ProxyFix resolves it when TRUSTED_PROXY_HOPS is set)."""
+    return request.remote_addr or "unknown"
+
 
 # ============================================
 # ROUTES
@@ -193,41 +709,33 @@ def gap_check():
         except (TypeError, ValueError):
             current_salary = 0
 
+        _note(role_key=normalize_title(role))
         benchmark = get_market_benchmark(role)
 
-        if not benchmark.get("success"):
-            market_average = 90000
-        else:
-            market_average = benchmark.get("average_salary", 90000)
-
-        gap_amount = max(0, market_average - current_salary)
-        verdict = "UNDERPAID" if gap_amount > 0 else "FAIR RATE"
-
-        if verdict == "UNDERPAID":
-            message = f"You are leaving ${gap_amount:,} on the table."
-        else:
-            message = "Your salary is competitive with market rates. Keep negotiating to stay ahead!"
+        # Opt-in: contribute this salary to the crowd-sourced dataset (rate-limited per client)
+        contributed = False
+        wants_contribute = (
+            data.get("contribute") is True and _BENCHMARK_SOURCE != "mock" and salary_submissions is not None
+        )
+        if wants_contribute and not _submit_limiter.check(_client_key()):
+            try:
+                row = salary_submissions.normalize_submission({**data, "salary": current_salary})
+                contributed = salary_submissions.submit(row)
+            except (TypeError, ValueError):
+                pass
 
-        # Enrich with gender-disaggregated data
-        gender_data = {}
         try:
             gb = get_gender_benchmark(role)
-            if gb.get("success"):
-                gender_data = {
-                    "male_avg": gb["male_avg"],
-                    "female_avg": gb["female_avg"],
-                    "gender_gap": gb["gap"],
-                    "gender_gap_percent": gb["gap_percent"],
-                }
+            ci = _gap_intervals(role) if gb.get("success") else {}
         except Exception:
-            pass
+            gb, ci = {}, {}
+
+        payload = _gap_payload(role, current_salary, benchmark, gb, ci)
+        _schedule_prefetch(role, gb, ci, payload["verdict"])
 
         return jsonify({
-            "verdict": verdict,
-            "gap_amount": int(gap_amount),
-            "market_average": int(market_average),
-            "message": message,
-            **gender_data,
+            **payload,
+            **({"contributed": contributed} if data.get("contribute") is True else {}),
         })
 
     except Exception:
@@ -245,41 +753,49 @@ def lifetime():
     try:
         data = request.get_json(silent=True) or {}
 
-        role = str(data.get("role", "")).strip()
+        role, years = _parse_lifetime_params(data)
         if not role:
             return jsonify({"success": False, "error": "Please provide a job role."}), 400
 
-        try:
-            years = int(data.get("years", 30))
-        except (TypeError, ValueError):
-            years = 30
-        years = max(1, min(40, years))
+        payload, status = _lifetime_response(role, years)
+        if status == 200 and wants_compact(data):
+            payload = compact_encode(payload)
+        return jsonify(payload), status
 
-        # Get gender-disaggregated benchmark from Snowflake
-        gb = get_gender_benchmark(role)
+    except Exception:
+        return jsonify({
+            "success": False,
+            "error": "Unable to compute lifetime impact right now.",
+        }), 500
 
-        if not gb.get("success"):
-            return jsonify({
-                "success": False,
-                "error": gb.get("error", "No data found for this role."),
-            }), 404
 
-        # Compute 30-year compound impact
-        impact = compute_lifetime_impact(gb["male_avg"], gb["female_avg"], years)
+@app.route("/api/lifetime", methods=["GET"])
+def lifetime_cached():
+    """GET /api/lifetime?role=&years= — Cacheable lifetime impact (ETag / 304)."""
+    try:
+        role, years = _parse_lifetime_params(request.args)
+        if not role:
+            return jsonify({"success": False, "error": "Please provide a job role."}), 400
 
-        return jsonify({
-            "success": True,
-            "role": role,
-            "male_avg": gb["male_avg"],
-            "female_avg": gb["female_avg"],
-            "gap": gb["gap"],
-            "gap_percent": gb["gap_percent"],
-            "male_count": gb.get("male_count", 0),
-            "female_count": gb.get("female_count", 0),
-            "male_range": gb.get("male_range", {}),
-            "female_range": gb.get("female_range", {}),
-            **impact,
-        })
+        params = {"role": role, "years": years}
+        compact = wants_compact(request.args)
+        if compact:
+            params["format"] = "compact"
+
+        canonical = redirect_to_canonical(params)
+        if canonical is not None:
+            return canonical
+
+        def build():
+            payload, status = _lifetime_response(role, years)
+            if status == 200 and compact:
+                payload = compact_encode(payload)
+            return payload, status
+
+        # New crowd submissions or ingested rows for this role change its aggregates
+        version = f"{_DATA_VERSION}:{_role_version(role)}"
+        etag = make_etag("lifetime", params, version)
+        return conditional_json(etag, build, _LIFETIME_MAX_AGE)
 
     except Exception:
         return jsonify({
@@ -294,40 +810,125 @@ def simulate():
     try:
         data = request.get_json(silent=True) or {}
 
+        months, monthly_spend, savings = _parse_simulate_params(data)
         try:
-            months = int(data.get("months", 6))
-        except (TypeError, ValueError):
-            months = 6
-        months = max(1, min(24, months))
+            result = get_bulkhead("nessie").call(
+                run_simulation, months, monthly_spend, savings, timeout=_NESSIE_TIMEOUT,
+            )
+        except (BulkheadFull, DeadlineExceeded, FuturesTimeout):
+            # Nessie pool saturated or slow: same math without the live bank calls
+            _note(fallback="deterministic")
+            result = run_deterministic_simulation(months, monthly_spend, savings)
 
-        try:
-            monthly_spend = float(data.get("monthly_spend", 2000))
-        except (TypeError, ValueError):
-            monthly_spend = 2000
-        monthly_spend = max(0, monthly_spend)
+        payload = _simulate_payload(result, months, monthly_spend, savings)
+        if wants_compact(data):
+            payload = compact_encode(payload)
+        return jsonify(payload)
+
+    except Exception:
+        return jsonify({
+            "lost": 12000,
+            "chart_data": [25000, 23000, 21000, 19000, 17000, 15000, 13000],
+            "message": "A 6-month break costs you $12,000 in cash + $40,000 in future compound interest.",
+        })
 
-        try:
-            savings = float(data.get("savings", 25000))
-        except (TypeError, ValueError):
-            savings = 25000
-        savings = max(0, savings)
 
-        result = run_simulation(months, monthly_spend, savings)
+@app.route("/api/jobs", methods=["POST"])
+def jobs_submit():
+    """POST /api/jobs {"type": "simulate", ...params} — Queue a background job (202 + job id)."""
+    data = request.get_json(silent=True) or {}
+    kind = str(data.get("type", "simulate"))
+    try:
+        job_id = jobs.submit(kind, {k: v for k, v in data.items() if k != "type"})
+    except jobs.UnknownJobType as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    except jobs.JobQueueFull:
+        resp = jsonify({"success": False, "error": "Too many jobs in progress, retry shortly."})
+        resp.headers["Retry-After"] = "5"
+        return resp, 429
 
-        lost = result.get("lost", int(months * monthly_spend))
-        chart_data = result.get("chart_data", [int(savings)])
+    resp = jsonify({
+        "success": True,
+        "job_id": job_id,
+        "status": jobs.QUEUED,
+        "status_url": f"/api/jobs/{job_id}",
+        "events_url": f"/api/jobs/{job_id}/events",
+    })
+    resp.headers["Location"] = f"/api/jobs/{job_id}"
+    return resp, 202
 
-        compound_loss = int(lost * 3.3)
-        message = (
-            f"A {months}-month break costs you ${lost:,} in cash "
-            f"+ ${compound_loss:,} in future compound interest."
-        )
 
-        return jsonify({
-            "lost": int(lost),
-            "chart_data": chart_data,
-            "message": message,
-        })
+@app.route("/api/jobs/<job_id>", methods=["GET"])
+def jobs_status(job_id):
+    """GET /api/jobs/<id> — Status, latest progress, and result once done."""
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": "Unknown or expired job."}), 404
+    return jsonify({"success": True, **job})
+
+
+@app.route("/api/jobs/<job_id>/events", methods=["GET"])
+def jobs_events(job_id):
+    """GET /api/jobs/<id>/events — Server-Sent Events: progress..., then done or error."""
+    if jobs.get(job_id) is None:
+        return jsonify({"success": False, "error": "Unknown or expired job."}), 404
+    try:
+        after = int(request.headers.get("Last-Event-ID") or request.args.get("after", 0))
+    except ValueError:
+        after = 0
+    after = max(0, after)
+
+    def stream(after=after):
+        while True:
+            batch = jobs.events(job_id, after)
+            if batch is None:
+                return
+            if not batch:
+                job = jobs.get(job_id)
+                if job is None or job["status"] in (jobs.DONE, jobs.FAILED):
+                    return
+                yield ": keep-alive\n\n"
+                continue
+            for event in batch:
+                after = event["id"]
+                yield f"id: {after}\nevent: {event['event']}\ndata: {app.json.dumps(event['data'])}\n\n"
+                if event["event"] in ("done", "error"):
+                    return
+
+    return Response(stream(), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@app.route("/api/simulate", methods=["GET"])
+def simulate_cached():
+    """GET /api/simulate?months=&monthly_spend=&savings= — Deterministic, cacheable (no Nessie)."""
+    try:
+        months, monthly_spend, savings = _parse_simulate_params(request.args)
+        params = {
+            "months": months,
+            # whole dollars keep the canonical URL (and cache key) stable
+            "monthly_spend": int(round(monthly_spend)),
+            "savings": int(round(savings)),
+        }
+        compact = wants_compact(request.args)
+        if compact:
+            params["format"] = "compact"
+
+        canonical = redirect_to_canonical(params)
+        if canonical is not None:
+            return canonical
+
+        def build():
+            result = run_deterministic_simulation(
+                months, params["monthly_spend"], params["savings"]
+            )
+            payload = _simulate_payload(
+                result, months, params["monthly_spend"], params["savings"]
+            )
+            return (compact_encode(payload) if compact else payload), 200
+
+        etag = make_etag("simulate", params, _SIM_VERSION)
+        return conditional_json(etag, build, _SIMULATE_MAX_AGE)
 
     except Exception:
         return jsonify({
@@ -337,6 +938,256 @@ def simulate():
         })
 
 
+@app.route("/api/simulate/surface", methods=["GET"])
+def simulate_surface():
+    """GET /api/simulate/surface — Whole career-break cost grid in one vectorized call."""
+    try:
+        if compute_surface is None:
+            return jsonify({"success": False, "error": "Surface engine unavailable."}), 503
+
+        params = _parse_surface_params(request.args)
+        canonical = redirect_to_canonical(params)
+        if canonical is not None:
+            return canonical
+
+        # Sized before any axis list exists
+        spend_axis = (params["spend_min"], params["spend_max"], params["spend_step"])
+        savings_axis = (params["savings_min"], params["savings_max"], params["savings_step"])
+        if axis_length(*spend_axis) * axis_length(*savings_axis) * 24 > _SURFACE_MAX_CELLS:
+            return jsonify({
+                "success": False,
+                "error": "Grid too large — widen the step sizes.",
+            }), 400
+        spends = grid_axis(*spend_axis)
+        savings = grid_axis(*savings_axis)
+
+        def build():
+            return {"success": True, **compute_surface(spends, savings)}, 200
+
+        etag = make_etag("simulate-surface", params, _SIM_VERSION)
+        return conditional_json(etag, build, _SIMULATE_MAX_AGE)
+
+    except Exception:
+        return jsonify({
+            "success": False,
+            "error": "Unable to compute the cost surface right now.",
+        }), 500
+
+
+@app.route("/api/career-path", methods=["POST"])
+def career_path():
+    """POST /api/career-path — Event-based career timeline with incremental recompute."""
+    try:
+        data = request.get_json(silent=True) or {}
+
+        try:
+            events = parse_events(data.get("events", []))
+        except (TypeError, ValueError) as e:
+            return jsonify({"success": False, "error": f"Invalid events: {e}"}), 400
+
+        try:
+            params = parse_params(data)
+        except ValueError as e:
+            return jsonify({"success": False, "error": f"Invalid parameters: {e}"}), 400
+        # Clients pass a stable path_id so edits reuse that path's checkpoints
+        path_id = data.get("path_id") or request.remote_addr or "anonymous"
+
+        path = get_career_path(path_id, params)
+        with path.lock:
+            path.set_events(events)
+            result = path.result()
+
+        return jsonify({"success": True, **result})
+
+    except Exception:
+        return jsonify({
+            "success": False,
+            "error": "Unable to compute this career path right now.",
+        }), 500
+
+
+def _offer_summary(raw) -> str:
+    """One-line NPV comparison of the offers a chat user shared, or "" if there are none / they are invalid."""
+    if compare_offers is None or not raw:
+        return ""
+    try:
+        offers = parse_offers(raw)
+        horizons, rates, discount_rate = parse_grid({})
+        return compare_offers(offers, horizons, rates, discount_rate)["message"]
+    except (TypeError, ValueError):
+        return ""
+
+
+@app.route("/api/offers/compare", methods=["POST"])
+def offers_compare():
+    """POST /api/offers/compare — Rank offer packages by NPV; breakeven years between them."""
+    if compare_offers is None:
+        return jsonify({"success": False, "error": "Offer comparison is unavailable on this server."}), 503
+    try:
+        data = request.get_json(silent=True) or {}
+
+        try:
+            offers = parse_offers(data.get("offers"))
+            horizons, rates, discount_rate = parse_grid(data)
+        except ValueError as e:
+            return jsonify({"success": False, "error": f"Invalid offers: {e}"}), 400
+
+        return jsonify({"success": True, **compare_offers(offers, horizons, rates, discount_rate)})
+
+    except Exception:
+        return jsonify({
+            "success": False,
+            "error": "Unable to compare these offers right now.",
+        }), 500
+
+
+_AUDIT_MAX_BYTES = int(os.getenv("AUDIT_MAX_BYTES", str(64 * 1024 * 1024)))
+
+
+@app.route("/api/audit", methods=["POST"])
+def audit():
+    """
+    POST /api/audit — Pay-equity audit of an uploaded payroll CSV (multipart "file",
+    or the raw text/csv body): raw gap, adjusted gap controlling for level,
+    location and title, and per-segment breakdowns.
+    """
+    if fit_audit is None:
+        return jsonify({"success": False, "error": "Payroll audits are unavailable on this server."}), 503
+    too_large = jsonify({
+        "success": False, "error": f"Uploads are limited to {_AUDIT_MAX_BYTES // (1024 * 1024)} MB.",
+    }), 413
+    if request.content_length and request.content_length > _AUDIT_MAX_BYTES:
+        return too_large
+
+    retry_after = _audit_limiter.check(_client_key())
+    if retry_after:
+        resp = jsonify({"success": False, "error": "Too many audits from this client, retry later."})
+        resp.headers["Retry-After"] = str(max(1, int(retry_after + 0.999)))
+        return resp, 429
+
+    # Werkzeug enforces this while reading, so chunked bodies without a length stop here too
+    request.max_content_length = _AUDIT_MAX_BYTES
+    try:
+        # A multipart upload is spooled (memory, then a temp file) while the form is
+        # parsed; a raw text/csv body is read straight off the request stream
+        upload = request.files.get("file")
+        stream = upload.stream if upload is not None else request.stream
+
+        def run():
+            payroll = read_payroll(stream)
+            started = time.perf_counter()
+            result = fit_audit(payroll)
+            result["fit_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            return result
+
+        try:
+            result = get_bulkhead("audit").call(run)
+        except AuditError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
+        except (BulkheadFull, DeadlineExceeded, FuturesTimeout):
+            resp = jsonify({"success": False, "error": "Too many audits in progress, retry shortly."})
+            resp.headers["Retry-After"] = "5"
+            return resp, 503
+
+        return jsonify({"success": True, **result})
+
+    except RequestEntityTooLarge:
+        return too_large
+
+    except Exception:
+        return jsonify({
+            "success": False,
+            "error": "Unable to audit this payroll right now.",
+        }), 500
+
+
+@app.route("/api/salaries/submit", methods=["POST"])
+def salaries_submit():
+    """POST /api/salaries/submit — Opt-in crowd salary; live in benchmarks now, in SALARIES next flush."""
+    try:
+        data = request.get_json(silent=True) or {}
+
+        if data.get("consent") is not True:
+            return jsonify({"success": False, "error": "Submissions require consent: true."}), 400
+        if _BENCHMARK_SOURCE == "mock" or salary_submissions is None:
+            return jsonify({"success": False, "error": "Salary database unavailable."}), 503
+
+        retry_after = _submit_limiter.check(_client_key())
+        if retry_after:
+            resp = jsonify({"success": False, "error": "Too many submissions from this client, retry later."})
+            resp.headers["Retry-After"] = str(max(1, int(retry_after + 0.999)))
+            return resp, 429
+
+        try:
+            row = salary_submissions.normalize_submission(data)
+        except (TypeError, ValueError) as e:
+            return jsonify({"success": False, "error": str(e)}), 400
+
+        if not salary_submissions.submit(row):
+            resp = jsonify({"success": False, "error": "Too many pending submissions, retry shortly."})
+            resp.headers["Retry-After"] = "5"
+            return resp, 429
+
+        return jsonify({"success": True, "pending": salary_submissions.pending_count()}), 202
+
+    except Exception:
+        return jsonify({"success": False, "error": "Unable to record this salary right now."}), 500
+
+
+@app.route("/api/salaries/stats", methods=["GET"])
+def salaries_stats():
+    """
+    GET /api/salaries/stats?role= — Running crowd-submission aggregates per
+    role/gender/segment; segments under EXPORT_MIN_GROUP_SIZE are withheld.
+    """
+    if salary_submissions is None:
+        return jsonify({"success": False, "error": "Salary submissions unavailable."}), 503
+    role = request.args.get("role") or None
+    return jsonify({
+        "success": True,
+        "pending": salary_submissions.pending_count(),
+        "min_group_size": _MIN_GROUP_SIZE,
+        "aggregates": salary_submissions.stats(role, _MIN_GROUP_SIZE),
+    })
+
+
+@app.route("/api/export/aggregates", methods=["GET"])
+def export_aggregates():
+    """
+    GET /api/export/aggregates?format=ndjson|csv&role=&level=&location=&gender=&company_type=&min_count=
+    — Stream salary aggregates per role / level / location / gender (gzip or br when accepted).
+    """
+    if export_chunks is None:
+        return jsonify({"success": False, "error": "Export engine unavailable."}), 503
+    try:
+        fmt, filters, min_count = parse_export_params(request.args)
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    if _BENCHMARK_SOURCE == "mock":
+        return jsonify({"success": False, "error": "No salary backend is configured for exports."}), 503
+    if "role" in filters:
+        _note(role_key=normalize_title(filters["role"]))
+
+    try:
+        batches = _get_salary_backend().aggregate_batches(filters, min_count, _EXPORT_BATCH_SIZE)
+        # Run the query before the response starts: a failing backend is a 503, not a truncated file
+        first = next(batches, [])
+    except Exception:
+        _note(fallback="unavailable")
+        return jsonify({"success": False, "error": "Export is unavailable right now. Try again shortly."}), 503
+
+    body, coding = encode_stream(
+        export_chunks(itertools.chain([first], batches), fmt), request.accept_encodings,
+    )
+    response = Response(body, content_type=_EXPORT_TYPES[fmt])
+    response.vary.add("Accept-Encoding")
+    if coding:
+        response.headers["Content-Encoding"] = coding
+    response.headers["Content-Disposition"] = f'attachment; filename="salary-aggregates.{fmt}"'
+    response.headers["X-Data-Version"] = _DATA_VERSION
+    return response
+
+
 @app.route("/api/chat", methods=["POST"])
 def chat():
     """POST /api/chat — AI negotiation coach powered by Gemini + MongoDB RAG."""
@@ -349,6 +1200,20 @@ def chat():
             context = {}
 
         context["message"] = message
+        category = classify_message(message) if message else "general"
+        if message:
+            _note(category=category)
+        if context.get("role"):
+            _note(role_key=normalize_title(context["role"]))
+
+        # Over its rate limit: tip-only reply, no Gemini call
+        retry_after = _chat_limiter.check(_client_key())
+        if retry_after:
+            _note(fallback="rate_limited")
+            reply = compose_reply(context, category, [get_tip(context)]) if message else get_tip(context)
+            resp = jsonify({"reply": reply, "rate_limited": True})
+            resp.headers["Retry-After"] = str(max(1, int(retry_after + 0.999)))
+            return resp, 429
 
         # Step 1: Retrieve relevant tip from MongoDB (RAG retrieval)
         tip = get_tip(context)
@@ -376,6 +1241,9 @@ def chat():
                     ctx_lines.append(f"Pay gap: ${gap} below market")
                 if location:
                     ctx_lines.append(f"Location: {location}")
+                comparison = _offer_summary(context.get("offers"))
+                if comparison:
+                    ctx_lines.append(f"Offer comparison: {comparison}")
 
                 user_context = "\n".join(ctx_lines) if ctx_lines else "No profile data provided"
 
@@ -397,15 +1265,30 @@ def chat():
                     f"and market data, reference exact numbers. Don't repeat advice "
                     f"from the conversation history."
                 )
-                ai_response = _gemini_model.generate_content(prompt)
-                reply = ai_response.text.strip()
+                def ask_gemini():
+                    # Bounded Gemini pool: when full or slow, fall through to the tip-only reply
+                    ai_response = get_bulkhead("gemini").call(
+                        lambda: _gemini_model.generate_content(
+                            prompt, request_options={"timeout": timeout_for(_CHAT_TIMEOUT)},
+                        ),
+                        timeout=_CHAT_TIMEOUT,
+                    )
+                    return ai_response.text.strip()
+
+                # Keyed without the (randomly chosen) tip so repeats actually hit
+                reply = _chat_cache.get_or_set(
+                    [user_context, history_text, " ".join(message.lower().split())],
+                    ask_gemini,
+                    should_cache=bool,
+                )
                 return jsonify({"reply": reply})
             except Exception:
                 pass  # Fall through to tip-only response
 
-        # Step 3: Fallback — return tip directly if Gemini unavailable
+        # Step 3: Fallback — personalized local reply if Gemini unavailable
+        _note(fallback="template")
         if message:
-            reply = f"I checked our research database. {tip}"
+            reply = compose_reply(context, category, [tip])
         else:
             reply = tip
 
@@ -421,11 +1304,251 @@ def chat():
         })
 
 
+@app.route("/api/session/overview", methods=["POST"])
+def session_overview():
+    """
+    POST /api/session/overview — Gap, lifetime impact, career-break simulation and
+    an opening tip for one profile in one round trip. "partial" maps each part
+    that used a fallback to the reason. The simulation is the deterministic one
+    (no Nessie wait) unless "live_simulation": true; clients refine it with /api/simulate.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+
+        role, years = _parse_lifetime_params(data)
+        if not role:
+            return jsonify({"success": False, "error": "Please provide a job role to analyze."}), 400
+
+        try:
+            current_salary = max(0, float(data.get("current_salary", 0)))
+        except (TypeError, ValueError):
+            current_salary = 0
+        months, monthly_spend, savings = _parse_simulate_params(data)
+        message = str(data.get("message", "")).strip()
+        context = {
+            "role": role,
+            "salary": current_salary,
+            "location": str(data.get("location", "")),
+            "message": message,
+        }
+        _note(role_key=normalize_title(role))
+
+        # Every backend lookup starts now and runs concurrently under this request's deadline
+        live = data.get("live_simulation") is True
+        futures = {
+            "benchmarks": _start("overview", _benchmarks, role),
+            "intervals": _start("overview", _gap_intervals, role),
+            "tip": _start("overview", get_tip, dict(context)),
+            "simulation": _start("nessie", run_simulation, months, monthly_spend, savings) if live else None,
+        }
+        partial = {}
+
+        benchmarks, reason = _settle(futures["benchmarks"])
+        benchmark, gb = benchmarks or (None, None)
+        if reason or not benchmark.get("success"):
+            partial["gap"] = reason or "market_default"
+        elif _BENCHMARK_SOURCE == "mock":
+            partial["gap"] = "mock"
+
+        ci, _reason = _settle(futures["intervals"])
+        gb, ci = gb or {}, ci or {}
+        gap = _gap_payload(role, current_salary, benchmark or {}, gb, ci)
+
+        lifetime = None
+        if gb.get("success"):
+            lifetime, _status = _lifetime_payload(role, years, gb, ci)
+            if _BENCHMARK_SOURCE == "mock":
+                partial["lifetime"] = "mock"
+        else:
+            partial["lifetime"] = reason or "no_gender_data"
+
+        if live:
+            result, reason = _settle(futures["simulation"], _NESSIE_TIMEOUT)
+        if not live or reason:
+            # Not requested, or Nessie saturated or slow: same math without the live bank calls
+            partial["simulation"] = "deterministic"
+            result = run_deterministic_simulation(months, monthly_spend, savings)
+        simulation = _simulate_payload(result, months, monthly_spend, savings)
+
+        tip, reason = _settle(futures["tip"])
+        if reason:
+            partial["tip"] = "builtin"
+        category = classify_message(message) if message else "salary"
+        opening = compose_reply(
+            {**context, "market_average": gap["market_average"], "gap_amount": gap["gap_amount"]},
+            category,
+            [tip] if tip else [],
+        )
+
+        _schedule_prefetch(role, gb, ci, gap["verdict"], (years, lifetime) if lifetime else None)
+
+        if partial:
+            _note(fallback="partial:" + ",".join(sorted(partial)))
+        return jsonify({
+            "success": True,
+            "role": role,
+            "gap": gap,
+            "lifetime": lifetime,
+            "simulation": simulation,
+            "tip": {"category": category, "tip": tip, "opening": opening},
+            "partial": partial,
+        })
+
+    except Exception:
+        return jsonify({
+            "success": False,
+            "error": "Unable to build your overview right now.",
+            "partial": {"gap": "error", "lifetime": "error", "simulation": "error", "tip": "error"},
+        })
+
+
+# ============================================
+# ADMIN (Authorization: Bearer $ADMIN_TOKEN; disabled when unset)
+# ============================================
+
+def _admin_denied():
+    """Error response unless the request carries the admin token, else None."""
+    token = os.getenv("ADMIN_TOKEN", "")
+    if not token:
+        return jsonify({"success": False, "error": "Admin endpoints are disabled."}), 404
+    supplied = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+    if not hmac.compare_digest(supplied.encode(), token.encode()):
+        return jsonify({"success": False, "error": "Unauthorized."}), 401
+    return None
+
+
+@app.route("/api/admin/profile", methods=["GET", "POST"])
+def admin_profile():
+    """
+    GET  /api/admin/profile — profiler status and recent collapsed-stack files
+    POST /api/admin/profile {"action": "start", "seconds": 30} | {"action": "stop"}
+    """
+    denied = _admin_denied()
+    if denied:
+        return denied
+
+    if request.method == "GET":
+        return jsonify({"success": True, **profiling.status(), "files": profiling.list_profiles()})
+
+    data = request.get_json(silent=True) or {}
+    action = data.get("action")
+    if action == "start":
+        try:
+            seconds = float(data.get("seconds", 30))
+        except (TypeError, ValueError):
+            seconds = 30
+        result = profiling.start_process_profile(seconds)
+        return jsonify({"success": result["started"], **result}), 200 if result["started"] else 409
+    if action == "stop":
+        result = profiling.stop_process_profile()
+        return jsonify({"success": result["stopped"], **result}), 200 if result["stopped"] else 409
+    return jsonify({"success": False, "error": "action must be start or stop"}), 400
+
+
+@app.route("/api/admin/profile/<name>", methods=["GET"])
+def admin_profile_file(name):
+    """GET /api/admin/profile/<name> — Download one collapsed-stack file."""
+    denied = _admin_denied()
+    if denied:
+        return denied
+    path = profiling.profile_path(name)
+    if path is None:
+        return jsonify({"success": False, "error": "No such profile."}), 404
+    return send_file(path, mimetype="text/plain", as_attachment=True, download_name=name)
+
+
+@app.route("/api/admin/analytics", methods=["GET"])
+def admin_analytics():
+    """GET /api/admin/analytics?hours=24&limit=10 — Top roles/categories, latency and fallback rates."""
+    denied = _admin_denied()
+    if denied:
+        return denied
+    try:
+        hours = max(0.1, float(request.args.get("hours", 24)))
+        limit = max(1, min(100, int(request.args.get("limit", 10))))
+    except ValueError:
+        return jsonify({"success": False, "error": "hours and limit must be numbers"}), 400
+    return jsonify({"success": True, **analytics.summary(hours, limit)})
+
+
+@app.route("/api/admin/cache", methods=["GET"])
+def admin_cache():
+    """GET /api/admin/cache — Per-cache, per-tier hit/miss counters, plus prefetch job counters."""
+    denied = _admin_denied()
+    if denied:
+        return denied
+    return jsonify({"success": True, **cache.stats(), "prefetch_jobs": prefetch.stats()})
+
+
+@app.route("/api/admin/queries", methods=["GET"])
+def admin_queries():
+    """
+    GET /api/admin/queries?limit=20&by=total_ms&recent=0&scan=0 — Top query
+    fingerprints (by total_ms, calls, avg_ms, max_ms or rows), optionally the
+    newest calls, and with scan=1 bytes scanned for each one's last Snowflake query id.
+    """
+    denied = _admin_denied()
+    if denied:
+        return denied
+    by = request.args.get("by", "total_ms")
+    if by not in query_ledger.SORT_KEYS:
+        return jsonify({"success": False, "error": f"by must be one of: {', '.join(query_ledger.SORT_KEYS)}"}), 400
+    try:
+        limit = max(1, min(200, int(request.args.get("limit", 20))))
+        recent = max(0, min(1000, int(request.args.get("recent", 0))))
+    except ValueError:
+        return jsonify({"success": False, "error": "limit and recent must be numbers"}), 400
+
+    report = query_ledger.top(limit, by)
+    if request.args.get("scan") == "1" and report.get("queries"):
+        try:
+            scanned = _get_salary_backend().scan_stats(
+                [q["last_query_id"] for q in report["queries"] if q["last_query_id"]]
+            )
+        except Exception:
+            scanned = {}
+        for query in report["queries"]:
+            query["bytes_scanned"] = scanned.get(query["last_query_id"])
+    if recent:
+        report["recent"] = query_ledger.recent(recent)
+    return jsonify({"success": True, **report})
+
+
 @app.route("/health", methods=["GET"])
 def health():
     """Health check endpoint."""
     return jsonify({"status": "running", "project": "The Equity Gap"})
 
 
+# ============================================
+# STARTUP PREWARM (hottest roles from recent usage)
+# ============================================
+
+def _prewarm(limit: int) -> None:
+    """
+    Warm the most requested roles. Gap intervals stay in this process until the
+    role's data changes, so they are always worth it; the benchmark caches only
+    outlive their short L1 TTL in the shared L2, so without REDIS_URL they are skipped.
+    """
+    shared = bool(os.getenv("REDIS_URL"))
+    for role in analytics.top_roles(limit):
+        try:
+            if shared:
+                get_market_benchmark(role)
+                get_gender_benchmark(role)
+            _gap_intervals(role)
+        except Exception:
+            pass
+
+
+_PREWARM_ROLES = int(os.getenv("PREWARM_ROLES", "20"))
+if _PREWARM_ROLES > 0 and _BENCHMARK_SOURCE != "mock":
+    threading.Thread(target=_prewarm, args=(_PREWARM_ROLES,), name="cache-prewarm", daemon=True).start()
+
+
+# Built SPA (opt-in). Werkzeug ranks the static /api/* rules above its catch-all.
+init_frontend(app)
+
+
 if __name__ == "__main__":
     app.run(debug=True, host="0.0.0.0", port=8000)
@@ -0,0 +1,298 @@
+# audit.py
+"""
+InnovateHer 2026 - The Equity Gap: Employer Pay-Equity Audit
+Employers upload their own payroll (CSV) and get the *controlled* gender gap:
+OLS of log salary on gender plus level, location and title fixed effects.
+
+The CSV is read row by row from the upload stream straight into typed arrays
+(category columns become integer codes), so memory is a few bytes per employee
+rather than a Python row per employee. X'X and X'y are then assembled from
+bincount cross-tabulations of those codes instead of a dense dummy matrix, so a
+10^5-row payroll fits in well under a second.
+Exposes: read_payroll(stream), fit_audit(payroll), AuditError
+"""
+
+import csv
+import io
+import math
+import os
+from array import array
+
+import numpy as np
+
+MAX_ROWS = int(os.getenv("AUDIT_MAX_ROWS", "500000"))
+MAX_COLUMNS = int(os.getenv("AUDIT_MAX_COLUMNS", "1000"))  # fixed-effect dummies in the model
+MIN_SEGMENT_GROUP = 5  # per gender; smaller segments are reported without a gap
+
+# Accepted header spellings (case-insensitive) for each field
+_HEADERS = {
+    "salary": ("salary", "annual_salary", "base_salary", "base", "pay"),
+    "gender": ("gender", "sex"),
+    "level": ("level", "experience_level", "grade", "band"),
+    "location": ("location", "city", "office", "site"),
+    "title": ("title", "job_title", "role", "position"),
+}
+_FEMALE = {"female", "f", "woman", "w"}
+_MALE = {"male", "m", "man"}
+CONTROLS = ("level", "location", "title")
+
+
+class AuditError(ValueError):
+    """The upload cannot be audited; the message is safe to show the employer."""
+
+
+# ============================================
+# STREAMING CSV INGEST
+# ============================================
+
+class _Factor:
+    """Incremental factorization of one category column: label -> integer code."""
+
+    def __init__(self):
+        self.codes = array("i")
+        self.index: dict[str, int] = {}
+        self.labels: list[str] = []
+
+    def add(self, value: str) -> None:
+        label = " ".join(value.split())
+        key = label.upper()
+        code = self.index.get(key)
+        if code is None:
+            code = self.index[key] = len(self.labels)
+            self.labels.append(label or "(blank)")
+        self.codes.append(code)
+
+
+def _columns(header: list[str]) -> dict[str, int]:
+    names = [h.strip().lower().replace(" ", "_") for h in header]
+    found = {}
+    for field, aliases in _HEADERS.items():
+        for alias in aliases:
+            if alias in names:
+                found[field] = names.index(alias)
+                break
+    missing = [f for f in ("salary", "gender") if f not in found]
+    if missing:
+        raise AuditError(f"CSV header must include {' and '.join(missing)} columns")
+    return found
+
+
+def read_payroll(stream) -> dict:
+    """
+    Parse a payroll CSV from a binary stream. Rows without a usable salary, or
+    with a gender other than male/female, are counted and skipped.
+    Raises AuditError for a missing header, too many rows, or no usable rows.
+    """
+    reader = csv.reader(io.TextIOWrapper(stream, encoding="utf-8-sig", errors="replace", newline=""))
+    try:
+        cols = _columns(next(reader))
+    except StopIteration:
+        raise AuditError("The upload is empty.")
+    except csv.Error as e:
+        raise AuditError(f"Unreadable CSV: {e}")
+
+    salary = array("d")
+    female = array("b")
+    factors = {name: _Factor() for name in CONTROLS if name in cols}
+    skipped = {"invalid_salary": 0, "other_gender": 0}
+    width = max(cols.values()) + 1
+    rows = 0
+    try:
+        for row in reader:
+            if not row:
+                continue
+            rows += 1
+            if rows > MAX_ROWS:
+                raise AuditError(f"At most {MAX_ROWS:,} employees per audit.")
+            if len(row) < width:
+                row = row + [""] * (width - len(row))
+            try:
+                pay = float(row[cols["salary"]].replace(",", "").replace("$", "").strip())
+            except ValueError:
+                pay = 0.0
+            if not pay > 0 or math.isinf(pay):
+                skipped["invalid_salary"] += 1
+                continue
+            gender = row[cols["gender"]].strip().lower()
+            if gender not in _FEMALE and gender not in _MALE:
+                skipped["other_gender"] += 1
+                continue
+            salary.append(pay)
+            female.append(gender in _FEMALE)
+            for name, factor in factors.items():
+                factor.add(row[cols[name]])
+    except csv.Error as e:
+        raise AuditError(f"Unreadable CSV at row {rows + 1}: {e}")
+
+    if not salary:
+        raise AuditError("No rows with a positive salary and a male/female gender.")
+    return {
+        "rows": rows,
+        "skipped": skipped,
+        "salary": np.frombuffer(salary, dtype=np.float64),
+        "female": np.frombuffer(female, dtype=np.int8).astype(np.int64),
+        "factors": {
+            name: (np.frombuffer(f.codes, dtype=np.int32).astype(np.int64), f.labels)
+            for name, f in factors.items()
+        },
+    }
+
+
+# ============================================
+# OLS FROM CODES
+# ============================================
+
+def _design(payroll: dict) -> list[tuple]:
+    """
+    The model as factors: (name, codes, n_levels, first kept level). The
+    intercept is a one-level factor; gender and every control drop level 0.
+    """
+    n = len(payroll["salary"])
+    design = [("intercept", np.zeros(n, dtype=np.int64), 1, 0), ("female", payroll["female"], 2, 1)]
+    for name, (codes, labels) in payroll["factors"].items():
+        if len(labels) > 1:
+            design.append((name, codes, len(labels), 1))
+    return design
+
+
+def _cross(design: list[tuple], weights=None) -> np.ndarray:
+    """X' W X assembled block by block from (weighted) cross-tabulations of the codes."""
+    blocks = []
+    for i, (_n1, a, na, ka) in enumerate(design):
+        row = []
+        for j, (_n2, b, nb, kb) in enumerate(design):
+            if i == j:
+                block = np.diag(np.bincount(a, weights=weights, minlength=na).astype(np.float64))
+            else:
+                block = np.bincount(a * nb + b, weights=weights, minlength=na * nb).reshape(na, nb)
+            row.append(block[ka:, kb:])
+        blocks.append(row)
+    return np.block(blocks)
+
+
+def _expand(design: list[tuple], beta: np.ndarray) -> list[np.ndarray]:
+    """Per-factor coefficient lookup tables (0 for each dropped base level)."""
+    tables, start = [], 0
+    for _name, _codes, n, keep in design:
+        table = np.zeros(n)
+        table[keep:] = beta[start:start + n - keep]
+        tables.append(table)
+        start += n - keep
+    return tables
+
+
+def _gap_percent(coef: float) -> float:
+    """Log-point coefficient on female -> % women are paid less (positive = women paid less)."""
+    return round((1 - math.exp(coef)) * 100, 2)
+
+
+def _segments(payroll: dict, adjusted: np.ndarray) -> dict:
+    """
+    Per level / location / title: women's minus men's mean control-adjusted log
+    salary within the segment, with a two-sample standard error.
+    """
+    female = payroll["female"].astype(bool)
+    out = {}
+    for name, (codes, labels) in payroll["factors"].items():
+        n = len(labels)
+        stats = []
+        for mask in (~female, female):
+            count = np.bincount(codes[mask], minlength=n)
+            total = np.bincount(codes[mask], weights=adjusted[mask], minlength=n)
+            squares = np.bincount(codes[mask], weights=adjusted[mask] ** 2, minlength=n)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mean = total / count
+                var = (squares - count * mean ** 2) / (count - 1)
+            stats.append((count, mean, var))
+        (m_count, m_mean, m_var), (f_count, f_mean, f_var) = stats
+
+        rows = []
+        for k in np.argsort(-(m_count + f_count), kind="stable"):
+            row = {"segment": labels[k], "male_count": int(m_count[k]), "female_count": int(f_count[k])}
+            if m_count[k] >= MIN_SEGMENT_GROUP and f_count[k] >= MIN_SEGMENT_GROUP:
+                diff = f_mean[k] - m_mean[k]
+                se = math.sqrt(max(0.0, m_var[k] / m_count[k] + f_var[k] / f_count[k]))
+                row.update({
+                    "gap_percent": _gap_percent(diff),
+                    "gap_percent_ci": {
+                        "low": _gap_percent(diff + 1.96 * se), "high": _gap_percent(diff - 1.96 * se),
+                    },
+                    "log_gap": round(diff, 5),
+                    "se": round(se, 5),
+                })
+            else:
+                row["gap_percent"] = None
+            rows.append(row)
+        out[name] = rows
+    return out
+
+
+def fit_audit(payroll: dict) -> dict:
+    """Raw gap, adjusted (fixed-effects) gap with classical and HC1 robust SEs, and segment breakdowns."""
+    pay = payroll["salary"]
+    female = payroll["female"]
+    n = len(pay)
+    n_female = int(female.sum())
+    if n_female < 2 or n - n_female < 2:
+        raise AuditError("The payroll needs at least two men and two women.")
+
+    design = _design(payroll)
+    k = sum(n_levels - keep for _name, _codes, n_levels, keep in design)
+    if k > MAX_COLUMNS:
+        raise AuditError(
+            f"Too many distinct levels, locations and titles ({k - 2}); at most {MAX_COLUMNS - 2} are supported."
+        )
+
+    y = np.log(pay)
+    xtx = _cross(design)
+    xty = np.concatenate([
+        np.bincount(codes, weights=y, minlength=n_levels)[keep:] for _name, codes, n_levels, keep in design
+    ])
+    xtx_inv = np.linalg.pinv(xtx)  # pinv: nested controls (e.g. a title at one level) are collinear
+    beta = xtx_inv @ xty
+    rank = int(np.linalg.matrix_rank(xtx))
+    dof = n - rank
+    if dof <= 0:
+        raise AuditError("Not enough employees for this many levels, locations and titles.")
+
+    tables = _expand(design, beta)
+    fitted = sum(table[codes] for table, (_name, codes, _n, _keep) in zip(tables, design))
+    resid = y - fitted
+    rss = float(resid @ resid)
+    tss = float(((y - y.mean()) ** 2).sum())
+
+    # Gender is column 1 (after the intercept)
+    coef = float(beta[1])
+    se = math.sqrt(max(0.0, rss / dof * xtx_inv[1, 1]))
+    meat = _cross(design, weights=resid ** 2)
+    robust = xtx_inv @ meat @ xtx_inv * (n / dof)
+    robust_se = math.sqrt(max(0.0, robust[1, 1]))
+    t_stat = coef / robust_se if robust_se else 0.0
+
+    male_avg = float(pay[female == 0].mean())
+    female_avg = float(pay[female == 1].mean())
+    return {
+        "employees": n,
+        "rows": payroll["rows"],
+        "skipped": payroll["skipped"],
+        "male_count": n - n_female,
+        "female_count": n_female,
+        "male_avg": int(round(male_avg)),
+        "female_avg": int(round(female_avg)),
+        "raw_gap_percent": round((male_avg - female_avg) / male_avg * 100, 2),
+        "adjusted_gap": {
+            "gap_percent": _gap_percent(coef),
+            "gap_percent_ci": {
+                "low": _gap_percent(coef + 1.96 * robust_se), "high": _gap_percent(coef - 1.96 * robust_se),
+            },
+            "log_coefficient": round(coef, 6),
+            "se": round(se, 6),
+            "robust_se": round(robust_se, 6),
+            "t_stat": round(t_stat, 3),
+            "p_value": round(math.erfc(abs(t_stat) / math.sqrt(2)), 6),
+            "r_squared": round(1 - rss / tss, 4) if tss else None,
+            "controls": [name for name, *_rest in design[2:]],
+            "parameters": rank,
+        },
+        "segments": _segments(payroll, resid + coef * female),
+    }
@@ -13,6 +13,14 @@ import requests
 import time
 from datetime import datetime
 
+# Inside app.py every call is capped by the request's remaining budget;
+# run standalone, the fixed 15s timeouts apply.
+try:
+    from deadline import timeout_for
+except ImportError:
+    def timeout_for(default):
+        return default
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend integration
 
@@ -57,7 +65,7 @@ def create_victim_account():
             f"{NESSIE_BASE_URL}/customers?key={API_KEY}",
             json=customer_payload,
             verify=False,  # Hackathon exception
-            timeout = 15
+            timeout = timeout_for(15)
         )
         
         if customer_response.status_code != 201:
@@ -83,7 +91,7 @@ def create_victim_account():
             f"{NESSIE_BASE_URL}/customers/{customer_id}/accounts?key={API_KEY}",
             json=account_payload,
             verify=False,
-            timeout = 15
+            timeout = timeout_for(15)
         )
         
         if account_response.status_code != 201:
@@ -104,18 +112,24 @@ def create_victim_account():
         return None
 
 
-def simulate_drain(account_id, months):
+def simulate_drain(account_id, months, on_progress=None):
     """
     Simulates monthly withdrawals during a career break.
     
     Args:
         account_id (str): The Nessie account ID to drain
         months (int): Number of months in the career break
+        on_progress (callable, optional): Called with each month's snapshot as it lands
         
     Returns:
         list: Array of balance snapshots after each month
     """
     balance_timeline = []
+
+    def record(entry):
+        balance_timeline.append(entry)
+        if on_progress:
+            on_progress(entry)
     
     try:
         for month in range(1, months + 1):
@@ -132,7 +146,7 @@ def simulate_drain(account_id, months):
                 f"{NESSIE_BASE_URL}/accounts/{account_id}/withdrawals?key={API_KEY}",
                 json=withdrawal_payload,
                 verify=False,
-                timeout = 15
+                timeout = timeout_for(15)
             )
             
             if withdrawal_response.status_code not in [201, 202]:
@@ -144,7 +158,7 @@ def simulate_drain(account_id, months):
                     last_balance = INITIAL_BALANCE
                     
                 new_balance = max(0, last_balance - MONTHLY_EXPENSES)
-                balance_timeline.append({
+                record({
                     'month': month,
                     'balance': new_balance,
                     'withdrawal': MONTHLY_EXPENSES,
@@ -152,21 +166,21 @@ def simulate_drain(account_id, months):
                 })
                 continue
             
-            # Small delay to avoid rate limiting
-            time.sleep(1.0)
+            # Small delay to avoid rate limiting (never past the request budget)
+            time.sleep(min(1.0, timeout_for(1.0)))
             
             # Fetch updated account balance
             account_response = requests.get(
                 f"{NESSIE_BASE_URL}/accounts/{account_id}?key={API_KEY}",
                 verify=False,
-                timeout = 15
+                timeout = timeout_for(15)
             )
             
             if account_response.status_code == 200:
                 account_data = account_response.json()
                 current_balance = account_data.get('balance', 0)
                 
-                balance_timeline.append({
+                record({
                     'month': month,
                     'balance': current_balance,
                     'withdrawal': MONTHLY_EXPENSES,
@@ -180,7 +194,7 @@ def simulate_drain(account_id, months):
                     last_balance = INITIAL_BALANCE
                     
                 new_balance = max(0, last_balance - MONTHLY_EXPENSES)
-                balance_timeline.append({
+                record({
                     'month': month,
                     'balance': new_balance,
                     'withdrawal': MONTHLY_EXPENSES,
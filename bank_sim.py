@@ -2,28 +2,40 @@
 """
 InnovateHer 2026 - Career Break Cost Simulator
 Bridge module: run_simulation(months, spend) -> {'lost': int, 'chart_data': [nums...]}
-Tries Nessie API (banking_service) first, falls back to deterministic math.
+Tries Nessie API (banking_service) first when the inputs are the scenario Nessie
+simulates (its fixed balance and monthly expenses), falls back to deterministic math.
+run_deterministic_simulation() skips Nessie entirely (cacheable, used by GET /api/simulate).
+compound_opportunity_cost() prices the growth the drained cash would have earned.
+Both simulations accept on_progress(month, balance), called as each month completes.
 """
 
 INITIAL_BALANCE = 25000
+INVESTMENT_RETURN = 0.07   # 7% average market return (matches gender_engine)
+GROWTH_HORIZON_YEARS = 20  # withdrawn cash would otherwise compound this long
 
 
-def _try_nessie(months: int, spend: float) -> dict | None:
-    """Attempt live Nessie API simulation. Returns None on failure."""
+def _try_nessie(months: int, spend: float, savings: float, on_progress=None) -> dict | None:
+    """Attempt live Nessie API simulation. Returns None on failure or for another scenario."""
     try:
         from backend.banking_service import (
             create_victim_account,
             simulate_drain,
             INITIAL_BALANCE as NES_BAL,
+            MONTHLY_EXPENSES as NES_SPEND,
         )
 
+        # Nessie drains a fixed account: its balances only answer that scenario
+        if savings != NES_BAL or spend != NES_SPEND:
+            return None
+
         account_info = create_victim_account()
         if not account_info:
             return None
 
-        timeline = simulate_drain(account_info["account_id"], months)
-        if not timeline:
-            return None
+        report = (lambda entry: on_progress(entry["month"], int(entry["balance"]))) if on_progress else None
+        timeline = simulate_drain(account_info["account_id"], months, on_progress=report)
+        if len(timeline) < months:
+            return None  # cut short (deadline or API failure): use the deterministic path
 
         chart_data = [NES_BAL] + [entry["balance"] for entry in timeline]
         lost = NES_BAL - timeline[-1]["balance"]
@@ -33,7 +45,7 @@ def _try_nessie(months: int, spend: float) -> dict | None:
         return None
 
 
-def run_simulation(months: int, spend: float, savings: float = None) -> dict:
+def run_simulation(months: int, spend: float, savings: float = None, on_progress=None) -> dict:
     """
     Simulate the financial cost of a career break.
 
@@ -41,6 +53,7 @@ def run_simulation(months: int, spend: float, savings: float = None) -> dict:
         months: Duration of break (clamped 1-24)
         spend: Monthly spending during break
         savings: Starting savings balance (defaults to INITIAL_BALANCE)
+        on_progress: Optional callback(month, balance) per simulated month
 
     Returns:
         {'lost': int, 'chart_data': [int, ...]}
@@ -49,18 +62,66 @@ def run_simulation(months: int, spend: float, savings: float = None) -> dict:
     spend = max(0, float(spend))
     starting = float(savings) if savings is not None else INITIAL_BALANCE
 
-    # Try live Nessie API first (uses its own fixed balance)
-    live = _try_nessie(months, spend)
+    # One month counter across both paths: a fallback after a partial Nessie run
+    # continues from the next month instead of reporting months 1..k again
+    reported = 0
+
+    def report(month: int, balance: int) -> None:
+        nonlocal reported
+        if on_progress and month > reported:
+            reported = month
+            on_progress(month, balance)
+
+    # Try live Nessie API first
+    live = _try_nessie(months, spend, starting, report)
     if live:
         return live
 
     # Deterministic fallback calculation
+    return run_deterministic_simulation(months, spend, starting, report)
+
+
+def run_deterministic_simulation(months: int, spend: float, savings: float = None, on_progress=None) -> dict:
+    """
+    Pure-math career break drain (no Nessie). Same inputs always give the same
+    output, so callers may cache it.
+
+    Returns:
+        {'lost': int, 'chart_data': [int, ...]}
+    """
+    months = max(1, min(24, int(months)))
+    spend = max(0, float(spend))
+    starting = float(savings) if savings is not None else INITIAL_BALANCE
+
     balance = starting
     chart_data = [int(balance)]
 
-    for _ in range(months):
+    for month in range(1, months + 1):
         balance = max(0, balance - spend)
         chart_data.append(int(balance))
+        if on_progress:
+            on_progress(month, int(balance))
 
     lost = int(starting) - chart_data[-1]
     return {"lost": int(lost), "chart_data": chart_data}
+
+
+def compound_opportunity_cost(
+    chart_data: list,
+    annual_return: float = INVESTMENT_RETURN,
+    horizon_years: int = GROWTH_HORIZON_YEARS,
+) -> int:
+    """
+    Future growth forgone on cash drawn down during the break.
+
+    Each month's withdrawal (drop in balance) would otherwise have compounded
+    monthly at `annual_return` until `horizon_years` after the break started.
+    Returns the interest only (future value minus the cash itself).
+    """
+    monthly = (1 + annual_return) ** (1 / 12) - 1
+    horizon = horizon_years * 12
+    interest = 0.0
+    for month in range(1, len(chart_data)):
+        withdrawn = max(0, chart_data[month - 1] - chart_data[month])
+        interest += withdrawn * ((1 + monthly) ** (horizon - month) - 1)
+    return int(interest)
@@ -0,0 +1,75 @@
+# benchmarks/bench_json.py
+"""
+InnovateHer 2026 - The Equity Gap: JSON + Compression Benchmark
+Compares stdlib json vs orjson serialization time and bytes on the wire
+(raw / gzip / brotli, default vs compact encoding) for /api/lifetime-shaped
+payloads: one role, and a 500-payload sweep/batch response.
+
+Run from the repo root:  python benchmarks/bench_json.py
+"""
+
+import gzip
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gender_engine import compute_lifetime_impact  # noqa: E402
+from http_codec import brotli, compact_encode, orjson  # noqa: E402
+
+
+def _lifetime_payload(male_avg: int, female_avg: int, years: int) -> dict:
+    return {
+        "success": True, "role": "Software Engineer",
+        "male_avg": male_avg, "female_avg": female_avg,
+        "gap": male_avg - female_avg,
+        "gap_percent": round((male_avg - female_avg) / male_avg * 100, 1),
+        "male_count": 1240, "female_count": 760,
+        **compute_lifetime_impact(male_avg, female_avg, years),
+    }
+
+
+def _time(fn, obj, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(obj)
+    return (time.perf_counter() - start) / repeat * 1e6  # microseconds
+
+
+def _stdlib(obj) -> bytes:
+    # what Flask's DefaultJSONProvider does (sort_keys + compact separators)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _orjson(obj) -> bytes:
+    return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+
+def _report(name: str, obj, repeat: int) -> None:
+    raw = _stdlib(obj)
+    print(f"\n{name}")
+    print(f"  json.dumps     {_time(_stdlib, obj, repeat):10.1f} us")
+    if orjson is not None:
+        print(f"  orjson.dumps   {_time(_orjson, obj, repeat):10.1f} us")
+    else:
+        print("  orjson.dumps   (not installed)")
+    print(f"  raw            {len(raw):10,d} B")
+    print(f"  gzip-6         {len(gzip.compress(raw, 6)):10,d} B")
+    if brotli is not None:
+        print(f"  brotli-5       {len(brotli.compress(raw, quality=5)):10,d} B")
+
+
+def main() -> None:
+    single = _lifetime_payload(134000, 121000, 40)
+    sweep = [_lifetime_payload(90000 + i * 100, 81000 + i * 90, 40) for i in range(500)]
+
+    _report("lifetime (1 role, 40 years)", single, 2000)
+    _report("lifetime (1 role, 40 years, compact)", compact_encode(single), 2000)
+    _report("sweep (500 payloads)", sweep, 20)
+    _report("sweep (500 payloads, compact)", [compact_encode(p) for p in sweep], 20)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# benchmarks/bench_pruning.py
+"""
+InnovateHer 2026 - The Equity Gap: JOB_TITLE_KEY Pruning Benchmark
+Runs the gender-benchmark lookup three ways for a sample of roles: the old
+UPPER(JOB_TITLE) = UPPER(%s) aggregate over SALARIES, the same aggregate on
+the normalized JOB_TITLE_KEY (migrations/001_job_title_key.sql), and the
+backend's current read of the role's SALARY_SUMMARY rows (002).
+
+- snowflake: result cache off; per query, micro-partitions scanned / total and
+  bytes scanned from GET_QUERY_OPERATOR_STATS, plus elapsed time, then the
+  table's clustering information.
+- sqlite:    EXPLAIN QUERY PLAN (SCAN vs SEARCH) and time.
+
+Run from the repo root:  python benchmarks/bench_pruning.py [snowflake|sqlite] [roles]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from salary_backend import SQLiteBackend, SnowflakeBackend, normalize_title  # noqa: E402
+
+# The gender-benchmark aggregate over raw rows, before and after JOB_TITLE_KEY
+_AGGREGATE = (
+    "SELECT {gender}, AVG(ANNUAL_SALARY), MIN(ANNUAL_SALARY), MAX(ANNUAL_SALARY), COUNT(*) "
+    "FROM SALARIES WHERE {where} GROUP BY {gender}"
+)
+
+
+def _queries(backend) -> dict:
+    """variant name -> (sql, title -> parameter)"""
+    p, gender = ("?", "GENDER_KEY") if backend.name == "sqlite" else ("%s", "GENDER")
+    return {
+        "UPPER(JOB_TITLE)": (
+            _AGGREGATE.format(gender="GENDER", where=f"UPPER(JOB_TITLE) = UPPER({p})"), lambda title: title,
+        ),
+        "JOB_TITLE_KEY": (_AGGREGATE.format(gender=gender, where=f"JOB_TITLE_KEY = {p}"), normalize_title),
+        "SALARY_SUMMARY": (backend._SUMMARY_SQL, normalize_title),
+    }
+
+
+_OPERATOR_STATS = """
+    SELECT
+        SUM(OPERATOR_STATISTICS:pruning:partitions_scanned::INT),
+        SUM(OPERATOR_STATISTICS:pruning:partitions_total::INT),
+        SUM(OPERATOR_STATISTICS:io:bytes_scanned::INT)
+    FROM TABLE(GET_QUERY_OPERATOR_STATS(%s))
+    WHERE OPERATOR_TYPE = 'TableScan'
+"""
+
+
+def _snowflake(roles: int) -> None:
+    backend = SnowflakeBackend()
+    queries = _queries(backend)
+    conn = backend.connect()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("ALTER SESSION SET USE_CACHED_RESULT = FALSE")
+        cursor.execute("SELECT DISTINCT JOB_TITLE FROM SALARIES ORDER BY 1 LIMIT %s", (roles,))
+        titles = [row[0] for row in cursor.fetchall()]
+
+        totals = {name: [0, 0, 0, 0.0] for name in queries}
+        print(f"{'filter':18} {'role':28} {'partitions':>15} {'bytes':>14} {'ms':>9}")
+        for title in titles:
+            for name, (sql, param) in queries.items():
+                start = time.perf_counter()
+                cursor.execute(sql, (param(title),))
+                cursor.fetchall()
+                elapsed = (time.perf_counter() - start) * 1000
+                cursor.execute(_OPERATOR_STATS, (cursor.sfqid,))
+                scanned, total, scanned_bytes = (v or 0 for v in cursor.fetchone())
+                for i, v in enumerate((scanned, total, scanned_bytes, elapsed)):
+                    totals[name][i] += v
+                print(f"{name:18} {title[:28]:28} {f'{scanned}/{total}':>15} {scanned_bytes:14,d} {elapsed:9.1f}")
+
+        print("\nTotals")
+        for name, (scanned, total, scanned_bytes, elapsed) in totals.items():
+            share = scanned / total * 100 if total else 0.0
+            print(f"  {name:18} {scanned}/{total} partitions ({share:.1f}%)  {scanned_bytes:,d} B  {elapsed:.1f} ms")
+
+        cursor.execute("SELECT SYSTEM$CLUSTERING_INFORMATION('SALARIES', '(JOB_TITLE_KEY, GENDER)')")
+        print("\nClustering information:\n" + cursor.fetchone()[0])
+    finally:
+        conn.close()
+
+
+def _sqlite(roles: int, repeat: int = 200) -> None:
+    backend = SQLiteBackend()
+    conn = backend.connect()
+    titles = [row[0] for row in conn.execute(
+        "SELECT DISTINCT JOB_TITLE FROM SALARIES ORDER BY 1 LIMIT ?", (roles,),
+    )]
+    for name, (sql, param) in _queries(backend).items():
+        plan = conn.execute("EXPLAIN QUERY PLAN " + sql, (param(titles[0]),)).fetchall()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for title in titles:
+                conn.execute(sql, (param(title),)).fetchall()
+        per_query = (time.perf_counter() - start) / (repeat * len(titles)) * 1e6
+        print(f"\n{name}")
+        print(f"  plan           {' / '.join(row[-1] for row in plan)}")
+        print(f"  per query      {per_query:10.1f} us")
+
+
+def main() -> None:
+    backend = sys.argv[1] if len(sys.argv) > 1 else "sqlite"
+    roles = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    if backend == "snowflake":
+        _snowflake(roles)
+    else:
+        _sqlite(roles)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# break_surface.py
+"""
+InnovateHer 2026 - The Equity Gap: Career Break Cost Surface
+Vectorized (NumPy) version of bank_sim's deterministic drain over a whole grid of
+break length (1-24 months) x monthly spend x starting savings, so the UI can move
+sliders against one locally held surface instead of a round trip per tick.
+Exposes: compute_surface(spends, savings_levels), grid_axis(start, stop, step), axis_length(...)
+"""
+
+import numpy as np
+
+from bank_sim import GROWTH_HORIZON_YEARS, INVESTMENT_RETURN
+
+MAX_MONTHS = 24
+MAX_CELLS = 250_000  # spends x savings x months; ~6 MB of float64 per grid
+MAX_DOLLARS = 100_000_000  # largest accepted spend / savings axis value
+
+
+def compute_surface(
+    spends,
+    savings_levels,
+    annual_return: float = INVESTMENT_RETURN,
+    horizon_years: int = GROWTH_HORIZON_YEARS,
+) -> dict:
+    """
+    Evaluate every (savings, spend, months) cell in one pass.
+
+    Grids are indexed [savings_index][spend_index][months - 1]:
+    - ending_balance: savings left after the break
+    - opportunity_cost: compound growth forgone on the drained cash
+      (same model as bank_sim.compound_opportunity_cost)
+    depletion_month is [savings_index][spend_index]: first month the balance
+    hits 0, or None if it survives 24 months. A cell with break length m is
+    depleted iff depletion_month <= m.
+    """
+    spend = np.asarray(spends, dtype=np.float64)[None, :, None]
+    savings = np.asarray(savings_levels, dtype=np.float64)[:, None, None]
+    month = np.arange(1, MAX_MONTHS + 1, dtype=np.float64)[None, None, :]
+
+    # Cash actually withdrawn in month t: full spend until the balance runs dry
+    withdrawn = np.clip(savings - (month - 1) * spend, 0.0, spend)
+    lost = np.cumsum(withdrawn, axis=-1)
+    # Mirror the scalar path's whole-dollar chart values
+    ending_balance = np.floor(savings - lost)
+
+    monthly = (1 + annual_return) ** (1 / 12) - 1
+    growth = (1 + monthly) ** (horizon_years * 12 - month) - 1
+    opportunity_cost = np.cumsum(withdrawn * growth, axis=-1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        depletion = np.ceil(savings[:, :, 0] / spend[:, :, 0])
+    depletion_month = np.where(
+        (spend[:, :, 0] > 0) & (depletion <= MAX_MONTHS), np.maximum(depletion, 1), 0
+    ).astype(np.int64)
+
+    return {
+        "months": list(range(1, MAX_MONTHS + 1)),
+        "monthly_spend": [int(s) for s in np.asarray(spends)],
+        "savings": [int(s) for s in np.asarray(savings_levels)],
+        "ending_balance": ending_balance.astype(np.int64).tolist(),
+        "opportunity_cost": opportunity_cost.astype(np.int64).tolist(),
+        "depletion_month": [[int(d) or None for d in row] for row in depletion_month],
+        "annual_return": annual_return,
+        "horizon_years": horizon_years,
+    }
+
+
+def _axis_bounds(start: float, stop: float, step: float) -> tuple[int, int, int]:
+    start, stop, step = int(round(start)), int(round(stop)), max(1, int(round(step)))
+    if stop < start:
+        start, stop = stop, start
+    return start, stop, step
+
+
+def axis_length(start: float, stop: float, step: float) -> int:
+    """Number of points grid_axis() would produce, without building it."""
+    start, stop, step = _axis_bounds(start, stop, step)
+    return (stop - start) // step + 1
+
+
+def grid_axis(start: float, stop: float, step: float) -> list:
+    """
+    Inclusive arithmetic axis [start, start+step, ..., <= stop] in whole dollars.
+    Raises ValueError past MAX_CELLS points (check axis_length() first).
+    """
+    if axis_length(start, stop, step) > MAX_CELLS:
+        raise ValueError("axis too long")
+    start, stop, step = _axis_bounds(start, stop, step)
+    return list(range(start, stop + 1, step))
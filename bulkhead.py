@@ -0,0 +1,188 @@
+# bulkhead.py
+"""
+InnovateHer 2026 - The Equity Gap: Bulkheads and Admission Control
+Each slow backend (Gemini, MongoDB, Nessie) gets its own bounded thread pool,
+so a burst against one of them can only occupy its own slots. Work beyond
+concurrency + queue is rejected immediately (BulkheadFull) and the caller serves
+its fallback instead of waiting; per-client token buckets rate-limit chat.
+The pools isolate backends from each other, not the calling Flask worker: call()
+holds its worker for at most the call timeout, never past the route budget.
+Exposes: get_bulkhead(name), BulkheadFull, RateLimiter, stats()
+"""
+
+import contextvars
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeout
+
+from deadline import timeout_for
+
+# name -> (max concurrent calls, max queued calls); override with
+# BULKHEAD_<NAME>_CONCURRENCY / BULKHEAD_<NAME>_QUEUE
+_DEFAULT_LIMITS = {
+    "gemini": (4, 8),
+    "mongo": (8, 16),
+    "nessie": (4, 4),
+    # /api/audit: each fit holds a whole payroll in memory
+    "audit": (2, 2),
+    # /api/session/overview fans each request out into ~4 benchmark/tip lookups
+    "overview": (16, 32),
+}
+# Upper bound on call()'s wait when neither a timeout nor a request deadline is set
+_MAX_WAIT = float(os.getenv("BULKHEAD_MAX_WAIT_SECONDS", "30"))
+
+
+class BulkheadFull(RuntimeError):
+    """Raised when a bulkhead has no free slot; callers degrade instead of queueing."""
+
+
+# ============================================
+# BULKHEAD
+# ============================================
+
+class Bulkhead:
+    """A bounded executor plus a non-blocking admission semaphore."""
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix=f"bulkhead-{name}")
+        self._slots = threading.BoundedSemaphore(max_concurrent + max_queue)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """Schedule fn on this bulkhead; raises BulkheadFull without blocking when saturated."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise BulkheadFull(self.name)
+        with self._lock:
+            self._in_flight += 1
+        try:
+            # Run in a copy of the caller's context so its request deadline applies inside the pool
+            future = self._executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+        except Exception:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def call(self, fn, *args, timeout: float = None, **kwargs):
+        """
+        Run fn on this bulkhead and wait up to timeout seconds (less if the request
+        deadline is nearer, _MAX_WAIT if neither is set). Raises BulkheadFull when
+        not admitted, DeadlineExceeded when no budget is left, and
+        concurrent.futures.TimeoutError when too slow. A timed-out call still
+        queued is dropped; one already running keeps its slot until it finishes.
+        """
+        timeout = timeout_for(timeout)
+        future = self.submit(fn, *args, **kwargs)
+        try:
+            return future.result(_MAX_WAIT if timeout is None else timeout)
+        except FuturesTimeout:
+            future.cancel()
+            with self._lock:
+                self.timeouts += 1
+            raise
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if _future is not None and not _future.cancelled():
+                self.completed += 1
+        self._slots.release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+            }
+
+
+_bulkheads: dict[str, Bulkhead] = {}
+_bulkheads_lock = threading.Lock()
+
+
+def get_bulkhead(name: str) -> Bulkhead:
+    """Process-wide bulkhead for a backend, created on first use."""
+    bulkhead = _bulkheads.get(name)
+    if bulkhead is None:
+        with _bulkheads_lock:
+            bulkhead = _bulkheads.get(name)
+            if bulkhead is None:
+                concurrency, queue = _DEFAULT_LIMITS.get(name, (8, 8))
+                prefix = f"BULKHEAD_{name.upper()}"
+                bulkhead = Bulkhead(
+                    name,
+                    max(1, int(os.getenv(f"{prefix}_CONCURRENCY", concurrency))),
+                    max(0, int(os.getenv(f"{prefix}_QUEUE", queue))),
+                )
+                _bulkheads[name] = bulkhead
+    return bulkhead
+
+
+def stats() -> dict:
+    with _bulkheads_lock:
+        return {name: b.stats() for name, b in sorted(_bulkheads.items())}
+
+
+# ============================================
+# PER-CLIENT RATE LIMITING
+# ============================================
+
+class TokenBucket:
+    """rate tokens/second refill up to capacity; each request takes one."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """0.0 if a token was taken, else seconds until one is available."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """One TokenBucket per client key, least recently seen clients evicted past max_clients."""
+
+    def __init__(self, per_minute: float, burst: int, max_clients: int = 10000):
+        self.rate = max(per_minute, 0.001) / 60
+        self.burst = max(1, burst)
+        self.max_clients = max_clients
+        self._buckets: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check(self, key: str) -> float:
+        """0.0 when allowed, else the Retry-After delay in seconds."""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.burst)
+                while len(self._buckets) > self.max_clients:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+            return bucket.take()
@@ -0,0 +1,271 @@
+# cache.py
+"""
+InnovateHer 2026 - The Equity Gap: Two-Tier Cache
+L1 is a per-process LRU with a short TTL; L2 is shared by every app node on a
+Redis-protocol server (REDIS_URL, optional — without it only L1 is used). Values
+are stored as JSON in both tiers, so every read returns a fresh copy of the same
+shape (tuples come back as lists) wherever it was served from; keys carry a version so reseeding SALARIES (new SALARIES_DATA_VERSION)
+or changing prompts simply stops old entries from matching. A failing L2 is
+skipped for a cooldown instead of slowing every request down. Concurrent misses
+on one key are coalesced: one caller computes, the others wait (boundedly) for its value.
+Exposes: get_cache(name, ...), stats()
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from decimal import Decimal
+
+from deadline import DeadlineExceeded, expired, timeout_for
+
+_L1_MAX_ITEMS = int(os.getenv("CACHE_L1_MAX_ITEMS", "2048"))
+_L2_TIMEOUT = float(os.getenv("CACHE_L2_TIMEOUT_SECONDS", "0.05"))
+_L2_COOLDOWN = 30.0
+# Longest a coalesced caller waits on another's compute before computing itself
+_FLIGHT_WAIT = float(os.getenv("CACHE_FLIGHT_WAIT_SECONDS", "10"))
+_MISSING = object()
+
+
+# ============================================
+# SERIALIZATION
+# ============================================
+
+def _default(value):
+    # Snowflake returns DECIMAL aggregates; NumPy scalars come from the engines
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"not JSON serializable: {type(value).__name__}")
+
+
+def _dumps(value) -> bytes:
+    # Wrapped so a cached None / False is distinguishable from a miss
+    return json.dumps({"v": value}, separators=(",", ":"), default=_default).encode()
+
+
+def _loads(raw: bytes):
+    return json.loads(raw)["v"]
+
+
+# ============================================
+# L2 CONNECTION (shared)
+# ============================================
+
+_l2_client = None
+_l2_lock = threading.Lock()
+_l2_down_until = 0.0
+
+
+def _l2():
+    """Redis client for REDIS_URL, or None (not configured, not installed, or cooling down)."""
+    global _l2_client
+    if time.monotonic() < _l2_down_until:
+        return None
+    if _l2_client is None:
+        url = os.getenv("REDIS_URL", "")
+        if not url:
+            return None
+        with _l2_lock:
+            if _l2_client is None:
+                try:
+                    import redis
+                except ImportError:
+                    return None
+                _l2_client = redis.Redis.from_url(
+                    url, socket_timeout=_L2_TIMEOUT, socket_connect_timeout=_L2_TIMEOUT,
+                )
+    return _l2_client
+
+
+def _l2_failed() -> None:
+    global _l2_down_until
+    _l2_down_until = time.monotonic() + _L2_COOLDOWN
+
+
+# ============================================
+# CACHE
+# ============================================
+
+class _Flight:
+    """One in-progress compute() that concurrent callers for the same key wait on."""
+
+    __slots__ = ("done", "value", "ok")  # value: the serialized result
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.ok = False
+
+
+class TwoTierCache:
+    """
+    get_or_set(key, compute): L1, then L2 (back-filling L1), then compute() and
+    write both tiers. Keys are any JSON-serializable value.
+    """
+
+    def __init__(self, name: str, version: str = "", l1_ttl: float = 30, l2_ttl: float = 600,
+                 l1_max_items: int = _L1_MAX_ITEMS):
+        self.name = name
+        self.version = version
+        self.l1_ttl = l1_ttl
+        self.l2_ttl = l2_ttl
+        self.l1_max_items = l1_max_items
+        self._l1: OrderedDict = OrderedDict()
+        self._flights: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self.metrics = {
+            "l1_hits": 0, "l1_misses": 0,
+            "l2_hits": 0, "l2_misses": 0, "l2_errors": 0,
+            "computes": 0, "coalesced": 0, "flight_timeouts": 0,
+        }
+
+    def _key(self, key) -> str:
+        digest = hashlib.sha1(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()
+        return f"ieg:{self.name}:{self.version}:{digest}"
+
+    def _count(self, metric: str) -> None:
+        with self._lock:
+            self.metrics[metric] += 1
+
+    # --------------------------------------------
+    def get(self, key, default=None):
+        full = self._key(key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._l1.get(full)
+            if entry is not None and entry[0] > now:
+                self._l1.move_to_end(full)
+                self.metrics["l1_hits"] += 1
+                raw = entry[1]
+            else:
+                raw = None
+                self.metrics["l1_misses"] += 1
+        if raw is not None:
+            return _loads(raw)
+
+        client = _l2()
+        if client is None:
+            return default
+        try:
+            raw = client.get(full)
+        except Exception:
+            self._count("l2_errors")
+            _l2_failed()
+            return default
+        if raw is None:
+            self._count("l2_misses")
+            return default
+        self._count("l2_hits")
+        self._set_l1(full, raw)
+        return _loads(raw)
+
+    def set(self, key, value, ttl: float = None) -> None:
+        self._store(self._key(key), _dumps(value), ttl)
+
+    def _store(self, full: str, raw: bytes, ttl: float = None) -> None:
+        self._set_l1(full, raw)
+        client = _l2()
+        if client is None:
+            return
+        try:
+            client.set(full, raw, ex=max(1, int(ttl or self.l2_ttl)))
+        except Exception:
+            self._count("l2_errors")
+            _l2_failed()
+
+    def get_or_set(self, key, compute, should_cache=None):
+        """
+        Cached value for key, else compute() (cached unless should_cache(value) is
+        false). While one caller computes a key, others in this process wait for
+        its value (up to their request deadline, at most _FLIGHT_WAIT) instead
+        of computing it again; if that compute fails or outlasts the wait, each
+        waiter computes for itself.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        full = self._key(key)
+        with self._lock:
+            flight = self._flights.get(full)
+            leader = flight is None
+            if leader:
+                flight = self._flights[full] = _Flight()
+            else:
+                self.metrics["coalesced"] += 1
+        if not leader:
+            if flight.done.wait(timeout_for(_FLIGHT_WAIT)):
+                if flight.ok:
+                    return _loads(flight.value)
+            elif expired():
+                raise DeadlineExceeded()
+            else:
+                self._count("flight_timeouts")
+
+        self._count("computes")
+        try:
+            value = compute()
+            raw = _dumps(value)
+            if should_cache is None or should_cache(value):
+                self._store(full, raw)
+            flight.value, flight.ok = raw, True
+            # The caller gets the same shape as every later cache hit
+            return _loads(raw)
+        finally:
+            if leader:
+                with self._lock:
+                    self._flights.pop(full, None)
+                flight.done.set()
+
+    def invalidate(self, key) -> None:
+        """Drop key from L1 here and from the shared L2 (other nodes' L1 expires by TTL)."""
+        full = self._key(key)
+        with self._lock:
+            self._l1.pop(full, None)
+        client = _l2()
+        if client is None:
+            return
+        try:
+            client.delete(full)
+        except Exception:
+            self._count("l2_errors")
+            _l2_failed()
+
+    def _set_l1(self, full: str, raw: bytes) -> None:
+        with self._lock:
+            self._l1[full] = (time.monotonic() + self.l1_ttl, raw)
+            self._l1.move_to_end(full)
+            while len(self._l1) > self.l1_max_items:
+                self._l1.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"version": self.version, "l1_items": len(self._l1), **self.metrics}
+
+
+_caches: dict[str, TwoTierCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(name: str, version: str = "", l1_ttl: float = 30, l2_ttl: float = 600) -> TwoTierCache:
+    """Process-wide named cache; settings from the first call win."""
+    cache = _caches.get(name)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(name)
+            if cache is None:
+                cache = _caches[name] = TwoTierCache(name, version, l1_ttl, l2_ttl)
+    return cache
+
+
+def stats() -> dict:
+    with _caches_lock:
+        caches = dict(_caches)
+    return {
+        "l2": "disabled" if not os.getenv("REDIS_URL") else ("unavailable" if _l2() is None else "enabled"),
+        "caches": {name: c.stats() for name, c in sorted(caches.items())},
+    }
@@ -0,0 +1,252 @@
+# career_path.py
+"""
+InnovateHer 2026 - The Equity Gap: Event-Based Career Path Engine
+Combines career breaks, promotions, job switches and negotiated raises on one
+40-year timeline and produces salary, savings, 401(k) and investment trajectories.
+
+State is checkpointed at the start of every year, so editing one event only
+recomputes from that event's year forward (interactive what-if editing).
+Exposes: CareerPath(params), get_career_path(path_id, params), parse_events(raw)
+"""
+
+import math
+import threading
+from collections import OrderedDict
+
+# Same economic assumptions as gender_engine.compute_lifetime_impact
+_ANNUAL_RAISE = 0.03
+_INVESTMENT_RETURN = 0.07
+_EMPLOYER_401K_MATCH = 0.04
+
+_DEFAULTS = {
+    "salary": 90000.0,
+    "years": 30,
+    "savings": 25000.0,             # starting cash
+    "annual_raise": _ANNUAL_RAISE,
+    "savings_rate": 0.10,           # share of pay invested each year
+    "contribution_401k": 0.06,      # employee 401(k) contribution
+    "employer_match": _EMPLOYER_401K_MATCH,
+    "investment_return": _INVESTMENT_RETURN,
+    "break_monthly_spend": 3000.0,  # living costs drawn from cash during a break
+}
+
+EVENT_TYPES = ("break", "promotion", "job_switch", "raise")
+MAX_YEARS = 40
+MAX_EVENTS = 200
+
+# (low, high) per parameter; rates and fractions are per year, 0.05 = 5%
+_RANGES = {
+    "salary": (0.0, 10_000_000.0),
+    "years": (1, MAX_YEARS),
+    "savings": (0.0, 100_000_000.0),
+    "annual_raise": (-0.5, 1.0),
+    "savings_rate": (0.0, 1.0),
+    "contribution_401k": (0.0, 1.0),
+    "employer_match": (0.0, 1.0),
+    "investment_return": (-0.5, 1.0),
+    "break_monthly_spend": (0.0, 1_000_000.0),
+}
+
+
+# ============================================
+# INPUT NORMALIZATION
+# ============================================
+
+def _finite(value, name: str) -> float:
+    """float(value); ValueError for nan / inf (they would only fail later, in int())."""
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f"{name} must be a finite number")
+    return number
+
+
+def parse_params(raw: dict) -> dict:
+    """
+    Clamp user-supplied model parameters onto their _RANGES. Unparsable values
+    fall back to defaults; nan / inf raise ValueError.
+    """
+    params = dict(_DEFAULTS)
+    for key, default in _DEFAULTS.items():
+        try:
+            number = float(raw.get(key, default))
+        except (TypeError, ValueError):
+            continue
+        low, high = _RANGES[key]
+        params[key] = type(default)(max(low, min(high, _finite(number, key))))
+    return params
+
+
+def parse_events(raw) -> list[dict]:
+    """
+    Validate events. Each event has a type and a year (1..MAX_YEARS):
+    - break:      months (1-24) of no pay, living off cash then investments
+    - promotion:  raise_percent applied to base salary
+    - raise:      negotiated raise_percent on top of the annual raise
+    - job_switch: new salary, or raise_percent relative to the current one
+    Invalid entries raise ValueError. Order is kept (stable sort by year).
+    """
+    if not isinstance(raw, list):
+        raise ValueError("events must be a list")
+    if len(raw) > MAX_EVENTS:
+        raise ValueError(f"at most {MAX_EVENTS} events")
+
+    events = []
+    for item in raw:
+        if not isinstance(item, dict) or item.get("type") not in EVENT_TYPES:
+            raise ValueError(f"event type must be one of {', '.join(EVENT_TYPES)}")
+        year = int(_finite(item.get("year", 0), "event year"))
+        if not 1 <= year <= MAX_YEARS:
+            raise ValueError(f"event year must be between 1 and {MAX_YEARS}")
+
+        event = {"type": item["type"], "year": year}
+        if item["type"] == "break":
+            event["months"] = max(1, min(24, int(_finite(item.get("months", 6), "months"))))
+        elif item["type"] == "job_switch" and item.get("salary") is not None:
+            event["salary"] = max(0.0, _finite(item["salary"], "salary"))
+        else:
+            event["raise_percent"] = max(-90.0, min(500.0, _finite(item.get("raise_percent", 0), "raise_percent")))
+        events.append(event)
+
+    events.sort(key=lambda e: e["year"])
+    return events
+
+
+# ============================================
+# ENGINE
+# ============================================
+
+def _by_year(events: list[dict], years: int) -> list[tuple]:
+    """Events grouped per timeline year, as hashable tuples for cheap diffing."""
+    grouped = [[] for _ in range(years + 1)]
+    for e in events:
+        if e["year"] <= years:
+            grouped[e["year"]].append(tuple(sorted(e.items())))
+    return [tuple(g) for g in grouped]
+
+
+class CareerPath:
+    """
+    One simulated career. State at the start of year y is kept in
+    self._checkpoints[y] as (salary, cash, k401, investments).
+    Hold self.lock around set_events() + result() when shared between threads.
+    """
+
+    def __init__(self, params: dict):
+        self.params = params
+        self.lock = threading.Lock()
+        self.years = params["years"]
+        self._events_by_year = _by_year([], self.years)
+        self._checkpoints = [None] * (self.years + 2)
+        self._checkpoints[1] = (params["salary"], params["savings"], 0.0, 0.0)
+        self._rows = [None] * (self.years + 1)  # year-end snapshot per year
+        self._rows[0] = self._checkpoints[1]
+        self._baseline = None
+        self.recomputed_from = 1
+        self._run(1)
+
+    # --------------------------------------------
+    def _step(self, year: int, state: tuple) -> tuple:
+        """Advance one year from the start-of-year state."""
+        p = self.params
+        salary, cash, k401, invest = state
+        if year > 1:
+            salary *= 1 + p["annual_raise"]
+
+        months_off = 0
+        for event in self._events_by_year[year]:
+            e = dict(event)
+            if e["type"] == "break":
+                months_off += e["months"]
+            elif e["type"] == "job_switch" and "salary" in e:
+                salary = e["salary"]
+            else:
+                salary *= 1 + e["raise_percent"] / 100
+        months_off = min(12, months_off)
+
+        earned = salary * (12 - months_off) / 12
+        k401 = (k401 + earned * (p["contribution_401k"] + p["employer_match"])) * (1 + p["investment_return"])
+
+        # Break living costs come out of cash first, then investments
+        spend = months_off * p["break_monthly_spend"]
+        from_cash = min(cash, spend)
+        cash -= from_cash
+        invest = max(0.0, invest - (spend - from_cash))
+        invest = (invest + earned * p["savings_rate"]) * (1 + p["investment_return"])
+
+        return salary, cash, k401, invest
+
+    def _run(self, from_year: int) -> None:
+        state = self._checkpoints[from_year]
+        for year in range(from_year, self.years + 1):
+            self._checkpoints[year] = state
+            state = self._step(year, state)
+            self._rows[year] = state
+        self.recomputed_from = from_year
+
+    # --------------------------------------------
+    def set_events(self, events: list[dict]) -> int:
+        """Replace the event list; recompute only from the first changed year. Returns that year."""
+        new = _by_year(events, self.years)
+        first = next((y for y in range(1, self.years + 1) if new[y] != self._events_by_year[y]), None)
+        self._events_by_year = new
+        if first is None:
+            self.recomputed_from = self.years + 1  # nothing to redo
+        else:
+            self._run(first)
+        return self.recomputed_from
+
+    def _baseline_rows(self) -> list[tuple]:
+        """Same career with no events; computed once per parameter set."""
+        if self._baseline is None:
+            self._baseline = CareerPath(self.params)
+        return self._baseline._rows
+
+    def result(self) -> dict:
+        rows = self._rows
+        salary = [int(r[0]) for r in rows]
+        savings = [int(r[1]) for r in rows]
+        k401 = [int(r[2]) for r in rows]
+        invest = [int(r[3]) for r in rows]
+        net_worth = [s + k + i for s, k, i in zip(savings, k401, invest)]
+        baseline = [int(r[1] + r[2] + r[3]) for r in self._baseline_rows()]
+
+        return {
+            "salary_trajectory": salary,
+            "savings_trajectory": savings,
+            "retirement_trajectory": k401,
+            "investment_trajectory": invest,
+            "net_worth_trajectory": net_worth,
+            "baseline_net_worth_trajectory": baseline,
+            "year_labels": ["Start"] + [f"Year {y}" for y in range(1, self.years + 1)],
+            "final_net_worth": net_worth[-1],
+            "cost_of_events": baseline[-1] - net_worth[-1],
+            "years": self.years,
+            "recomputed_from_year": self.recomputed_from,
+        }
+
+
+# ============================================
+# PER-CLIENT PATH CACHE (incremental across requests)
+# ============================================
+
+_MAX_PATHS = 512
+_paths: OrderedDict = OrderedDict()
+_paths_lock = threading.Lock()
+
+
+def get_career_path(path_id: str, params: dict) -> CareerPath:
+    """
+    LRU-cached CareerPath for this client path. A path is rebuilt only when its
+    parameters change; event edits then reuse its per-year checkpoints.
+    """
+    key = str(path_id)[:128]
+    with _paths_lock:
+        path = _paths.get(key)
+        if path is not None and path.params == params:
+            _paths.move_to_end(key)
+            return path
+        path = CareerPath(params)
+        _paths[key] = path
+        while len(_paths) > _MAX_PATHS:
+            _paths.popitem(last=False)
+        return path
@@ -0,0 +1,159 @@
+# coach_templates.py
+"""
+InnovateHer 2026 - The Equity Gap: Local Coach Engine
+Personalized negotiation replies without Gemini: the classified intent picks a
+script, the user's own numbers (gap, market percentile, 30-year cost) fill it,
+and the best-matching tips ground it. Templates are bound once at import and
+the lifetime multiplier is precomputed, so a reply is a few string formats
+(well under a millisecond).
+Exposes: compose_reply(context, intent, tips)
+"""
+
+import math
+import re
+
+try:
+    from negotiation_db import _FALLBACK_TIPS
+except Exception:
+    _FALLBACK_TIPS = {}
+
+# Same economic assumptions as gender_engine.compute_lifetime_impact
+_ANNUAL_RAISE = 0.03
+_INVESTMENT_RETURN = 0.07
+_EMPLOYER_401K_MATCH = 0.04
+_LIFETIME_YEARS = 30
+
+# Spread of salaries within one title in SALARIES (log-scale sigma, all levels)
+_LOG_SIGMA = 0.31
+
+
+def _lifetime_factor(years: int) -> float:
+    """total_compound_loss for a $1 starting gap (the model is linear in the gap)."""
+    gap, pot, match = 1.0, 0.0, 0.0
+    for _ in range(years):
+        gap *= 1 + _ANNUAL_RAISE
+        match += gap * _EMPLOYER_401K_MATCH
+        pot = (pot + gap) * (1 + _INVESTMENT_RETURN)
+    return pot + match
+
+
+_LIFETIME_FACTOR = _lifetime_factor(_LIFETIME_YEARS)
+
+
+# ============================================
+# TEMPLATES (bound str.format methods)
+# ============================================
+
+_UNDERPAID = (
+    "At ${salary:,}{as_role}, you're about ${gap:,} under the ${market:,} market average "
+    "(roughly the {percentile} percentile), and left alone that gap compounds to about "
+    "${lifetime:,} over {years} years."
+).format
+_AT_MARKET = (
+    "At ${salary:,} you're at or above the ${market:,} market average for {role} "
+    "(roughly the {percentile} percentile), so negotiate from strength."
+).format
+_MARKET_ONLY = "The market average for {role} is about ${market:,}.".format
+
+_SCRIPTS = {
+    "salary": 'Try: "Based on my research, this role pays around ${market:,}. I\'m looking for ${target:,}."'.format,
+    "equity": 'Ask: "Could you share the vesting schedule, strike price and my percentage of fully-diluted shares?"'.format,
+    "benefits": 'Try: "Beyond base pay, I\'d like to discuss remote flexibility and a professional development budget."'.format,
+    "rejection": 'Try: "I understand. What would need to happen for us to revisit ${target:,} in six months?"'.format,
+    "confidence": 'Practice this out loud: "I\'m excited about this role, and based on my research I\'d like to discuss ${target:,}."'.format,
+    "timing": 'Within two or three business days, say: "Thank you for the offer. I\'d like to discuss the base salary before I sign."'.format,
+    "signing_bonus": 'Try: "If base is fixed, a ${bonus:,} signing bonus would close the gap for this year."'.format,
+    "promotion": 'Try: "Here are my results this year. I\'d like to talk about the next level and a salary of ${target:,}."'.format,
+    "counteroffer": 'Try: "I have an offer at ${target:,}. I\'d prefer to stay; can you match it?"'.format,
+    "general": 'Try: "What\'s the budgeted range for this role?" before sharing any numbers.'.format,
+}
+_NEEDS_NUMBERS = {"salary", "rejection", "confidence", "promotion", "counteroffer", "signing_bonus"}
+
+
+# ============================================
+# NUMBERS
+# ============================================
+
+def _number(value) -> float:
+    try:
+        return max(0.0, float(str(value).replace(",", "").replace("$", "")))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _ordinal(n: int) -> str:
+    suffix = "th" if 10 <= n % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
+
+
+def _percentile(salary: float, market: float) -> int:
+    """Approximate percentile of salary among the role's salaries (log-normal around the mean)."""
+    median = market * math.exp(-_LOG_SIGMA ** 2 / 2)
+    z = math.log(salary / median) / _LOG_SIGMA
+    return max(1, min(99, round(50 * (1 + math.erf(z / math.sqrt(2))))))
+
+
+def _precise(amount: float) -> int:
+    """A precise-looking ask ($127,500 rather than $130,000): rounded to $500."""
+    return int(round(amount / 500) * 500)
+
+
+# ============================================
+# TIP RANKING
+# ============================================
+
+_WORD = re.compile(r"[a-z']+")
+
+
+def _rank_tips(tips: list[str], message: str, limit: int = 1) -> list[str]:
+    """Tips sharing the most words with the message first (stable for ties)."""
+    words = set(_WORD.findall(message.lower()))
+    scored = sorted(
+        enumerate(tips),
+        key=lambda item: (-len(words & set(_WORD.findall(item[1].lower()))), item[0]),
+    )
+    return [tip for _i, tip in scored[:limit]]
+
+
+# ============================================
+# PUBLIC API
+# ============================================
+
+def compose_reply(context: dict, intent: str, tips: list[str]) -> str:
+    """
+    Build a personalized 2-3 sentence reply. context carries role, salary,
+    market_average, gap_amount and message (as sent to /api/chat); intent is a
+    negotiation_db category; tips are retrieved tips, preferred over built-ins.
+    """
+    role = " ".join(str(context.get("role", "")).split())
+    as_role = f" as {'an' if role[:1].upper() in 'AEIO' else 'a'} {role}" if role else ""
+    role = role or "this role"
+    salary = _number(context.get("salary"))
+    market = _number(context.get("market_average"))
+    gap = _number(context.get("gap_amount")) or max(0.0, market - salary)
+
+    parts = []
+    if market and salary:
+        values = {
+            "role": role, "salary": int(salary), "market": int(market),
+            "percentile": _ordinal(_percentile(salary, market)), "years": _LIFETIME_YEARS,
+        }
+        if gap >= 1 and salary < market:
+            parts.append(_UNDERPAID(gap=int(gap), lifetime=int(gap * _LIFETIME_FACTOR), as_role=as_role, **values))
+        else:
+            parts.append(_AT_MARKET(**values))
+    elif market:
+        parts.append(_MARKET_ONLY(role=role, market=int(market)))
+
+    target = _precise(max(market, salary) * 1.05)
+    if (intent in _NEEDS_NUMBERS and not target) or (intent == "salary" and not market):
+        intent = "general"
+    script = _SCRIPTS.get(intent, _SCRIPTS["general"])
+    parts.append(script(market=int(market), target=target, bonus=_precise(max(gap, salary * 0.05))))
+
+    # Retrieved tips first, then the built-in ones for this intent
+    candidates = [t for t in tips if t] + _FALLBACK_TIPS.get(intent, [])
+    best = _rank_tips(candidates, str(context.get("message", "")))
+    if best:
+        parts.append(best[0])
+    return " ".join(parts)
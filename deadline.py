@@ -0,0 +1,64 @@
+# deadline.py
+"""
+InnovateHer 2026 - The Equity Gap: Request Deadlines
+Each route gets a latency budget; the absolute deadline rides along in a
+contextvar, and every backend call sizes its own timeout from what is left
+(Snowflake statement timeout, SQLite interrupt, Mongo maxTimeMS, Nessie HTTP
+timeouts, Gemini request deadline). Once it is spent, calls raise
+DeadlineExceeded before starting and the caller takes its fallback.
+Exposes: budget(seconds), remaining(), timeout_for(default), expired(), DeadlineExceeded
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+
+# Below this a backend round trip cannot finish; fail fast instead of starting one
+MIN_CALL_SECONDS = 0.05
+
+_deadline: contextvars.ContextVar = contextvars.ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """The request's latency budget is spent."""
+
+
+def set_budget(seconds: float | None) -> None:
+    """Start (or with None, clear) the budget for the current context."""
+    _deadline.set(None if seconds is None else time.monotonic() + seconds)
+
+
+@contextmanager
+def budget(seconds: float):
+    """Run a block under a budget; an enclosing tighter deadline still wins."""
+    new = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(new if current is None else min(current, new))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Seconds left, or None when no budget is set."""
+    deadline = _deadline.get()
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left < MIN_CALL_SECONDS
+
+
+def timeout_for(default: float | None) -> float | None:
+    """
+    Timeout for the next backend call: the smaller of its own default and the
+    remaining budget. Raises DeadlineExceeded when too little is left to try.
+    """
+    left = remaining()
+    if left is None:
+        return default
+    if left < MIN_CALL_SECONDS:
+        raise DeadlineExceeded()
+    return left if default is None else min(default, left)
@@ -0,0 +1,76 @@
+# export.py
+"""
+InnovateHer 2026 - The Equity Gap: Aggregate Export
+The per-role / level / location / gender aggregates behind the charts, for
+analysts and partner orgs. Rows come off the backend cursor a batch at a time
+and each batch is serialized to one NDJSON or CSV chunk, so an export holds a
+single batch in memory however large the table is.
+Groups smaller than EXPORT_MIN_GROUP_SIZE are never exported (no individual salaries).
+Exposes: parse_export_params(args), export_chunks(batches, fmt), CONTENT_TYPES
+"""
+
+import csv
+import io
+import json
+import os
+
+from salary_backend import EXPORT_COLUMNS, EXPORT_FILTERS
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+MIN_GROUP_SIZE = int(os.getenv("EXPORT_MIN_GROUP_SIZE", "5"))
+BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def parse_export_params(args) -> tuple[str, dict, int]:
+    """(format, filters, min_count) from query args; raises ValueError on a bad format."""
+    fmt = str(args.get("format", "ndjson")).strip().lower() or "ndjson"
+    if fmt not in CONTENT_TYPES:
+        raise ValueError(f"format must be one of: {', '.join(CONTENT_TYPES)}")
+    filters = {}
+    for name in EXPORT_FILTERS:
+        value = " ".join(str(args.get(name, "")).split())
+        if value:
+            filters[name] = value
+    try:
+        min_count = int(args.get("min_count", MIN_GROUP_SIZE))
+    except (TypeError, ValueError):
+        min_count = MIN_GROUP_SIZE
+    return fmt, filters, max(MIN_GROUP_SIZE, min_count)
+
+
+def _row(values: tuple) -> tuple:
+    # Snowflake returns DECIMAL aggregates; export plain ints
+    return (*values[:4], *(int(v) for v in values[4:]))
+
+
+def _ndjson(batch: list[tuple]) -> bytes:
+    if orjson is not None:
+        return b"".join(orjson.dumps(dict(zip(EXPORT_COLUMNS, _row(r)))) + b"\n" for r in batch)
+    return "".join(json.dumps(dict(zip(EXPORT_COLUMNS, _row(r)))) + "\n" for r in batch).encode()
+
+
+def export_chunks(batches, fmt: str):
+    """Serialize an iterator of row batches into one bytes chunk per batch (CSV starts with a header)."""
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(EXPORT_COLUMNS)
+        for batch in batches:
+            writer.writerows(_row(r) for r in batch)
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode()  # header only: empty result
+    else:
+        for batch in batches:
+            yield _ndjson(batch)
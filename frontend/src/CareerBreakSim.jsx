@@ -117,7 +117,7 @@ export default function CareerBreakSim({ theme }) {
     },
   }
 
-  const compoundLoss = result ? Math.round(result.lost * 3.3) : 0
+  const compoundLoss = result ? (result.compound_loss ?? Math.round(result.lost * 3.3)) : 0
   const startingBalance = result?.chart_data?.[0] || 25000
   const finalBalance = result?.chart_data?.[result.chart_data.length - 1] || 0
   const depletionPct = startingBalance > 0 ? Math.round((result?.lost / startingBalance) * 100) : 0
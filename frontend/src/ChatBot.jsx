@@ -32,7 +32,7 @@ function cssRgb(varName, alpha = 1) {
 }
 
 const ENDPOINTS = {
-  gapCheck: '/api/gap-check',
+  sessionOverview: '/api/session/overview',
   simulate: '/api/simulate',
   chat: '/api/chat',
 }
@@ -82,19 +82,26 @@ export default function ChatBot() {
     setChatStarted(true)
     setAnalyzing(true)
 
-    // Run gap check
+    // Gap check + instant (deterministic) 6-month simulation in one round trip
     try {
-      const res = await fetch(ENDPOINTS.gapCheck, {
+      const res = await fetch(ENDPOINTS.sessionOverview, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({
           role,
           location,
           current_salary: parseFloat(salary) || 0,
+          months: 6,
+          monthly_spend: 2000,
         }),
       })
-      const data = await res.json()
+      const overview = await res.json()
+      if (!overview.gap) throw new Error('no overview')
+      const data = overview.gap
       setGapResult(data)
+      if (showGraph && overview.simulation) {
+        setSimResult(overview.simulation)
+      }
 
       // Opening message from coach based on gap check
       const verdictMsg = data.verdict === 'UNDERPAID'
@@ -117,7 +124,7 @@ export default function ChatBot() {
       ])
     }
 
-    // Run simulation if graph toggle is on
+    // Live simulation replaces the instant one when it lands; the chat doesn't wait for it
     if (showGraph) {
       runSimulation(6)
     }
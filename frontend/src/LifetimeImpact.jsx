@@ -57,11 +57,9 @@ export default function LifetimeImpact({ theme }) {
     setResult(null)
 
     try {
-      const res = await fetch('/api/lifetime', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ role, years }),
-      })
+      // Canonical GET (sorted params) so the browser can revalidate via ETag
+      const params = new URLSearchParams({ role, years: String(years) })
+      const res = await fetch(`/api/lifetime?${params}`)
       const data = await res.json()
 
       if (data.success) {
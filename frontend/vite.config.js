@@ -1,9 +1,40 @@
 import { defineConfig } from 'vite'
 import react from '@vitejs/plugin-react'
 import path from 'path'
+import fs from 'fs'
+import zlib from 'zlib'
+
+// ✅ Write .gz / .br next to each text asset so app.py (SERVE_FRONTEND=1)
+//    can send them precompressed without compressing per request
+const PRECOMPRESS_EXT = /\.(js|css|html|svg|json|txt)$/
+const PRECOMPRESS_MIN_BYTES = 1024
+
+function precompress() {
+  let outDir = 'dist'
+  return {
+    name: 'precompress',
+    apply: 'build',
+    configResolved(config) {
+      outDir = path.resolve(config.root, config.build.outDir)
+    },
+    closeBundle() {
+      const walk = (dir) => fs.readdirSync(dir, { withFileTypes: true }).flatMap((e) =>
+        e.isDirectory() ? walk(path.join(dir, e.name)) : [path.join(dir, e.name)])
+      for (const file of walk(outDir)) {
+        if (!PRECOMPRESS_EXT.test(file)) continue
+        const buf = fs.readFileSync(file)
+        if (buf.length < PRECOMPRESS_MIN_BYTES) continue
+        fs.writeFileSync(`${file}.gz`, zlib.gzipSync(buf, { level: 9 }))
+        fs.writeFileSync(`${file}.br`, zlib.brotliCompressSync(buf, {
+          params: { [zlib.constants.BROTLI_PARAM_QUALITY]: 11 },
+        }))
+      }
+    },
+  }
+}
 
 export default defineConfig({
-  plugins: [react()],
+  plugins: [react(), precompress()],
 
   // ✅ Allow importing images from InnovateHer/Illustrations
   resolve: {
@@ -0,0 +1,154 @@
+# gap_stats.py
+"""
+InnovateHer 2026 - The Equity Gap: Gender Gap Confidence Intervals
+95% intervals on the gap ($) and gap percent, by bootstrap over the role's raw
+salaries. Every resample is drawn as one index matrix and reduced with a single
+NumPy mean, so a few thousand resamples cost milliseconds; results are cached
+per role/segment, keyed by the per-gender count and sum of the role's summary
+rows (the data the point estimate is built from), so the interval is recomputed
+whenever the gap it is shown next to changes, whoever wrote the new rows.
+Exposes: gap_confidence(role, level=None, version=""), bootstrap_gap(male, female)
+"""
+
+import os
+import threading
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+
+from salary_backend import aggregate_cache, get_backend, normalize_title
+import salary_submissions
+
+RESAMPLES = int(os.getenv("GAP_CI_RESAMPLES", "2000"))
+CONFIDENCE = 0.95
+
+# Index matrix is capped at this many cells; larger samples are drawn in row blocks
+_MAX_MATRIX_CELLS = 4_000_000
+# Beyond this many salaries per group the bootstrap and the normal interval agree
+_MAX_BOOTSTRAP_N = 50_000
+_MAX_CACHED = 1024
+
+
+# ============================================
+# BOOTSTRAP
+# ============================================
+
+def _resample_means(x: np.ndarray, rng: np.random.Generator, resamples: int) -> np.ndarray:
+    """Mean of each bootstrap resample of x: (resamples, n) index matrix -> row means."""
+    n = len(x)
+    rows = max(1, _MAX_MATRIX_CELLS // n)
+    if rows >= resamples:
+        return x[rng.integers(0, n, size=(resamples, n))].mean(axis=1)
+    out = np.empty(resamples)
+    for start in range(0, resamples, rows):
+        stop = min(resamples, start + rows)
+        out[start:stop] = x[rng.integers(0, n, size=(stop - start, n))].mean(axis=1)
+    return out
+
+
+def _normal_means(x: np.ndarray, rng: np.random.Generator, resamples: int) -> np.ndarray:
+    """Large-sample stand-in: draws from the sampling distribution of the mean."""
+    return rng.normal(x.mean(), x.std(ddof=1) / np.sqrt(len(x)), size=resamples)
+
+
+def bootstrap_gap(male, female, resamples: int = RESAMPLES, seed: int = 0) -> dict:
+    """
+    Percentile intervals for gap = mean(male) - mean(female) and
+    gap_percent = gap / mean(male) * 100. Needs at least 2 salaries per group.
+    """
+    m = np.asarray(male, dtype=np.float64)
+    f = np.asarray(female, dtype=np.float64)
+    if len(m) < 2 or len(f) < 2:
+        return None
+
+    rng = np.random.default_rng(seed)
+    large = max(len(m), len(f)) > _MAX_BOOTSTRAP_N
+    draw = _normal_means if large else _resample_means
+    m_means = draw(m, rng, resamples)
+    f_means = draw(f, rng, resamples)
+
+    gaps = m_means - f_means
+    gap_percents = gaps / m_means * 100
+    tail = (1 - CONFIDENCE) / 2 * 100
+    lo, hi = np.percentile(gaps, [tail, 100 - tail])
+    plo, phi = np.percentile(gap_percents, [tail, 100 - tail])
+
+    return {
+        "gap_ci": {"low": int(round(lo)), "high": int(round(hi))},
+        "gap_percent_ci": {"low": round(float(plo), 1), "high": round(float(phi), 1)},
+        "ci_level": CONFIDENCE,
+        "ci_method": "normal" if large else "bootstrap",
+        "ci_resamples": resamples,
+    }
+
+
+# ============================================
+# CACHED PER ROLE / SEGMENT
+# ============================================
+
+_cache: OrderedDict = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _samples(role: str, level: str = None) -> tuple[list, list]:
+    """Male / female salary lists: backend rows plus unflushed crowd submissions."""
+    rows = list(get_backend().salary_samples(role, level))
+    if not level:
+        rows += salary_submissions.pending_salaries(role)
+    male, female = [], []
+    for gender, salary in rows:
+        key = str(gender).strip().upper()
+        if key == "MALE":
+            male.append(salary)
+        elif key == "FEMALE":
+            female.append(salary)
+    return male, female
+
+
+def _signature(role: str, segment: str) -> tuple:
+    """((gender, count, sum), ...) over the role's (cached) summary rows, optionally one level."""
+    rows = aggregate_cache().get_or_set(
+        ("summary", normalize_title(role)),
+        lambda: get_backend().summary_rows(role),
+    )
+    totals = {}
+    for level, _location, _company_type, gender, salary_sum, salary_count, *_range in rows:
+        if segment and str(level).strip().upper() != segment:
+            continue
+        gender = str(gender).strip().upper()
+        count, total = totals.get(gender, (0, 0.0))
+        totals[gender] = (count + int(salary_count), total + float(salary_sum))
+    return tuple((gender, count, round(total, 2)) for gender, (count, total) in sorted(totals.items()))
+
+
+def gap_confidence(role: str, level: str = None, version: str = "") -> dict:
+    """
+    Cached bootstrap intervals for role (optionally one experience level), or None
+    when a group has too few salaries. The cache key includes version, the
+    summary signature and the role's submission generation, so new data
+    recomputes instead of going stale.
+    """
+    segment = (level or "").strip().upper()
+    key = (
+        normalize_title(role), segment, version,
+        _signature(role, segment), salary_submissions.role_generation(role),
+    )
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    male, female = _samples(role, segment or None)
+    # Deterministic per key: the same data always yields the same interval (stable ETags)
+    seed = zlib.crc32(repr(key).encode())
+    result = bootstrap_gap(male, female, seed=seed)
+
+    with _cache_lock:
+        # Drop older versions of this role/segment along with the LRU tail
+        for stale in [k for k in _cache if k[:2] == key[:2]]:
+            del _cache[stale]
+        _cache[key] = result
+        while len(_cache) > _MAX_CACHED:
+            _cache.popitem(last=False)
+    return result
@@ -1,32 +1,15 @@
 # gender_engine.py
 """
 InnovateHer 2026 - The Equity Gap: Gender-Disaggregated Salary Engine
-Queries Snowflake SALARIES table by GENDER to power the Lifetime Impact feature.
+Combines the per-segment SALARY_SUMMARY rows by GENDER to power the Lifetime Impact feature.
 Exposes: get_gender_benchmark(role) and compute_lifetime_impact(male_avg, female_avg)
 """
 
-import os
-from dotenv import load_dotenv
+from salary_backend import aggregate_cache, fold_summary, get_backend, normalize_title, require_backend
+from salary_submissions import combine, pending_overlay
 
-load_dotenv()
-
-# ============================================
-# SNOWFLAKE CONNECTION (mirrors truth_engine.py)
-# ============================================
-
-_SNOWFLAKE_CONFIG = {
-    "user": os.getenv("SNOWFLAKE_USER"),
-    "password": os.getenv("SNOWFLAKE_PASSWORD"),
-    "account": os.getenv("SNOWFLAKE_ACCOUNT"),
-    "warehouse": "COMPUTE_WH",
-    "database": "HACKATHON_DB",
-    "schema": "PUBLIC",
-}
-
-
-def _get_connection():
-    import snowflake.connector
-    return snowflake.connector.connect(**_SNOWFLAKE_CONFIG)
+# Importing this module without any backend raises ImportError (app.py uses mocks)
+require_backend()
 
 
 # ============================================
@@ -35,27 +18,27 @@ def _get_connection():
 
 def get_gender_benchmark(role: str) -> dict:
     """
-    Query Snowflake for male vs female salary averages for a given role.
+    Query the salary backend for male vs female salary averages for a given role.
     Returns: {success, role, male_avg, female_avg, gap, gap_percent, male_count, female_count}
     """
-    conn = None
     try:
-        conn = _get_connection()
-        cursor = conn.cursor()
-
-        query = """
-            SELECT
-                GENDER,
-                AVG(ANNUAL_SALARY)  AS avg_salary,
-                MIN(ANNUAL_SALARY)  AS min_salary,
-                MAX(ANNUAL_SALARY)  AS max_salary,
-                COUNT(*)            AS sample_size
-            FROM SALARIES
-            WHERE UPPER(JOB_TITLE) = UPPER(%s)
-            GROUP BY GENDER
-        """
-        cursor.execute(query, (role,))
-        rows = cursor.fetchall()
+        # Per-segment summary rows for the role, combined per gender here
+        rows = aggregate_cache().get_or_set(
+            ("summary", normalize_title(role)),
+            lambda: get_backend().summary_rows(role),
+        )
+
+        # Fold in crowd submissions that have not been flushed to SALARIES yet
+        overlay = pending_overlay(role)
+        by_gender = {"MALE": (0, 0, None, None), "FEMALE": (0, 0, None, None)}
+        for key, (avg_sal, min_sal, max_sal, count) in fold_summary(rows, by_gender=True).items():
+            if key in by_gender:
+                by_gender[key] = (count, avg_sal, min_sal, max_sal)
+        rows = []
+        for key, label in (("MALE", "Male"), ("FEMALE", "Female")):
+            count, avg_sal, min_sal, max_sal = combine(*by_gender[key], overlay.get(label))
+            if count:
+                rows.append((key, avg_sal, min_sal, max_sal, count))
 
         male_avg = female_avg = 0
         male_count = female_count = 0
@@ -93,9 +76,6 @@ def get_gender_benchmark(role: str) -> dict:
 
     except Exception as e:
         return {"success": False, "error": str(e)}
-    finally:
-        if conn:
-            conn.close()
 
 
 # ============================================
@@ -0,0 +1,100 @@
+# http_cache.py
+"""
+InnovateHer 2026 - The Equity Gap: HTTP Conditional-Request Helpers
+Strong ETags + Cache-Control for deterministic GET endpoints, so browsers and
+reverse proxies can revalidate with If-None-Match instead of re-downloading.
+Exposes: canonical_query(params), make_etag(namespace, params, version),
+         conditional_json(etag, build, max_age)
+"""
+
+import hashlib
+import json
+from urllib.parse import urlencode
+
+from flask import current_app, jsonify, redirect, request
+
+
+# ============================================
+# CANONICAL PARAMETERS
+# ============================================
+
+def canonical_query(params: dict) -> str:
+    """Sorted, url-encoded query string for already-normalized params."""
+    return urlencode(sorted((k, str(v)) for k, v in params.items()))
+
+
+def redirect_to_canonical(params: dict):
+    """
+    Return a 301 to the canonical URL if the request's query string differs,
+    else None. One URL per input means one cache entry per input downstream.
+    """
+    canonical = canonical_query(params)
+    if request.query_string.decode("utf-8", "replace") == canonical:
+        return None
+    resp = redirect(f"{request.path}?{canonical}", code=301)
+    resp.cache_control.public = True
+    resp.cache_control.max_age = 86400
+    return resp
+
+
+# ============================================
+# ETAGS
+# ============================================
+
+def make_etag(namespace: str, params: dict, version: str) -> str:
+    """Strong ETag from endpoint namespace, normalized inputs and data version."""
+    blob = json.dumps(
+        {"ns": namespace, "v": version, "p": params},
+        sort_keys=True, separators=(",", ":"),
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:32]
+
+
+# Content codings the compression layer (http_codec.py) may apply. A strong
+# ETag names exact bytes, so compressed bodies carry "<etag>-<coding>".
+CONTENT_CODINGS = ("br", "gzip")
+
+
+def encoded_etag(etag: str, coding: str) -> str:
+    """ETag for the `coding`-compressed representation of `etag`."""
+    return f"{etag}-{coding}"
+
+
+def matching_etag(etag: str) -> str | None:
+    """The representation (plain or compressed) If-None-Match names, if any."""
+    for candidate in (etag, *(encoded_etag(etag, c) for c in CONTENT_CODINGS)):
+        if request.if_none_match.contains(candidate):
+            return candidate
+    return None
+
+
+def etag_matches(etag: str) -> bool:
+    """True if the request's If-None-Match already names this representation."""
+    return matching_etag(etag) is not None
+
+
+def conditional_json(etag: str, build, max_age: int):
+    """
+    Serve a 304 when If-None-Match matches, otherwise call build() -> (payload, status)
+    and attach ETag + Cache-Control to successful responses.
+    build() is never called on a cache hit, so backends are not touched.
+    Both carry Vary: Accept-Encoding, since the ETag depends on the negotiated coding.
+    """
+    matched = matching_etag(etag)
+    if matched is not None:
+        # echo the variant the client holds (it may be a compressed one)
+        resp = current_app.response_class(status=304)
+        etag = matched
+    else:
+        payload, status = build()
+        resp = jsonify(payload)
+        resp.status_code = status
+        if status != 200:
+            resp.cache_control.no_store = True
+            return resp
+
+    resp.set_etag(etag)
+    resp.vary.add("Accept-Encoding")
+    resp.cache_control.public = True
+    resp.cache_control.max_age = max_age
+    return resp
@@ -0,0 +1,185 @@
+# http_codec.py
+"""
+InnovateHer 2026 - The Equity Gap: Response Encoding
+Fast JSON (orjson when installed), negotiated gzip/brotli compression above a
+size threshold (incrementally for streamed bodies), and an opt-in compact
+columnar encoding for chart payloads.
+Exposes: init_codec(app), wants_compact(source), compact_encode(payload),
+         encode_stream(chunks, accept_encodings)
+"""
+
+import gzip
+import os
+import zlib
+
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+from http_cache import encoded_etag
+
+# orjson / brotli are optional — stdlib json and gzip are always available
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+try:
+    import brotli
+except Exception:
+    brotli = None
+
+
+# ============================================
+# FAST JSON PROVIDER
+# ============================================
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (Rust). Output stays key-sorted like Flask's default."""
+
+    _OPTIONS = 0
+    if orjson is not None:
+        _OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=DefaultJSONProvider.default, option=self._OPTIONS).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # skip the bytes -> str -> bytes round trip of the base implementation
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=DefaultJSONProvider.default, option=self._OPTIONS)
+        return self._app.response_class(body, mimetype="application/json")
+
+
+# ============================================
+# COMPRESSION
+# ============================================
+
+_COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+_GZIP_LEVEL = 6
+_BROTLI_QUALITY = 5  # q5 is close to gzip-6 speed with noticeably smaller output
+_COMPRESSIBLE = ("application/json", "application/x-ndjson", "text/")
+
+
+def _pick_coding(accept_encodings) -> str | None:
+    offered = ["br", "gzip"] if brotli is not None else ["gzip"]
+    best = accept_encodings.best_match(offered)
+    return best if best in offered else None
+
+
+def _compress(body: bytes, coding: str) -> bytes:
+    if coding == "br":
+        return brotli.compress(body, quality=_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=_GZIP_LEVEL)
+
+
+def encode_stream(chunks, accept_encodings) -> tuple:
+    """
+    Compress a streamed body chunk by chunk: (iterator of bytes, coding or None).
+    Each chunk is flushed as it is produced, so memory stays at one chunk and
+    the client can decode rows as they arrive.
+    """
+    coding = _pick_coding(accept_encodings)
+    if coding is None:
+        return chunks, None
+
+    def encoded():
+        if coding == "br":
+            compressor = brotli.Compressor(quality=_BROTLI_QUALITY)
+            for chunk in chunks:
+                out = compressor.process(chunk) + compressor.flush()
+                if out:
+                    yield out
+            yield compressor.finish()
+        else:
+            compressor = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, 31)  # wbits 31 = gzip framing
+            for chunk in chunks:
+                out = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+                if out:
+                    yield out
+            yield compressor.flush()
+
+    return encoded(), coding
+
+
+def _compress_response(response):
+    """after_request hook: compress eligible buffered responses."""
+    from flask import request
+
+    if (
+        response.status_code < 200
+        or response.status_code in (204, 206, 304)
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or not (response.mimetype or "").startswith(_COMPRESSIBLE)
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    body = response.get_data()
+    if len(body) < _COMPRESS_MIN_BYTES:
+        return response
+
+    coding = _pick_coding(request.accept_encodings)
+    if coding is None:
+        return response
+
+    response.set_data(_compress(body, coding))
+    response.headers["Content-Encoding"] = coding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(encoded_etag(etag, coding))
+    return response
+
+
+# ============================================
+# COMPACT COLUMNAR ENCODING (opt-in)
+# ============================================
+
+COMPACT_FORMAT = "compact-v1"
+
+# Integer series that change smoothly year to year / month to month
+_DELTA_FIELDS = ("male_trajectory", "female_trajectory", "gap_trajectory", "chart_data")
+# Derivable on the client: "Start", "Year 1", ... "Year N"
+_DROPPED_FIELDS = ("year_labels",)
+
+
+def wants_compact(source) -> bool:
+    """True if a query-arg / JSON-body mapping asks for ?format=compact."""
+    return str(source.get("format", "")).lower() == "compact"
+
+
+def delta_encode(values: list) -> list:
+    """[v0, v1-v0, v2-v1, ...] — decode with a running sum."""
+    out, prev = [], 0
+    for v in values:
+        out.append(v - prev)
+        prev = v
+    return out
+
+
+def compact_encode(payload: dict) -> dict:
+    """
+    Drop derivable labels and delta-encode trajectories.
+    Clients rebuild a series with a prefix sum; labels are "Start" then "Year i".
+    """
+    out = {k: v for k, v in payload.items() if k not in _DROPPED_FIELDS}
+    for field in _DELTA_FIELDS:
+        if isinstance(out.get(field), list):
+            out[field] = delta_encode(out[field])
+    out["encoding"] = COMPACT_FORMAT
+    return out
+
+
+# ============================================
+# PUBLIC API
+# ============================================
+
+def init_codec(app) -> None:
+    """Install the fast JSON provider (if orjson is present) and response compression."""
+    if orjson is not None and os.getenv("FAST_JSON", "1") != "0":
+        app.json = OrjsonProvider(app)
+    if os.getenv("COMPRESS_RESPONSES", "1") != "0":
+        app.after_request(_compress_response)
@@ -0,0 +1,323 @@
+# ingest.py
+"""
+InnovateHer 2026 - The Equity Gap: Bulk Salary Ingest Pipeline
+Streams external salary CSVs (BLS / Levels-style drops, millions of rows) into
+SALARIES in bounded-memory chunks:
+  map columns -> vectorized validation / normalization / outlier filtering
+  -> bulk load (large executemany batches, or Snowflake PUT + COPY INTO)
+Checkpoints the byte offset after every committed chunk so a killed run resumes.
+
+    python ingest.py levels_2026q1.csv --map JOB_TITLE=title,ANNUAL_SALARY=basesalary
+    python ingest.py oes_2026.csv --stage --hourly-below 500
+
+Exposes: ingest_file(path, ...), main(argv)
+"""
+
+import argparse
+import csv
+import gzip
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from salary_backend import get_backend, invalidate_role, normalize_title
+
+TARGET_COLUMNS = ("JOB_TITLE", "ANNUAL_SALARY", "EXPERIENCE_LEVEL", "GENDER", "LOCATION", "COMPANY_TYPE")
+
+# Header aliases tried (case-insensitive) when a column is not mapped explicitly
+_ALIASES = {
+    "JOB_TITLE": ("job_title", "title", "occupation", "occ_title", "role", "position"),
+    "ANNUAL_SALARY": ("annual_salary", "salary", "base_salary", "basesalary", "a_mean", "annual_wage", "pay"),
+    "EXPERIENCE_LEVEL": ("experience_level", "level", "seniority", "experience"),
+    "GENDER": ("gender", "sex"),
+    "LOCATION": ("location", "city", "metro", "area_title", "area"),
+    "COMPANY_TYPE": ("company_type", "company_size", "employer_type"),
+}
+
+_GENDERS = {"m": "Male", "male": "Male", "man": "Male", "f": "Female", "female": "Female", "woman": "Female"}
+_LEVELS = {
+    "entry": "Entry", "junior": "Entry", "jr": "Entry", "new grad": "Entry", "intern": "Entry",
+    "l1": "Entry", "l2": "Entry", "l3": "Entry",
+    "mid": "Mid", "intermediate": "Mid", "l4": "Mid",
+    "senior": "Senior", "sr": "Senior", "staff": "Senior", "principal": "Senior", "lead": "Senior",
+    "l5": "Senior", "l6": "Senior", "l7": "Senior",
+}
+
+
+# ============================================
+# COLUMN MAPPING
+# ============================================
+
+def resolve_mapping(header: list[str], explicit: dict) -> dict[str, int | None]:
+    """TARGET column -> source column index (None = fill with default)."""
+    lowered = {h.strip().lower(): i for i, h in enumerate(header)}
+    mapping = {}
+    for target in TARGET_COLUMNS:
+        source = explicit.get(target)
+        if source is not None:
+            if source.strip().lower() not in lowered:
+                raise ValueError(f"column '{source}' (for {target}) not in header")
+            mapping[target] = lowered[source.strip().lower()]
+        else:
+            mapping[target] = next((lowered[a] for a in _ALIASES[target] if a in lowered), None)
+    for required in ("JOB_TITLE", "ANNUAL_SALARY", "GENDER"):
+        if mapping[required] is None:
+            raise ValueError(f"no source column for {required}; pass --map {required}=<column>")
+    return mapping
+
+
+# ============================================
+# VECTORIZED CLEANING
+# ============================================
+
+def _column(rows: list[list[str]], index: int | None, default: str) -> np.ndarray:
+    if index is None:
+        return np.full(len(rows), default, dtype=object)
+    return np.array([r[index] if index < len(r) else "" for r in rows], dtype=object)
+
+
+def _parse_salaries(raw: np.ndarray) -> np.ndarray:
+    """'$120,000' -> 120000.0; unparseable -> nan."""
+    cleaned = np.char.strip(np.char.replace(np.char.replace(raw.astype(str), "$", ""), ",", ""))
+    cleaned = np.where(cleaned == "", "nan", cleaned)
+    try:
+        return cleaned.astype(np.float64)
+    except ValueError:
+        out = np.empty(len(cleaned))
+        for i, v in enumerate(cleaned):
+            try:
+                out[i] = float(v)
+            except ValueError:
+                out[i] = np.nan
+        return out
+
+
+def _lookup(values: np.ndarray, table: dict, default) -> np.ndarray:
+    """Vectorized dict lookup on the unique values only."""
+    uniques, inverse = np.unique(np.char.lower(np.char.strip(values.astype(str))), return_inverse=True)
+    mapped = np.array([table.get(u, default) for u in uniques], dtype=object)
+    return mapped[inverse]
+
+
+class TitleStats:
+    """Per-title count / sum / sum-of-squares of log salary, merged chunk by chunk."""
+
+    def __init__(self, state: dict = None):
+        self.stats = {k: list(v) for k, v in (state or {}).items()}
+
+    def zscores(self, keys: np.ndarray, log_salary: np.ndarray, min_count: int) -> np.ndarray:
+        uniques, inverse = np.unique(keys, return_inverse=True)
+        mean = np.zeros(len(uniques))
+        std = np.full(len(uniques), np.inf)
+        for i, k in enumerate(uniques):
+            n, s, ss = self.stats.get(k, (0, 0.0, 0.0))
+            if n >= min_count:
+                mean[i] = s / n
+                std[i] = max(np.sqrt(max(ss / n - mean[i] ** 2, 0.0)), 1e-9)
+        return np.abs(log_salary - mean[inverse]) / std[inverse]
+
+    def update(self, keys: np.ndarray, log_salary: np.ndarray) -> None:
+        uniques, inverse = np.unique(keys, return_inverse=True)
+        counts = np.bincount(inverse, minlength=len(uniques))
+        sums = np.bincount(inverse, weights=log_salary, minlength=len(uniques))
+        sumsq = np.bincount(inverse, weights=log_salary ** 2, minlength=len(uniques))
+        for i, k in enumerate(uniques):
+            n, s, ss = self.stats.get(k, (0, 0.0, 0.0))
+            self.stats[k] = [n + int(counts[i]), s + float(sums[i]), ss + float(sumsq[i])]
+
+
+def clean_chunk(rows: list[list[str]], mapping: dict, opts: dict, title_stats: TitleStats) -> tuple[list, dict]:
+    """Validate + normalize one chunk. Returns (SALARIES rows, rejection counts)."""
+    titles = np.array([" ".join(t.split()) for t in _column(rows, mapping["JOB_TITLE"], "")], dtype=object)
+    salary = _parse_salaries(_column(rows, mapping["ANNUAL_SALARY"], ""))
+    salary = np.where(salary < opts["hourly_below"], salary * 2080, salary)  # hourly wage -> annual
+    gender = _lookup(_column(rows, mapping["GENDER"], ""), _GENDERS, None)
+    level = _lookup(_column(rows, mapping["EXPERIENCE_LEVEL"], "Unspecified"), _LEVELS, "Unspecified")
+    location = _column(rows, mapping["LOCATION"], "Unspecified")
+    company = _column(rows, mapping["COMPANY_TYPE"], opts["company_type"])
+
+    reasons = {
+        "missing_title": titles == "",
+        "bad_salary": ~np.isfinite(salary),
+        "salary_out_of_range": np.isfinite(salary) & ((salary < opts["min_salary"]) | (salary > opts["max_salary"])),
+        "unknown_gender": gender == None,  # noqa: E711 (elementwise on object array)
+    }
+    keep = ~np.logical_or.reduce(list(reasons.values()))
+    counts = {k: int(v.sum()) for k, v in reasons.items()}
+
+    # Robust-ish outlier filter: |z| of log salary against the running per-title stats
+    keys = np.array([normalize_title(t) for t in titles[keep]], dtype=object)
+    log_salary = np.log(salary[keep])
+    z = title_stats.zscores(keys, log_salary, opts["outlier_min_count"])
+    inlier = z <= opts["outlier_z"]
+    counts["outlier"] = int((~inlier).sum())
+    title_stats.update(keys[inlier], log_salary[inlier])
+
+    idx = np.flatnonzero(keep)[inlier]
+    out = list(zip(
+        titles[idx].tolist(),
+        np.floor(salary[idx] + 0.5).astype(np.int64).tolist(),
+        level[idx].tolist(),
+        gender[idx].tolist(),
+        [" ".join(str(v).split()) or "Unspecified" for v in location[idx]],
+        [" ".join(str(v).split()) or opts["company_type"] for v in company[idx]],
+    ))
+    return out, counts
+
+
+# ============================================
+# LOADING
+# ============================================
+
+def _load(rows: list, batch_rows: int, stage: bool) -> None:
+    backend = get_backend()
+    if stage and hasattr(backend, "stage_csv"):
+        # One gzip CSV per chunk -> PUT to the table stage -> COPY INTO
+        fd, path = tempfile.mkstemp(suffix=".csv.gz")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerows(rows)
+            backend.stage_csv(path)
+        finally:
+            os.remove(path)
+        _invalidate(rows)
+        return
+    for start in range(0, len(rows), batch_rows):
+        backend.insert_rows(rows[start:start + batch_rows])
+    _invalidate(rows)
+
+
+def _invalidate(rows: list) -> None:
+    """Drop shared cached aggregates for the loaded titles (app nodes' L1 copies expire by TTL)."""
+    for role in {row[0] for row in rows}:
+        invalidate_role(role)
+
+
+# ============================================
+# CHECKPOINTS
+# ============================================
+
+def _read_checkpoint(path: str, source: str) -> dict | None:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        state = json.load(f)
+    st = os.stat(source)
+    if state.get("source_size") != st.st_size or state.get("source_mtime") != int(st.st_mtime):
+        raise SystemExit(f"{path} belongs to a different version of {source}; delete it to restart")
+    return state
+
+
+def _write_checkpoint(path: str, state: dict) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)  # atomic: a crash never leaves a half-written checkpoint
+
+
+# ============================================
+# PIPELINE
+# ============================================
+
+def ingest_file(source: str, explicit_map: dict = None, chunk_rows: int = 200_000,
+                batch_rows: int = 16_384, stage: bool = False, checkpoint: str = None,
+                opts: dict = None, log=print) -> dict:
+    """
+    Stream `source` into SALARIES. Rows are loaded at least once: a crash between
+    a chunk's load and its checkpoint re-sends that chunk on resume.
+    Quoted fields must not contain newlines (chunks are split on line boundaries).
+    """
+    opts = {
+        "min_salary": 15_000, "max_salary": 2_000_000, "hourly_below": 500,
+        "outlier_z": 4.0, "outlier_min_count": 50, "company_type": "External",
+        **(opts or {}),
+    }
+    checkpoint = checkpoint or f"{source}.ingest.json"
+    st = os.stat(source)
+
+    with open(source, "rb") as f:
+        header = next(csv.reader([f.readline().decode("utf-8-sig")]))
+        mapping = resolve_mapping(header, explicit_map or {})
+
+        state = _read_checkpoint(checkpoint, source) or {
+            "source_size": st.st_size, "source_mtime": int(st.st_mtime),
+            "offset": f.tell(), "rows_read": 0, "rows_loaded": 0, "rejected": {}, "title_stats": {},
+        }
+        f.seek(state["offset"])
+        title_stats = TitleStats(state["title_stats"])
+        if state["rows_read"]:
+            log(f"Resuming at row {state['rows_read']:,} (byte {state['offset']:,})")
+
+        start = time.perf_counter()
+        session_rows = 0
+        while True:
+            lines = f.readlines(chunk_rows * 64)  # ~bounded by bytes, not rows
+            if not lines:
+                break
+            rows = [r for r in csv.reader(io.StringIO(b"".join(lines).decode("utf-8"))) if r]
+            cleaned, rejected = clean_chunk(rows, mapping, opts, title_stats)
+            if cleaned:
+                _load(cleaned, batch_rows, stage)
+
+            state["offset"] = f.tell()
+            state["rows_read"] += len(rows)
+            state["rows_loaded"] += len(cleaned)
+            for k, v in rejected.items():
+                state["rejected"][k] = state["rejected"].get(k, 0) + v
+            state["title_stats"] = title_stats.stats
+            _write_checkpoint(checkpoint, state)
+
+            session_rows += len(rows)
+            elapsed = max(time.perf_counter() - start, 1e-9)
+            log(f"{state['rows_read']:,} read, {state['rows_loaded']:,} loaded "
+                f"({session_rows / elapsed:,.0f} rows/s, {state['offset'] / st.st_size:.0%})")
+
+    state["done"] = True
+    _write_checkpoint(checkpoint, state)
+    return state
+
+
+def _parse_map(pairs: list[str]) -> dict:
+    out = {}
+    for pair in pairs or []:
+        target, _, source = pair.partition("=")
+        target = target.strip().upper()
+        if target not in TARGET_COLUMNS or not source:
+            raise SystemExit(f"bad --map '{pair}'; expected one of {', '.join(TARGET_COLUMNS)}=<column>")
+        out[target] = source
+    return out
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Stream a salary CSV into SALARIES.")
+    parser.add_argument("source")
+    parser.add_argument("--map", action="append", metavar="TARGET=column",
+                        help="map a SALARIES column to a CSV header (repeatable)")
+    parser.add_argument("--chunk-rows", type=int, default=200_000)
+    parser.add_argument("--batch-rows", type=int, default=16_384, help="rows per executemany")
+    parser.add_argument("--stage", action="store_true", help="Snowflake: PUT + COPY INTO per chunk")
+    parser.add_argument("--checkpoint", default=None)
+    parser.add_argument("--min-salary", type=float, default=15_000)
+    parser.add_argument("--max-salary", type=float, default=2_000_000)
+    parser.add_argument("--hourly-below", type=float, default=500, help="values below are hourly (x2080)")
+    parser.add_argument("--outlier-z", type=float, default=4.0)
+    parser.add_argument("--company-type", default="External")
+    args = parser.parse_args(argv)
+
+    state = ingest_file(
+        args.source, _parse_map(args.map), args.chunk_rows, args.batch_rows, args.stage, args.checkpoint,
+        {"min_salary": args.min_salary, "max_salary": args.max_salary, "hourly_below": args.hourly_below,
+         "outlier_z": args.outlier_z, "company_type": args.company_type},
+        log=lambda msg: print(msg, file=sys.stderr),
+    )
+    print(json.dumps({k: state[k] for k in ("rows_read", "rows_loaded", "rejected")}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
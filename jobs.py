@@ -0,0 +1,192 @@
+# jobs.py
+"""
+InnovateHer 2026 - The Equity Gap: Background Jobs
+Long work (a live Nessie simulation can take ~25s) runs off the request path:
+submit() returns a job id at once, a bounded worker pool runs the handler, and
+clients poll get() or follow events() (served as SSE). Finished jobs are kept
+for a retention window, then dropped.
+
+The JobStore interface is the seam for a multi-node queue: the in-process
+MemoryJobStore is the default (JOB_STORE=memory); a shared store implements the
+same methods and runs its own workers.
+Exposes: register(kind, handler), submit(kind, params), get(job_id), events(job_id, after)
+"""
+
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+_MAX_QUEUED = int(os.getenv("JOB_MAX_QUEUED", "100"))
+_RETENTION_SECONDS = float(os.getenv("JOB_RETENTION_SECONDS", "600"))
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+_FINISHED = (DONE, FAILED)
+
+
+class JobQueueFull(RuntimeError):
+    """Too many unfinished jobs; retry later."""
+
+
+class UnknownJobType(ValueError):
+    pass
+
+
+# ============================================
+# HANDLERS
+# ============================================
+
+# kind -> handler(params, progress) -> result dict; progress(dict) emits an event
+_handlers: dict = {}
+
+
+def register(kind: str, handler) -> None:
+    _handlers[kind] = handler
+
+
+# ============================================
+# STORES
+# ============================================
+
+class JobStore:
+    """Where jobs, their progress events and results live."""
+
+    def submit(self, kind: str, params: dict) -> str:
+        raise NotImplementedError
+
+    def get(self, job_id: str) -> dict | None:
+        """Public job view (status, progress, result/error), or None when unknown/expired."""
+        raise NotImplementedError
+
+    def events(self, job_id: str, after: int = 0, timeout: float = 15.0) -> list[dict] | None:
+        """Events with id > after, waiting up to timeout for new ones; None when unknown."""
+        raise NotImplementedError
+
+
+class _Job:
+    __slots__ = ("id", "kind", "params", "status", "result", "error", "events",
+                 "created", "finished")
+
+    def __init__(self, kind: str, params: dict):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.params = params
+        self.status = QUEUED
+        self.result = None
+        self.error = None
+        self.events: list[dict] = []
+        self.created = time.time()
+        self.finished = None
+
+
+class MemoryJobStore(JobStore):
+    """Single-process store: a dict of jobs, one Condition for waiters, a worker pool."""
+
+    def __init__(self, workers: int = _WORKERS, max_queued: int = _MAX_QUEUED,
+                 retention: float = _RETENTION_SECONDS):
+        self.max_queued = max_queued
+        self.retention = retention
+        self._jobs: dict[str, _Job] = {}
+        self._cond = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job")
+
+    # --------------------------------------------
+    def submit(self, kind: str, params: dict) -> str:
+        if kind not in _handlers:
+            raise UnknownJobType(f"unknown job type: {kind}")
+        job = _Job(kind, params)
+        with self._cond:
+            self._expire()
+            if sum(j.status not in _FINISHED for j in self._jobs.values()) >= self.max_queued:
+                raise JobQueueFull()
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job)
+        return job.id
+
+    def get(self, job_id: str) -> dict | None:
+        with self._cond:
+            self._expire()
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            return {
+                "job_id": job.id,
+                "type": job.kind,
+                "status": job.status,
+                "progress": next((e["data"] for e in reversed(job.events) if e["event"] == "progress"), None),
+                "result": job.result,
+                "error": job.error,
+                "created": job.created,
+                "finished": job.finished,
+            }
+
+    def events(self, job_id: str, after: int = 0, timeout: float = 15.0) -> list[dict] | None:
+        after = max(0, after)  # a negative offset would always look like news
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    return None
+                if len(job.events) > after or job.status in _FINISHED:
+                    return job.events[after:]
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+                self._cond.wait(remaining)
+
+    # --------------------------------------------
+    def _emit(self, job: _Job, event: str, data: dict, status: str = None) -> None:
+        """Append an event; a final status is set in the same step so waiters never miss it."""
+        with self._cond:
+            job.events.append({"id": len(job.events) + 1, "event": event, "data": data})
+            if status is not None:
+                job.status, job.finished = status, time.time()
+            self._cond.notify_all()
+
+    def _run(self, job: _Job) -> None:
+        with self._cond:
+            job.status = RUNNING
+        try:
+            result = _handlers[job.kind](job.params, lambda data: self._emit(job, "progress", data))
+        except Exception as e:
+            job.error = str(e) or type(e).__name__
+            self._emit(job, "error", {"error": job.error}, status=FAILED)
+            return
+        job.result = result
+        self._emit(job, "done", result, status=DONE)
+
+    def _expire(self) -> None:
+        """Drop finished jobs past the retention window (caller holds the lock)."""
+        cutoff = time.time() - self.retention
+        for job_id in [j.id for j in self._jobs.values() if j.finished and j.finished < cutoff]:
+            del self._jobs[job_id]
+
+
+# ============================================
+# PUBLIC API
+# ============================================
+
+def _resolve_store() -> JobStore:
+    choice = os.getenv("JOB_STORE", "memory").strip().lower()
+    if choice == "memory":
+        return MemoryJobStore()
+    raise ValueError(f"Unknown JOB_STORE: {choice}")
+
+
+_store = _resolve_store()
+
+
+def submit(kind: str, params: dict) -> str:
+    """Queue a job; raises UnknownJobType or JobQueueFull."""
+    return _store.submit(kind, params)
+
+
+def get(job_id: str) -> dict | None:
+    return _store.get(job_id)
+
+
+def events(job_id: str, after: int = 0, timeout: float = 15.0) -> list[dict] | None:
+    return _store.events(job_id, after, timeout)
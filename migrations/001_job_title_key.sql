@@ -0,0 +1,32 @@
+-- =============================================
+-- Migration 001: normalized, clustered JOB_TITLE_KEY
+--
+-- Adds SALARIES.JOB_TITLE_KEY (salary_backend.normalize_title: trimmed,
+-- single-spaced, upper-case), backfills it, and clusters the table on
+-- (JOB_TITLE_KEY, GENDER) so benchmark lookups prune micro-partitions.
+--
+-- Run ONCE, in Snowflake Worksheets, BEFORE deploying an app version that
+-- queries JOB_TITLE_KEY (until then its benchmark queries fail and the API
+-- serves its fallback numbers). Safe to re-run.
+-- Check the effect with: python benchmarks/bench_pruning.py
+-- =============================================
+
+USE DATABASE HACKATHON_DB;
+USE SCHEMA PUBLIC;
+
+ALTER TABLE SALARIES ADD COLUMN IF NOT EXISTS JOB_TITLE_KEY STRING;
+
+-- Same normalization as the app (whitespace runs collapse to one space)
+UPDATE SALARIES
+SET JOB_TITLE_KEY = UPPER(TRIM(REGEXP_REPLACE(JOB_TITLE, '\\s+', ' ')))
+WHERE JOB_TITLE_KEY IS NULL
+   OR JOB_TITLE_KEY <> UPPER(TRIM(REGEXP_REPLACE(JOB_TITLE, '\\s+', ' ')));
+
+-- Automatic Clustering reorganizes existing micro-partitions in the background
+ALTER TABLE SALARIES CLUSTER BY (JOB_TITLE_KEY, GENDER);
+
+-- Optional (Enterprise edition): point lookups on the key without waiting for reclustering
+-- ALTER TABLE SALARIES ADD SEARCH OPTIMIZATION ON EQUALITY(JOB_TITLE_KEY);
+
+-- Clustering health: average_depth should fall toward 1 as reclustering catches up
+SELECT SYSTEM$CLUSTERING_INFORMATION('SALARIES', '(JOB_TITLE_KEY, GENDER)');
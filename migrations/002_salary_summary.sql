@@ -0,0 +1,38 @@
+-- =============================================
+-- Migration 002: SALARY_SUMMARY dynamic table
+--
+-- Pre-aggregates SALARIES into sum / count / min / max per role, level,
+-- location, company type and gender. Benchmark lookups read a role's few
+-- hundred summary rows instead of aggregating raw rows on every request.
+-- Snowflake refreshes it incrementally within TARGET_LAG of each write; keep
+-- SALARY_SUMMARY_LAG_SECONDS in the app's environment in line with it.
+--
+-- Requires 001_job_title_key.sql. Run BEFORE deploying an app version that
+-- reads SALARY_SUMMARY. Safe to re-run (recreates the table from SALARIES).
+-- =============================================
+
+USE DATABASE HACKATHON_DB;
+USE SCHEMA PUBLIC;
+
+CREATE OR REPLACE DYNAMIC TABLE SALARY_SUMMARY
+    TARGET_LAG = '1 minute'
+    WAREHOUSE = COMPUTE_WH
+    REFRESH_MODE = INCREMENTAL
+    CLUSTER BY (JOB_TITLE_KEY)
+AS
+SELECT
+    JOB_TITLE_KEY,
+    EXPERIENCE_LEVEL,
+    LOCATION,
+    COMPANY_TYPE,
+    GENDER,
+    SUM(ANNUAL_SALARY)   AS SALARY_SUM,
+    COUNT(ANNUAL_SALARY) AS SALARY_COUNT,
+    MIN(ANNUAL_SALARY)   AS SALARY_MIN,
+    MAX(ANNUAL_SALARY)   AS SALARY_MAX
+FROM SALARIES
+GROUP BY JOB_TITLE_KEY, EXPERIENCE_LEVEL, LOCATION, COMPANY_TYPE, GENDER;
+
+-- Refresh mode actually chosen (INCREMENTAL expected) and refresh history
+SHOW DYNAMIC TABLES LIKE 'SALARY_SUMMARY';
+SELECT * FROM TABLE(INFORMATION_SCHEMA.DYNAMIC_TABLE_REFRESH_HISTORY(NAME => 'SALARY_SUMMARY')) LIMIT 10;
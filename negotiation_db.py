@@ -2,11 +2,16 @@
 """
 InnovateHer 2026 - The Equity Gap: Negotiation Knowledge Base
 Bulletproof MongoDB-backed tip retrieval with hardcoded fallbacks.
-Exposes ONE function: get_tip(context: dict) -> str
+Tip lists per category are kept in the shared two-tier cache (TIPS_CACHE_VERSION).
+Exposes: get_tip(context: dict) -> str, warm_tips(category) for speculative prefetch
 """
 
 import os
 import random
+import time
+
+import query_ledger
+from deadline import timeout_for
 
 # ============================================
 # HARDCODED FALLBACK TIPS (always available)
@@ -76,30 +81,67 @@ def _classify_message(message: str) -> str:
 # MONGODB (optional, graceful degradation)
 # ============================================
 
+_MONGO_WAIT_SECONDS = float(os.getenv("MONGO_TIP_TIMEOUT", "4"))
+
+
+def _tip_cache():
+    from cache import get_cache
+
+    return get_cache(
+        "tips",
+        version=os.getenv("TIPS_CACHE_VERSION", "tips-1"),
+        l1_ttl=300,
+        l2_ttl=float(os.getenv("TIPS_CACHE_SECONDS", "3600")),
+    )
+
+
+def _fetch_tips_from_mongo(mongo_uri: str, category: str) -> list[dict]:
+    from pymongo import MongoClient
+
+    db_name = os.getenv("DATABASE_NAME", "negotiation_db")
+    coll_name = os.getenv("COLLECTION_NAME", "negotiation_tips")
+
+    # Selection and the query itself both fit inside the request budget
+    budget_ms = max(1, int(timeout_for(3.0) * 1000))
+    client = MongoClient(
+        mongo_uri,
+        serverSelectionTimeoutMS=budget_ms,
+        connectTimeoutMS=budget_ms,
+        socketTimeoutMS=budget_ms,
+    )
+    try:
+        query = {"category": category} if category != "general" else {}
+        statement = query_ledger.mongo_statement(coll_name, "find", query)
+        start = time.perf_counter()
+        try:
+            cursor = client[db_name][coll_name].find(query, {"_id": 0, "tip": 1, "source": 1})
+            tips = list(cursor.max_time_ms(budget_ms))
+        except Exception as e:
+            query_ledger.record("mongo", statement, len(query), (time.perf_counter() - start) * 1000, 0,
+                                error=type(e).__name__)
+            raise
+        query_ledger.record("mongo", statement, len(query), (time.perf_counter() - start) * 1000, len(tips))
+        return tips
+    finally:
+        client.close()
+
 def _try_get_tip_from_mongo(context: dict) -> str | None:
     """Attempt to fetch a tip from MongoDB. Returns None on any failure."""
     try:
-        from pymongo import MongoClient
-
         mongo_uri = os.getenv("MONGO_URI", "")
         if not mongo_uri:
             return None
 
-        db_name = os.getenv("DATABASE_NAME", "negotiation_db")
-        coll_name = os.getenv("COLLECTION_NAME", "negotiation_tips")
-
-        client = MongoClient(mongo_uri, serverSelectionTimeoutMS=3000)
-
-        db = client[db_name]
-        collection = db[coll_name]
-
         # Build query from context
         message = context.get("message", "")
         category = _classify_message(message)
 
-        query = {"category": category} if category != "general" else {}
-        tips = list(collection.find(query, {"_id": 0, "tip": 1, "source": 1}))
-        client.close()
+        # One Mongo round trip per category per cache TTL, shared across nodes
+        tips = _tip_cache().get_or_set(
+            category,
+            lambda: _fetch_tips_from_mongo(mongo_uri, category),
+            should_cache=bool,
+        )
 
         if tips:
             chosen = random.choice(tips)
@@ -131,8 +173,12 @@ def get_tip(context: dict) -> str:
     if not isinstance(context, dict):
         context = {}
 
-    # Try MongoDB first
-    mongo_tip = _try_get_tip_from_mongo(context)
+    # Try MongoDB first, inside its bulkhead; a saturated or slow pool means fallback tips
+    try:
+        from bulkhead import get_bulkhead
+        mongo_tip = get_bulkhead("mongo").call(_try_get_tip_from_mongo, context, timeout=_MONGO_WAIT_SECONDS)
+    except Exception:
+        mongo_tip = None
     if mongo_tip:
         return mongo_tip
 
@@ -141,3 +187,20 @@ def get_tip(context: dict) -> str:
     category = _classify_message(message) if message else "general"
     tips = _FALLBACK_TIPS.get(category, _FALLBACK_TIPS["general"])
     return random.choice(tips)
+
+
+def warm_tips(category: str) -> bool:
+    """
+    Load category's Mongo tips into the shared tip cache ahead of a likely chat.
+    Runs on the caller's (prefetch) thread, not the mongo bulkhead, so it never
+    takes a slot from a foreground request. True when tips are cached.
+    """
+    mongo_uri = os.getenv("MONGO_URI", "")
+    if not mongo_uri:
+        return False
+    tips = _tip_cache().get_or_set(
+        category,
+        lambda: _fetch_tips_from_mongo(mongo_uri, category),
+        should_cache=bool,
+    )
+    return bool(tips)
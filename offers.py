@@ -0,0 +1,196 @@
+# offers.py
+"""
+InnovateHer 2026 - The Equity Gap: Offer Comparison
+Compares whole offer packages (base, target bonus, signing bonus, equity grant
+with vesting and cliff, 401(k) match, raise rate) rather than a single salary
+gap. Year-by-year cash flows for every offer are built as one NumPy matrix, and
+NPV for every horizon x discount rate comes out of a single broadcast + cumsum.
+Exposes: parse_offers(raw), parse_grid(raw), compare_offers(offers, horizons, rates, discount_rate)
+"""
+
+import numpy as np
+
+# Same economic assumptions as gender_engine.compute_lifetime_impact
+_ANNUAL_RAISE = 0.03
+_EMPLOYER_401K_MATCH = 0.04
+
+MAX_OFFERS = 10
+MAX_YEARS = 40
+DEFAULT_HORIZONS = (1, 2, 4, 10)
+DEFAULT_RATES = (0.0, 0.03, 0.05, 0.08)
+DEFAULT_DISCOUNT_RATE = 0.05
+
+
+# ============================================
+# INPUT NORMALIZATION
+# ============================================
+
+def _number(raw: dict, key: str, default: float, low: float, high: float) -> float:
+    value = raw.get(key, default)
+    try:
+        value = float(default if value in (None, "") else value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{key} must be a number")
+    if not low <= value <= high:
+        raise ValueError(f"{key} must be between {low:g} and {high:g}")
+    return value
+
+
+def parse_offers(raw) -> list[dict]:
+    """
+    Validate offer packages. Each offer has:
+    - name (default "Offer A", "Offer B", ...) and base (annual salary, required)
+    - bonus_percent: annual target bonus as % of base
+    - signing_bonus: one-time cash at signing (year 0)
+    - equity: {grant_value, vesting_years (4), cliff_months (12), annual_growth_percent (0)}
+    - match_percent: employer 401(k) match as % of base (4)
+    - raise_percent: annual raise (3)
+    Percentages are given as percents (10 = 10%). Invalid entries raise ValueError.
+    """
+    if not isinstance(raw, list) or not 2 <= len(raw) <= MAX_OFFERS:
+        raise ValueError(f"offers must be a list of 2 to {MAX_OFFERS} packages")
+
+    offers = []
+    for i, item in enumerate(raw):
+        if not isinstance(item, dict):
+            raise ValueError("each offer must be an object")
+        if item.get("base") in (None, ""):
+            raise ValueError("each offer needs a base salary")
+        equity = item.get("equity") or {}
+        if not isinstance(equity, dict):
+            raise ValueError("equity must be an object")
+        offers.append({
+            "name": " ".join(str(item.get("name") or f"Offer {chr(65 + i)}").split())[:60],
+            "base": _number(item, "base", 0, 0, 10_000_000),
+            "bonus_percent": _number(item, "bonus_percent", 0, 0, 200),
+            "signing_bonus": _number(item, "signing_bonus", 0, 0, 10_000_000),
+            "match_percent": _number(item, "match_percent", _EMPLOYER_401K_MATCH * 100, 0, 50),
+            "raise_percent": _number(item, "raise_percent", _ANNUAL_RAISE * 100, -50, 100),
+            "equity_value": _number(equity, "grant_value", 0, 0, 100_000_000),
+            "vesting_years": _number(equity, "vesting_years", 4, 1, 10),
+            "cliff_months": _number(equity, "cliff_months", 12, 0, 60),
+            "equity_growth_percent": _number(equity, "annual_growth_percent", 0, -90, 200),
+        })
+    return offers
+
+
+def parse_grid(raw: dict) -> tuple[list[int], list[float], float]:
+    """(horizons in years, discount rates as fractions, headline rate) with defaults."""
+    horizons = raw.get("horizons") or list(DEFAULT_HORIZONS)
+    rates = raw.get("discount_rates") or list(DEFAULT_RATES)
+    if not isinstance(horizons, list) or not isinstance(rates, list) or len(horizons) > 10 or len(rates) > 10:
+        raise ValueError("horizons and discount_rates must be lists of at most 10 values")
+    try:
+        horizons = sorted({int(h) for h in horizons})
+        rates = sorted({float(r) for r in rates})
+        headline = float(raw.get("discount_rate", DEFAULT_DISCOUNT_RATE))
+    except (TypeError, ValueError):
+        raise ValueError("horizons and discount rates must be numbers")
+    if not all(1 <= h <= MAX_YEARS for h in horizons):
+        raise ValueError(f"horizons must be between 1 and {MAX_YEARS} years")
+    if not all(0 <= r < 1 for r in rates + [headline]):
+        raise ValueError("discount rates are fractions between 0 and 1 (0.05 = 5%)")
+    if headline not in rates:
+        rates = sorted(rates + [headline])
+    return horizons, rates, headline
+
+
+# ============================================
+# ENGINE
+# ============================================
+
+def _cash_flows(offers: list[dict], years: int) -> dict:
+    """Component matrices [offer][year 0..years] (year 0 = signing)."""
+    col = lambda key: np.array([o[key] for o in offers], dtype=np.float64)[:, None]
+    year = np.arange(years + 1, dtype=np.float64)[None, :]
+    paid = year >= 1
+
+    salary = np.where(paid, col("base") * (1 + col("raise_percent") / 100) ** (year - 1), 0.0)
+    bonus = salary * col("bonus_percent") / 100
+    match = salary * col("match_percent") / 100
+    signing = np.where(year == 0, col("signing_bonus"), 0.0)
+
+    # Share vested by the end of each year: nothing before the cliff, then linear by month
+    months = year * 12
+    vest_months = col("vesting_years") * 12
+    vested = np.where(months >= col("cliff_months"), np.minimum(1.0, months / vest_months), 0.0)
+    vesting = np.diff(vested, axis=1, prepend=0.0)
+    equity = col("equity_value") * vesting * (1 + col("equity_growth_percent") / 100) ** year
+
+    return {"salary": salary, "bonus": bonus, "match": match, "signing": signing, "equity": equity}
+
+
+def _breakevens(cumulative: np.ndarray, names: list[str]) -> list[dict]:
+    """
+    Pairs where one offer starts behind another but ends ahead: the year it
+    overtakes for good (cumulative value never falls behind again).
+    """
+    diff = cumulative[:, None, :] - cumulative[None, :, :]    # [a][b][year]
+    behind = diff < 0
+    ever_behind = behind.any(axis=-1)
+    ends_ahead = diff[:, :, -1] > 0
+    last_behind = behind.shape[-1] - 1 - np.argmax(behind[:, :, ::-1], axis=-1)
+    out = []
+    for a, b in zip(*np.nonzero(ever_behind & ends_ahead)):
+        out.append({"offer": names[a], "overtakes": names[b], "year": int(last_behind[a, b] + 1)})
+    out.sort(key=lambda item: (item["year"], item["offer"], item["overtakes"]))
+    return out
+
+
+def compare_offers(offers: list[dict], horizons: list[int], rates: list[float],
+                   discount_rate: float = DEFAULT_DISCOUNT_RATE) -> dict:
+    """
+    Cash flows and NPV for every offer. npv[o][r][h] is offer o's value at
+    discount_rates[r] over horizons[h] years (signing bonus undiscounted,
+    year-y pay discounted by (1 + r)^y). rankings and breakevens use the
+    headline discount_rate.
+    """
+    years = max(horizons)
+    names = [o["name"] for o in offers]
+    parts = _cash_flows(offers, years)
+    flows = sum(parts.values())                                      # [offer][year]
+
+    year = np.arange(years + 1, dtype=np.float64)
+    discount = (1 + np.asarray(rates, dtype=np.float64))[:, None] ** -year  # [rate][year]
+    cumulative = np.cumsum(flows[:, None, :] * discount[None, :, :], axis=-1)  # [offer][rate][year]
+    npv = cumulative[:, :, horizons]                                 # [offer][rate][horizon]
+
+    headline = rates.index(discount_rate)
+    rankings = {}
+    for h, horizon in enumerate(horizons):
+        order = np.argsort(-npv[:, headline, h], kind="stable")
+        rankings[str(horizon)] = [names[i] for i in order]
+
+    breakevens = _breakevens(cumulative[:, headline, :], names)
+    best = rankings[str(years)][0]
+    return {
+        "horizons": horizons,
+        "discount_rates": rates,
+        "discount_rate": discount_rate,
+        "offers": [
+            {
+                "name": name,
+                "cash_flows": np.rint(flows[i]).astype(np.int64).tolist(),
+                **{k: np.rint(v[i]).astype(np.int64).tolist() for k, v in parts.items()},
+                "npv": np.rint(npv[i]).astype(np.int64).tolist(),
+            }
+            for i, name in enumerate(names)
+        ],
+        "rankings": rankings,
+        "breakevens": breakevens,
+        "best": best,
+        "message": _summary(names, npv[:, headline, -1], best, years, discount_rate, breakevens),
+    }
+
+
+def _summary(names, values, best, years, rate, breakevens) -> str:
+    order = np.argsort(-values, kind="stable")
+    lead = int(round(values[order[0]] - values[order[1]]))
+    text = (
+        f"Over {years} year{'s' if years != 1 else ''} at a {rate * 100:g}% discount rate, "
+        f"{best} is worth ${lead:,} more than {names[order[1]]} in today's dollars."
+    )
+    catch_up = next((b for b in breakevens if b["offer"] == best), None)
+    if catch_up:
+        text += f" {catch_up['overtakes']} pays more early on; {best} overtakes it in year {catch_up['year']}."
+    return text
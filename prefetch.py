@@ -0,0 +1,186 @@
+# prefetch.py
+"""
+InnovateHer 2026 - The Equity Gap: Speculative Prefetch
+After a request whose follow-ups are predictable (a gap-check is usually
+followed by /api/chat and /api/lifetime for the same role), routes schedule a
+job: a few named steps that warm caches in the background.
+
+Prefetch only uses capacity the foreground is not using:
+- one small pool (PREFETCH_WORKERS, niced where the OS allows) with a bounded
+  queue; a full queue or more than PREFETCH_MAX_FOREGROUND in-flight requests
+  means the job is simply not scheduled
+- one job per key: a pending job for the same role is not duplicated
+- jobs are cancellable (cancel(key), cancel_all()); a running job checks
+  between steps, and gives up when cancelled or when foreground load rises
+- every step runs under its own PREFETCH_BUDGET_SECONDS deadline
+Exposes: schedule(key, steps), cancel(key), cancel_all(), foreground_started(),
+         foreground_finished(), stats()
+"""
+
+import contextvars
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from deadline import budget
+
+_ENABLED = os.getenv("PREFETCH", "1") != "0"
+_WORKERS = max(1, int(os.getenv("PREFETCH_WORKERS", "1")))
+_QUEUE = max(0, int(os.getenv("PREFETCH_QUEUE", "8")))
+_MAX_FOREGROUND = int(os.getenv("PREFETCH_MAX_FOREGROUND", "8"))
+_BUDGET = float(os.getenv("PREFETCH_BUDGET_SECONDS", "5"))
+_NICE = 10
+
+
+# ============================================
+# FOREGROUND LOAD
+# ============================================
+
+_foreground = 0
+_foreground_lock = threading.Lock()
+
+
+def foreground_started() -> None:
+    """A foreground request began; past the limit, queued prefetch jobs are dropped."""
+    global _foreground
+    with _foreground_lock:
+        _foreground += 1
+        busy = _foreground > _MAX_FOREGROUND
+    if busy:
+        _shed()
+
+
+def foreground_finished() -> None:
+    global _foreground
+    with _foreground_lock:
+        _foreground = max(0, _foreground - 1)
+
+
+def _busy() -> bool:
+    return _foreground > _MAX_FOREGROUND
+
+
+# ============================================
+# POOL
+# ============================================
+
+def _lower_priority() -> None:
+    # Linux schedules threads individually: nice just this worker
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), _NICE)
+    except (AttributeError, OSError):
+        pass
+
+
+_executor = None
+_slots = threading.BoundedSemaphore(_WORKERS + _QUEUE)
+_jobs: dict[str, tuple[Future, threading.Event]] = {}
+_lock = threading.Lock()
+_metrics = {"scheduled": 0, "skipped": 0, "rejected": 0, "cancelled": 0, "abandoned": 0,
+            "completed": 0, "step_errors": 0}
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=_WORKERS, thread_name_prefix="prefetch", initializer=_lower_priority,
+                )
+    return _executor
+
+
+def _count(metric: str) -> None:
+    with _lock:
+        _metrics[metric] += 1
+
+
+def _run(key: str, steps: list, cancelled: threading.Event) -> None:
+    for _name, step in steps:
+        if cancelled.is_set():
+            _count("cancelled")
+            return
+        if _busy():
+            _count("abandoned")
+            return
+        try:
+            with budget(_BUDGET):
+                step()
+        except Exception:
+            _count("step_errors")
+    _count("completed")
+
+
+def _done(key: str, future: Future) -> None:
+    _slots.release()
+    with _lock:
+        if _jobs.get(key, (None,))[0] is future:
+            del _jobs[key]
+        if future.cancelled():
+            _metrics["cancelled"] += 1
+
+
+def schedule(key: str, steps: list) -> bool:
+    """
+    Queue steps ([(name, fn), ...], run in order) for key. Returns False when
+    prefetch is off, a job for key is already pending, the foreground is busy,
+    or the queue is full; none of these ever block the caller.
+    """
+    if not _ENABLED or not steps:
+        return False
+    if _busy() or not _slots.acquire(blocking=False):
+        _count("rejected")
+        return False
+
+    pool = _pool()
+    cancelled = threading.Event()
+    with _lock:
+        if key in _jobs:
+            _metrics["skipped"] += 1
+            _slots.release()
+            return False
+        # A fresh context: no request deadline leaks into the job
+        try:
+            future = pool.submit(contextvars.Context().run, _run, key, steps, cancelled)
+        except Exception:
+            _slots.release()
+            raise
+        _jobs[key] = (future, cancelled)
+        _metrics["scheduled"] += 1
+    future.add_done_callback(lambda f: _done(key, f))
+    return True
+
+
+def cancel(key: str) -> bool:
+    """Cancel key's job: dropped if still queued, stopped after its current step if running."""
+    with _lock:
+        job = _jobs.get(key)
+    if job is None:
+        return False
+    future, cancelled = job
+    cancelled.set()
+    future.cancel()
+    return True
+
+
+def cancel_all() -> int:
+    with _lock:
+        keys = list(_jobs)
+    return sum(cancel(key) for key in keys)
+
+
+def _shed() -> None:
+    """Drop every job that has not started yet (running ones stop at their next step)."""
+    with _lock:
+        jobs = list(_jobs.values())
+    for future, _cancelled in jobs:
+        future.cancel()
+
+
+def stats() -> dict:
+    with _lock:
+        return {
+            "enabled": _ENABLED, "workers": _WORKERS, "queue": _QUEUE,
+            "pending": len(_jobs), "foreground": _foreground, **_metrics,
+        }
@@ -0,0 +1,281 @@
+# profiling.py
+"""
+InnovateHer 2026 - The Equity Gap: Sampling Profiler
+Opt-in (PROFILING=1) statistical profiling for the running API. One background
+thread reads sys._current_frames() every few milliseconds, for just the request
+threads being profiled, or every thread while a whole-process profile runs.
+Requests are profiled 1-in-N (PROFILE_SAMPLE_RATE), by route prefix
+(PROFILE_ROUTES), or on demand with an X-Profile header carrying ADMIN_TOKEN.
+
+Output is collapsed stacks ("frame;frame;frame count"), one file per profile in
+a rotating directory, ready for flamegraph.pl / speedscope.
+Exposes: init_profiling(app), start_process_profile(seconds), stop_process_profile(),
+         list_profiles(), profile_path(name), status()
+"""
+
+import hmac
+import itertools
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+
+_ENABLED = os.getenv("PROFILING", "").strip().lower() in ("1", "true", "yes")
+_SAMPLE_RATE = int(os.getenv("PROFILE_SAMPLE_RATE", "0"))  # 1-in-N requests; 0 = off
+_ROUTES = tuple(p.strip() for p in os.getenv("PROFILE_ROUTES", "").split(",") if p.strip())
+_INTERVAL = float(os.getenv("PROFILE_INTERVAL_MS", "5")) / 1000
+_DIR = os.getenv("PROFILE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles"))
+_KEEP = int(os.getenv("PROFILE_KEEP", "50"))
+MAX_PROCESS_SECONDS = 300
+
+
+# ============================================
+# SAMPLER
+# ============================================
+
+_frame_labels: dict = {}
+
+
+def _label(code) -> str:
+    label = _frame_labels.get(code)
+    if label is None:
+        label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+        _frame_labels[code] = label
+    return label
+
+
+def _collapse(frame) -> str:
+    """Root-first stack as one collapsed line."""
+    stack = []
+    while frame is not None:
+        stack.append(_label(frame.f_code))
+        frame = frame.f_back
+    return ";".join(reversed(stack))
+
+
+class _Sampler(threading.Thread):
+    """Samples registered threads (or all threads) while there is something to profile."""
+
+    def __init__(self, interval: float):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._targets: dict[int, Counter] = {}
+        self._process: Counter | None = None
+
+    def track(self, ident: int) -> None:
+        with self._lock:
+            self._targets[ident] = Counter()
+        self._wake.set()
+
+    def untrack(self, ident: int) -> Counter | None:
+        with self._lock:
+            return self._targets.pop(ident, None)
+
+    def start_process(self) -> bool:
+        with self._lock:
+            if self._process is not None:
+                return False
+            self._process = Counter()
+        self._wake.set()
+        return True
+
+    def stop_process(self) -> Counter | None:
+        with self._lock:
+            counts, self._process = self._process, None
+            return counts
+
+    @property
+    def process_running(self) -> bool:
+        return self._process is not None
+
+    def run(self) -> None:
+        while True:
+            with self._lock:
+                idle = not self._targets and self._process is None
+            if idle:
+                self._wake.wait()
+                self._wake.clear()
+                continue
+
+            frames = sys._current_frames()
+            with self._lock:
+                for ident, counts in self._targets.items():
+                    frame = frames.get(ident)
+                    if frame is not None:
+                        counts[_collapse(frame)] += 1
+                if self._process is not None:
+                    names = {t.ident: t.name for t in threading.enumerate()}
+                    for ident, frame in frames.items():
+                        if ident != self.ident:
+                            self._process[f"{names.get(ident, ident)};{_collapse(frame)}"] += 1
+            del frames
+            time.sleep(self.interval)
+
+
+_sampler = _Sampler(_INTERVAL)
+_sampler_lock = threading.Lock()
+
+
+def _get_sampler() -> _Sampler:
+    if not _sampler.is_alive():
+        with _sampler_lock:
+            if not _sampler.is_alive():
+                _sampler.start()
+    return _sampler
+
+
+# ============================================
+# OUTPUT (rotating directory)
+# ============================================
+
+_NAME_RE = re.compile(r"^[\w.-]+\.collapsed$")
+_sequence = itertools.count(1)
+
+
+def _write(label: str, counts: Counter) -> str | None:
+    """Write one collapsed-stack file and prune the oldest beyond PROFILE_KEEP. Returns its name."""
+    if not counts:
+        return None
+    os.makedirs(_DIR, exist_ok=True)
+    slug = re.sub(r"[^\w-]+", "_", label).strip("_")[:60] or "root"
+    name = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(_sequence)}-{slug}.collapsed"
+    with open(os.path.join(_DIR, name), "w") as f:
+        f.writelines(f"{stack} {n}\n" for stack, n in counts.most_common())
+
+    files = sorted(
+        (os.path.join(_DIR, n) for n in os.listdir(_DIR) if _NAME_RE.match(n)),
+        key=os.path.getmtime,
+    )
+    for old in files[:-_KEEP] if _KEEP > 0 else []:
+        try:
+            os.remove(old)
+        except OSError:
+            pass
+    return name
+
+
+def list_profiles() -> list[dict]:
+    if not os.path.isdir(_DIR):
+        return []
+    out = []
+    for name in sorted(os.listdir(_DIR), reverse=True):
+        if _NAME_RE.match(name):
+            path = os.path.join(_DIR, name)
+            out.append({"name": name, "bytes": os.path.getsize(path), "modified": os.path.getmtime(path)})
+    return out
+
+
+def profile_path(name: str) -> str | None:
+    """Absolute path of a profile file, or None (also for anything that is not a plain file name)."""
+    if not _NAME_RE.match(name or ""):
+        return None
+    path = os.path.join(_DIR, name)
+    return path if os.path.isfile(path) else None
+
+
+# ============================================
+# WHOLE-PROCESS PROFILES (admin, time-boxed)
+# ============================================
+
+_process_timer: threading.Timer | None = None
+_process_started = None
+_process_lock = threading.Lock()
+
+
+def start_process_profile(seconds: float) -> dict:
+    """Profile every thread for up to MAX_PROCESS_SECONDS; written when it stops."""
+    global _process_timer, _process_started
+    seconds = max(1.0, min(MAX_PROCESS_SECONDS, float(seconds)))
+    with _process_lock:
+        if not _get_sampler().start_process():
+            return {"started": False, "error": "A process profile is already running."}
+        _process_started = time.time()
+        _process_timer = threading.Timer(seconds, stop_process_profile)
+        _process_timer.daemon = True
+        _process_timer.start()
+    return {"started": True, "seconds": seconds}
+
+
+def stop_process_profile() -> dict:
+    global _process_timer, _process_started
+    with _process_lock:
+        if _process_timer is not None:
+            _process_timer.cancel()
+            _process_timer = None
+        counts = _sampler.stop_process()
+        started, _process_started = _process_started, None
+    if counts is None:
+        return {"stopped": False, "error": "No process profile is running."}
+    return {
+        "stopped": True,
+        "seconds": round(time.time() - started, 2) if started else None,
+        "samples": sum(counts.values()),
+        "file": _write("process", counts),
+    }
+
+
+def status() -> dict:
+    return {
+        "enabled": _ENABLED,
+        "sample_rate": _SAMPLE_RATE,
+        "routes": list(_ROUTES),
+        "interval_ms": _INTERVAL * 1000,
+        "process_profile_running": _sampler.process_running,
+        "process_profile_started": _process_started,
+    }
+
+
+# ============================================
+# REQUEST MIDDLEWARE
+# ============================================
+
+_request_counter = itertools.count(1)
+
+
+def _forced(request) -> bool:
+    """X-Profile carries ADMIN_TOKEN; without a configured token nobody can force a profile."""
+    header = request.headers.get("X-Profile", "")
+    token = os.getenv("ADMIN_TOKEN", "")
+    # Compared as bytes: compare_digest rejects non-ASCII str with TypeError
+    return bool(header and token) and hmac.compare_digest(header.encode(), token.encode())
+
+
+def _should_profile(request) -> bool:
+    if _forced(request):
+        return True
+    if _ROUTES and request.path.startswith(_ROUTES):
+        return True
+    return _SAMPLE_RATE > 0 and next(_request_counter) % _SAMPLE_RATE == 0
+
+
+def init_profiling(app) -> None:
+    """Register request sampling hooks when PROFILING=1."""
+    if not _ENABLED:
+        return
+    from flask import g, request
+
+    @app.before_request
+    def _profile_start():
+        if _should_profile(request):
+            g._profile_ident = threading.get_ident()
+            _get_sampler().track(g._profile_ident)
+
+    @app.after_request
+    def _profile_finish(response):
+        ident = g.pop("_profile_ident", None)
+        if ident is not None:
+            counts = _sampler.untrack(ident)
+            name = _write(f"{request.method}-{request.path}", counts) if counts else None
+            if name and _forced(request):
+                response.headers["X-Profile-File"] = name
+        return response
+
+    @app.teardown_request
+    def _profile_discard(_exc):
+        ident = g.pop("_profile_ident", None)
+        if ident is not None:
+            _sampler.untrack(ident)
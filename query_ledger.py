@@ -0,0 +1,280 @@
+# query_ledger.py
+"""
+InnovateHer 2026 - The Equity Gap: Backend Query Ledger
+Every Snowflake / SQLite statement and Mongo find is recorded with a normalized
+fingerprint (literals and placeholders become ?, IN lists and multi-row VALUES
+collapse), its bind-parameter count, elapsed time, rows returned and, for
+Snowflake, the query id (bytes scanned are looked up from it on demand).
+
+Calls land in a bounded in-memory ring and a per-fingerprint rollup; a
+background thread rewrites the rollup to QUERY_LEDGER_PATH every
+QUERY_LEDGER_FLUSH_SECONDS. top() ranks fingerprints for the admin report.
+Exposes: wrap(cursor, kind), record(...), fingerprint(statement),
+         mongo_statement(collection, op, query), top(limit, by), recent(limit), flush()
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+
+_ENABLED = os.getenv("QUERY_LEDGER", "1") != "0"
+_PATH = os.getenv(
+    "QUERY_LEDGER_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "query_ledger.json"),
+)
+_RING_SIZE = int(os.getenv("QUERY_LEDGER_SIZE", "5000"))
+_FLUSH_SECONDS = float(os.getenv("QUERY_LEDGER_FLUSH_SECONDS", "60"))
+_MAX_FINGERPRINTS = 2000  # distinct shapes kept in the rollup (ad-hoc SQL must not grow it forever)
+
+SORT_KEYS = ("total_ms", "calls", "avg_ms", "max_ms", "rows")
+
+
+# ============================================
+# FINGERPRINTS
+# ============================================
+
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDERS = re.compile(r"%\(\w+\)s|%s|(?<![:\w]):\w+|\?")
+_NUMBERS = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?(?![\w.])")
+_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_ROWS = re.compile(r"(\(\?\.\.\.\))(?:\s*,\s*\(\?\.\.\.\))+")
+_SPACE = re.compile(r"\s+")
+
+_shapes: dict[str, tuple[str, str]] = {}  # raw statement -> (id, normalized), memoized
+
+
+def fingerprint(statement: str) -> tuple[str, str]:
+    """(short id, normalized text) for a statement; the same shape always gets the same id."""
+    shape = _shapes.get(statement)
+    if shape is None:
+        text = _COMMENTS.sub(" ", statement)
+        text = _STRINGS.sub("?", text)
+        text = _PLACEHOLDERS.sub("?", text)
+        text = _NUMBERS.sub("?", text)
+        text = _LISTS.sub("(?...)", text)
+        text = _ROWS.sub(r"\1", text)
+        text = _SPACE.sub(" ", text).strip()
+        shape = (hashlib.sha1(text.encode()).hexdigest()[:12], text)
+        if len(_shapes) < _MAX_FINGERPRINTS * 4:
+            _shapes[statement] = shape
+    return shape
+
+
+def mongo_statement(collection: str, op: str, query: dict) -> str:
+    """A Mongo call as a statement: the filter's keys, never its values."""
+    return f"{collection}.{op}({{{', '.join(f'{key}: ?' for key in sorted(query))}}})"
+
+
+# ============================================
+# RING + ROLLUP
+# ============================================
+
+# deque(maxlen) drops the oldest call when full
+_ring: deque = deque(maxlen=_RING_SIZE)
+_rollup: dict[str, dict] = {}
+_lock = threading.Lock()
+_since = time.time()
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def record(kind: str, statement: str, params: int, elapsed_ms: float, rows: int,
+           query_id: str = None, error: str = None) -> None:
+    """Add one call (kind: snowflake / sqlite / mongo) to the ring and its fingerprint's rollup."""
+    if not _ENABLED:
+        return
+    fp, text = fingerprint(statement)
+    now = time.time()
+    elapsed_ms = round(elapsed_ms, 3)
+    with _lock:
+        _ring.append((now, kind, fp, params, elapsed_ms, rows, query_id, error))
+        entry = _rollup.get(fp)
+        if entry is None:
+            if len(_rollup) >= _MAX_FINGERPRINTS:
+                fp, text = "overflow", "(other statements)"
+                entry = _rollup.get(fp)
+            if entry is None:
+                entry = _rollup[fp] = {
+                    "fingerprint": fp, "kind": kind, "statement": text,
+                    "calls": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": 0,
+                    "params_min": params, "params_max": params, "last_query_id": None, "last_at": now,
+                }
+        entry["calls"] += 1
+        entry["errors"] += error is not None
+        entry["total_ms"] += elapsed_ms
+        entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+        entry["rows"] += rows
+        entry["params_min"] = min(entry["params_min"], params)
+        entry["params_max"] = max(entry["params_max"], params)
+        entry["last_query_id"] = query_id or entry["last_query_id"]
+        entry["last_at"] = now
+    _ensure_writer()
+
+
+def _report(entry: dict) -> dict:
+    calls = entry["calls"]
+    return {
+        **entry,
+        "total_ms": round(entry["total_ms"], 2),
+        "avg_ms": round(entry["total_ms"] / calls, 3),
+        "rows_per_call": round(entry["rows"] / calls, 1),
+    }
+
+
+def top(limit: int = 20, by: str = "total_ms") -> dict:
+    """The limit most expensive fingerprints since process start, by one of SORT_KEYS."""
+    if not _ENABLED:
+        return {"enabled": False}
+    with _lock:
+        entries = [_report(e) for e in _rollup.values()]
+    entries.sort(key=lambda e: e[by], reverse=True)
+    return {
+        "enabled": True,
+        "since": _since,
+        "by": by,
+        "fingerprints": len(entries),
+        "calls": sum(e["calls"] for e in entries),
+        "total_ms": round(sum(e["total_ms"] for e in entries), 2),
+        "queries": entries[:limit],
+    }
+
+
+def recent(limit: int = 50) -> list[dict]:
+    """The newest calls in the ring, newest first."""
+    with _lock:
+        calls = list(_ring)[-limit:]
+    keys = ("at", "kind", "fingerprint", "params", "elapsed_ms", "rows", "query_id", "error")
+    return [dict(zip(keys, call)) for call in reversed(calls)]
+
+
+# ============================================
+# ROLLUP FILE (background thread)
+# ============================================
+
+def flush() -> str:
+    """Rewrite the rollup file (atomically) and return its path."""
+    snapshot = {"pid": os.getpid(), "written_at": time.time(), **top(_MAX_FINGERPRINTS)}
+    tmp = f"{_PATH}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, indent=1)
+    os.replace(tmp, _PATH)
+    return _PATH
+
+
+def _write_loop() -> None:
+    while True:
+        time.sleep(_FLUSH_SECONDS)
+        try:
+            flush()
+        except OSError:
+            pass  # disk trouble: the in-memory rollup is still served
+
+
+def _ensure_writer() -> None:
+    global _writer
+    if _writer is None or not _writer.is_alive():
+        with _writer_lock:
+            if _writer is None or not _writer.is_alive():
+                _writer = threading.Thread(target=_write_loop, name="query-ledger-writer", daemon=True)
+                _writer.start()
+
+
+# ============================================
+# CURSOR WRAPPER
+# ============================================
+
+class LedgerCursor:
+    """
+    DB-API cursor proxy. execute() opens a ledger entry; it is recorded once
+    the result is exhausted (fetchall, a short fetchmany, fetchone -> None),
+    on the next execute, or on close, with execute + fetch time and rows.
+    """
+
+    def __init__(self, cursor, kind: str):
+        self._cursor = cursor
+        self._kind = kind
+        self._open = None  # [statement, params, elapsed seconds, rows]
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
+
+    def _finish(self, error: str = None) -> None:
+        if self._open is not None:
+            statement, params, elapsed, rows = self._open
+            self._open = None
+            record(self._kind, statement, params, elapsed * 1000, rows,
+                   getattr(self._cursor, "sfqid", None), error)
+
+    def _run(self, method, statement, count, *args, **kwargs):
+        self._finish()
+        start = time.perf_counter()
+        try:
+            method(statement, *args, **kwargs)
+        except Exception as e:
+            self._open = [statement, count, time.perf_counter() - start, 0]
+            self._finish(type(e).__name__)
+            raise
+        self._open = [statement, count, time.perf_counter() - start, 0]
+        return self
+
+    def execute(self, statement, *args, **kwargs):
+        params = args[0] if args else kwargs.get("params")
+        return self._run(self._cursor.execute, statement, len(params or ()), *args, **kwargs)
+
+    def executemany(self, statement, seq_of_params, *args, **kwargs):
+        seq = list(seq_of_params)
+        self._run(self._cursor.executemany, statement, sum(len(p) for p in seq), seq, *args, **kwargs)
+        self._open[3] = len(seq)  # rows written
+        self._finish()
+        return self
+
+    def _fetch(self, method, *args):
+        start = time.perf_counter()
+        result = method(*args)
+        if self._open is not None:
+            self._open[2] += time.perf_counter() - start
+        return result
+
+    def fetchall(self):
+        rows = self._fetch(self._cursor.fetchall)
+        if self._open is not None:
+            self._open[3] += len(rows)
+        self._finish()
+        return rows
+
+    def fetchmany(self, size: int):
+        rows = self._fetch(self._cursor.fetchmany, size)
+        if self._open is not None:
+            self._open[3] += len(rows)
+            if len(rows) < size:
+                self._finish()
+        return rows
+
+    def fetchone(self):
+        row = self._fetch(self._cursor.fetchone)
+        if self._open is not None:
+            if row is None:
+                self._finish()
+            else:
+                self._open[3] += 1
+        return row
+
+    def close(self):
+        self._finish()
+        return self._cursor.close()
+
+
+def wrap(cursor, kind: str):
+    """The cursor itself when the ledger is off, else a recording proxy."""
+    return LedgerCursor(cursor, kind) if _ENABLED else cursor
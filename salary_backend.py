@@ -0,0 +1,607 @@
+# salary_backend.py
+"""
+InnovateHer 2026 - The Equity Gap: Salary Data Backends
+One interface behind get_market_benchmark / get_gender_benchmark:
+- SnowflakeBackend: the HACKATHON_DB.PUBLIC.SALARIES warehouse table
+- SQLiteBackend:    embedded copy with normalized keys + covering indexes,
+                    for edge nodes, tests and offline demos
+
+Selection (SALARY_BACKEND): "snowflake", "sqlite", or unset = Snowflake when
+the connector is installed, else SQLite when SALARY_DB_PATH exists.
+Benchmarks read SALARY_SUMMARY (sum / count / min / max per role, level,
+location, company type and gender), kept current by the warehouse: a dynamic
+table in Snowflake, triggers in SQLite. fold_summary() combines a role's rows.
+Summary rows are cached in the shared two-tier cache (aggregate_cache()), keyed
+by data_version(); writers call invalidate_role() after inserting, and
+summary_signature(role) changes once their rows reach the summary.
+Every statement runs on a query_ledger cursor (fingerprint, timing, rows, query id).
+Exposes: get_backend(), require_backend(), normalize_title(role), data_version(),
+         aggregate_cache(), invalidate_role(role), summary_signature(role),
+         fold_summary(rows, by_gender)
+"""
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+
+from dotenv import load_dotenv
+
+import query_ledger
+from deadline import DeadlineExceeded, timeout_for
+
+load_dotenv()
+
+_DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "salaries.db")
+
+
+def normalize_title(role: str) -> str:
+    """Lookup key for a job title: trimmed, single-spaced, upper-case."""
+    return " ".join(str(role).split()).upper()
+
+
+# ============================================
+# INTERFACE
+# ============================================
+
+class SalaryBackend:
+    """Aggregate queries the benchmark engines need."""
+
+    name = "base"
+
+    # Seconds between a write and its appearance in summary_rows()
+    summary_lag = 0.0
+
+    def summary_rows(self, role: str) -> list[tuple]:
+        """
+        SALARY_SUMMARY rows for role: [(level, location, company_type, gender,
+        salary_sum, salary_count, salary_min, salary_max), ...] — one per segment,
+        a few hundred at most however many SALARIES rows there are.
+        """
+        raise NotImplementedError
+
+    def salary_samples(self, role: str, level: str = None) -> list[tuple]:
+        """[(gender, annual_salary), ...] raw rows for role (optionally one experience level)."""
+        raise NotImplementedError
+
+    def insert_rows(self, rows: list[tuple]) -> None:
+        """Bulk-insert (JOB_TITLE, ANNUAL_SALARY, EXPERIENCE_LEVEL, GENDER, LOCATION, COMPANY_TYPE) rows."""
+        raise NotImplementedError
+
+    def aggregate_batches(self, filters: dict, min_count: int = 1, batch_size: int = 1000):
+        """
+        Generator of row batches (lists of EXPORT_COLUMNS tuples): one row per
+        role / level / location / gender group with at least min_count salaries.
+        filters may hold role, level, location, gender and company_type (exact,
+        case-insensitive). Rows are fetched batch_size at a time from an open cursor.
+        """
+        raise NotImplementedError
+
+    def scan_stats(self, query_ids: list[str]) -> dict:
+        """{query_id: bytes scanned} for ledger query ids the warehouse still remembers."""
+        return {}
+
+
+_INSERT_COLUMNS = "JOB_TITLE, ANNUAL_SALARY, EXPERIENCE_LEVEL, GENDER, LOCATION, COMPANY_TYPE"
+# normalize_title() in Snowflake SQL (server-side loads and the migration)
+_TITLE_KEY_SQL = "UPPER(TRIM(REGEXP_REPLACE({column}, '\\\\s+', ' ')))"
+
+EXPORT_COLUMNS = (
+    "job_title", "experience_level", "location", "gender",
+    "sample_size", "avg_salary", "min_salary", "max_salary",
+)
+EXPORT_FILTERS = ("role", "level", "location", "gender", "company_type")
+
+
+# ============================================
+# SNOWFLAKE
+# ============================================
+
+SNOWFLAKE_CONFIG = {
+    "user": os.getenv("SNOWFLAKE_USER"),
+    "password": os.getenv("SNOWFLAKE_PASSWORD"),
+    "account": os.getenv("SNOWFLAKE_ACCOUNT"),
+    "warehouse": "COMPUTE_WH",
+    "database": "HACKATHON_DB",
+    "schema": "PUBLIC",
+}
+
+
+class SnowflakeBackend(SalaryBackend):
+    name = "snowflake"
+
+    # SALARY_SUMMARY is a dynamic table over SALARIES (snowflake_seed.sql PART 4)
+    _SUMMARY_SQL = """
+        SELECT
+            EXPERIENCE_LEVEL, LOCATION, COMPANY_TYPE, GENDER,
+            SALARY_SUM, SALARY_COUNT, SALARY_MIN, SALARY_MAX
+        FROM SALARY_SUMMARY
+        WHERE JOB_TITLE_KEY = %s
+    """
+
+    # The dynamic table's TARGET_LAG
+    summary_lag = float(os.getenv("SALARY_SUMMARY_LAG_SECONDS", "60"))
+
+    def __init__(self, config: dict = None):
+        import snowflake.connector  # noqa: F401  (fail fast if not installed)
+        self.config = config or SNOWFLAKE_CONFIG
+
+    def connect(self):
+        import snowflake.connector
+        timeouts = {}
+        left = timeout_for(None)
+        if left is not None:
+            timeouts = {"login_timeout": math.ceil(left), "network_timeout": math.ceil(left)}
+        return snowflake.connector.connect(**self.config, **timeouts)
+
+    def _query(self, sql: str, params: tuple) -> list[tuple]:
+        conn = self.connect()
+        try:
+            cursor = query_ledger.wrap(conn.cursor(), self.name)
+            # Statement timeout = what is left of the request budget (whole seconds)
+            left = timeout_for(None)
+            if left is None:
+                cursor.execute(sql, params)
+            else:
+                cursor.execute(sql, params, timeout=max(1, math.ceil(left)))
+            return cursor.fetchall()
+        finally:
+            conn.close()
+
+    # Lookups compare the bare clustered key column (normalized here, in Python):
+    # a function on the column would scan every micro-partition.
+    def summary_rows(self, role: str) -> list[tuple]:
+        return self._query(self._SUMMARY_SQL, (normalize_title(role),))
+
+    def salary_samples(self, role: str, level: str = None) -> list[tuple]:
+        sql = "SELECT GENDER, ANNUAL_SALARY FROM SALARIES WHERE JOB_TITLE_KEY = %s"
+        if level:
+            return self._query(sql + " AND UPPER(EXPERIENCE_LEVEL) = UPPER(%s)", (normalize_title(role), level))
+        return self._query(sql, (normalize_title(role),))
+
+    def insert_rows(self, rows: list[tuple]) -> None:
+        # The connector rewrites an INSERT executemany into one multi-row INSERT
+        conn = self.connect()
+        try:
+            query_ledger.wrap(conn.cursor(), self.name).executemany(
+                f"INSERT INTO SALARIES ({_INSERT_COLUMNS}, JOB_TITLE_KEY) VALUES (%s, %s, %s, %s, %s, %s, %s)",
+                [(*row, normalize_title(row[0])) for row in rows],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    # filter name -> column (compared case-insensitively)
+    _EXPORT_FILTER_COLUMNS = {
+        "level": "EXPERIENCE_LEVEL", "location": "LOCATION",
+        "gender": "GENDER", "company_type": "COMPANY_TYPE",
+    }
+
+    def aggregate_batches(self, filters: dict, min_count: int = 1, batch_size: int = 1000):
+        where, params = ["1 = 1"], []
+        if filters.get("role"):
+            where.append("JOB_TITLE_KEY = %s")
+            params.append(normalize_title(filters["role"]))
+        for name, column in self._EXPORT_FILTER_COLUMNS.items():
+            if filters.get(name):
+                where.append(f"UPPER({column}) = UPPER(%s)")
+                params.append(filters[name])
+        sql = f"""
+            SELECT JOB_TITLE, EXPERIENCE_LEVEL, LOCATION, GENDER,
+                   COUNT(*), ROUND(AVG(ANNUAL_SALARY)), MIN(ANNUAL_SALARY), MAX(ANNUAL_SALARY)
+            FROM SALARIES
+            WHERE {" AND ".join(where)}
+            GROUP BY JOB_TITLE, EXPERIENCE_LEVEL, LOCATION, GENDER
+            HAVING COUNT(*) >= %s
+            ORDER BY JOB_TITLE, EXPERIENCE_LEVEL, LOCATION, GENDER
+        """
+        conn = self.connect()
+        try:
+            cursor = query_ledger.wrap(conn.cursor(), self.name)
+            left = timeout_for(None)
+            if left is None:
+                cursor.execute(sql, (*params, min_count))
+            else:
+                cursor.execute(sql, (*params, min_count), timeout=max(1, math.ceil(left)))
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    return
+                yield batch
+        finally:
+            conn.close()
+
+    def scan_stats(self, query_ids: list[str]) -> dict:
+        # Not through the ledger: looking up its own query ids should not rank in it
+        if not query_ids:
+            return {}
+        conn = self.connect()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT QUERY_ID, BYTES_SCANNED "
+                "FROM TABLE(INFORMATION_SCHEMA.QUERY_HISTORY_BY_USER(RESULT_LIMIT => 10000)) "
+                f"WHERE QUERY_ID IN ({', '.join(['%s'] * len(query_ids))})",
+                tuple(query_ids),
+            )
+            return {query_id: int(scanned or 0) for query_id, scanned in cursor.fetchall()}
+        finally:
+            conn.close()
+
+    def stage_csv(self, path: str) -> None:
+        """Bulk-load a (gzip) CSV of SALARIES rows: PUT to the table stage, then COPY INTO."""
+        name = os.path.basename(path)
+        conn = self.connect()
+        try:
+            cursor = query_ledger.wrap(conn.cursor(), self.name)
+            cursor.execute(f"PUT 'file://{os.path.abspath(path)}' @%SALARIES AUTO_COMPRESS=FALSE OVERWRITE=TRUE")
+            # The key is derived during the load (same normalization as normalize_title)
+            cursor.execute(
+                f"COPY INTO SALARIES ({_INSERT_COLUMNS}, JOB_TITLE_KEY) "
+                f"FROM (SELECT $1, $2, $3, $4, $5, $6, {_TITLE_KEY_SQL.format(column='$1')} FROM @%SALARIES) "
+                f"FILES = ('{name}') "
+                "FILE_FORMAT = (TYPE = CSV COMPRESSION = GZIP FIELD_OPTIONALLY_ENCLOSED_BY = '\"') "
+                "PURGE = TRUE"
+            )
+        finally:
+            conn.close()
+
+
+# ============================================
+# SQLITE (embedded)
+# ============================================
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS SALARIES (
+    JOB_TITLE        TEXT,
+    ANNUAL_SALARY    INTEGER,
+    EXPERIENCE_LEVEL TEXT,
+    GENDER           TEXT,
+    LOCATION         TEXT,
+    COMPANY_TYPE     TEXT DEFAULT 'Mixed'
+);
+"""
+
+# Normalized lookup columns, filled on load so queries never wrap a column in a function
+_KEY_COLUMNS = {
+    "JOB_TITLE_KEY": "JOB_TITLE",
+    "GENDER_KEY": "GENDER",
+    "LEVEL_KEY": "EXPERIENCE_LEVEL",
+    "LOCATION_KEY": "LOCATION",
+}
+
+# Source values whose key UPPER(TRIM(...)) would get wrong: runs of spaces, tabs, newlines
+_UNNORMALIZED = "{column} GLOB '*  *' OR {column} GLOB '*[\t\n\r\f\v]*'"
+
+
+def _sql_key(value):
+    """normalize_title for SQL, registered on every connection as NORMALIZE_KEY (NULL stays NULL)."""
+    return None if value is None else normalize_title(value)
+
+# Covering: samples and exports are answered from the index alone
+_SQLITE_INDEXES = """
+CREATE INDEX IF NOT EXISTS IDX_SALARIES_LOOKUP
+    ON SALARIES (JOB_TITLE_KEY, GENDER_KEY, LEVEL_KEY, LOCATION_KEY, ANNUAL_SALARY);
+"""
+
+# SALARY_SUMMARY mirrors the Snowflake dynamic table; triggers keep it current.
+# Writers must fill the key columns (insert_rows does).
+_SUMMARY_GROUP = "JOB_TITLE_KEY, LEVEL_KEY, LOCATION_KEY, IFNULL(COMPANY_TYPE, 'Mixed'), GENDER_KEY"
+
+_SQLITE_SUMMARY = f"""
+CREATE TABLE SALARY_SUMMARY (
+    JOB_TITLE_KEY TEXT NOT NULL,
+    LEVEL_KEY     TEXT NOT NULL,
+    LOCATION_KEY  TEXT NOT NULL,
+    COMPANY_TYPE  TEXT NOT NULL,
+    GENDER_KEY    TEXT NOT NULL,
+    SALARY_SUM    INTEGER NOT NULL,
+    SALARY_COUNT  INTEGER NOT NULL,
+    SALARY_MIN    INTEGER NOT NULL,
+    SALARY_MAX    INTEGER NOT NULL,
+    PRIMARY KEY (JOB_TITLE_KEY, LEVEL_KEY, LOCATION_KEY, COMPANY_TYPE, GENDER_KEY)
+) WITHOUT ROWID;
+
+INSERT INTO SALARY_SUMMARY
+SELECT {_SUMMARY_GROUP}, SUM(ANNUAL_SALARY), COUNT(ANNUAL_SALARY), MIN(ANNUAL_SALARY), MAX(ANNUAL_SALARY)
+FROM SALARIES
+WHERE ANNUAL_SALARY IS NOT NULL
+GROUP BY {_SUMMARY_GROUP};
+"""
+
+
+def _resummarize(row: str) -> str:
+    """Trigger body that recomputes the one summary group of row (OLD or NEW) from SALARIES."""
+    match = (
+        f"JOB_TITLE_KEY = {row}.JOB_TITLE_KEY AND GENDER_KEY = {row}.GENDER_KEY "
+        f"AND LEVEL_KEY = {row}.LEVEL_KEY AND LOCATION_KEY = {row}.LOCATION_KEY"
+    )
+    return f"""
+    DELETE FROM SALARY_SUMMARY
+    WHERE {match} AND COMPANY_TYPE = IFNULL({row}.COMPANY_TYPE, 'Mixed');
+    INSERT INTO SALARY_SUMMARY
+    SELECT {_SUMMARY_GROUP}, SUM(ANNUAL_SALARY), COUNT(ANNUAL_SALARY), MIN(ANNUAL_SALARY), MAX(ANNUAL_SALARY)
+    FROM SALARIES
+    WHERE {match} AND IFNULL(COMPANY_TYPE, 'Mixed') = IFNULL({row}.COMPANY_TYPE, 'Mixed')
+      AND ANNUAL_SALARY IS NOT NULL
+    GROUP BY {_SUMMARY_GROUP};"""
+
+
+# Inserts fold in incrementally; deletes and updates recompute the affected
+# group(s) through IDX_SALARIES_LOOKUP (MIN / MAX cannot be un-merged)
+_SQLITE_SUMMARY_TRIGGERS = f"""
+CREATE TRIGGER IF NOT EXISTS TRG_SALARY_SUMMARY_INSERT
+AFTER INSERT ON SALARIES WHEN NEW.ANNUAL_SALARY IS NOT NULL
+BEGIN
+    INSERT INTO SALARY_SUMMARY VALUES (
+        NEW.JOB_TITLE_KEY, NEW.LEVEL_KEY, NEW.LOCATION_KEY, IFNULL(NEW.COMPANY_TYPE, 'Mixed'), NEW.GENDER_KEY,
+        NEW.ANNUAL_SALARY, 1, NEW.ANNUAL_SALARY, NEW.ANNUAL_SALARY
+    )
+    ON CONFLICT DO UPDATE SET
+        SALARY_SUM = SALARY_SUM + excluded.SALARY_SUM,
+        SALARY_COUNT = SALARY_COUNT + 1,
+        SALARY_MIN = MIN(SALARY_MIN, excluded.SALARY_MIN),
+        SALARY_MAX = MAX(SALARY_MAX, excluded.SALARY_MAX);
+END;
+
+CREATE TRIGGER IF NOT EXISTS TRG_SALARY_SUMMARY_DELETE
+AFTER DELETE ON SALARIES
+BEGIN{_resummarize("OLD")}
+END;
+
+CREATE TRIGGER IF NOT EXISTS TRG_SALARY_SUMMARY_UPDATE
+AFTER UPDATE OF ANNUAL_SALARY, COMPANY_TYPE, {", ".join(_KEY_COLUMNS)} ON SALARIES
+BEGIN{_resummarize("OLD")}{_resummarize("NEW")}
+END;
+"""
+
+
+class SQLiteBackend(SalaryBackend):
+    name = "sqlite"
+
+    # Primary-key prefix lookup on the trigger-maintained summary
+    _SUMMARY_SQL = """
+        SELECT LEVEL_KEY, LOCATION_KEY, COMPANY_TYPE, GENDER_KEY,
+               SALARY_SUM, SALARY_COUNT, SALARY_MIN, SALARY_MAX
+        FROM SALARY_SUMMARY
+        WHERE JOB_TITLE_KEY = ?
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path or os.getenv("SALARY_DB_PATH", _DEFAULT_DB_PATH)
+        self._local = threading.local()
+        if not os.path.exists(self.path):
+            self.build_from_seed()
+        self._ensure_schema()
+
+    def connect(self) -> sqlite3.Connection:
+        """One connection per thread (sqlite3 connections are not thread-safe)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.create_function("NORMALIZE_KEY", 1, _sql_key, deterministic=True)
+            self._local.conn = conn
+        return conn
+
+    def _ensure_schema(self) -> None:
+        """Create the table, add/populate normalized key columns, build indexes and the summary."""
+        conn = self.connect()
+        with conn:
+            conn.executescript(_SQLITE_SCHEMA)
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(SALARIES)")}
+            for key_col, src_col in _KEY_COLUMNS.items():
+                if key_col not in existing:
+                    conn.execute(f"ALTER TABLE SALARIES ADD COLUMN {key_col} TEXT")
+                    conn.execute(f"UPDATE SALARIES SET {key_col} = NORMALIZE_KEY({src_col})")
+                else:
+                    # Databases keyed before NORMALIZE_KEY: re-key only rows with inner whitespace
+                    conn.execute(
+                        f"UPDATE SALARIES SET {key_col} = NORMALIZE_KEY({src_col}) "
+                        f"WHERE ({_UNNORMALIZED.format(column=src_col)}) "
+                        f"AND {key_col} IS NOT NORMALIZE_KEY({src_col})"
+                    )
+            conn.executescript(_SQLITE_INDEXES)
+            has_summary = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'SALARY_SUMMARY'"
+            ).fetchone()
+            if not has_summary:
+                conn.executescript(_SQLITE_SUMMARY)
+            conn.executescript(_SQLITE_SUMMARY_TRIGGERS)
+            conn.execute("ANALYZE")
+
+    def build_from_seed(self, rows: int = None, seed: int = 2026) -> None:
+        """Materialize snowflake_seed.sql (seed rows + generator) into a fresh database."""
+        import scale_data
+
+        spec = scale_data.load_seed_spec()
+        if rows is None:
+            rows = scale_data.expected_generated_rows(spec)
+        scale_data.write("sqlite", self.path, rows, seed=seed, spec=spec)
+
+    def _query(self, sql: str, params: tuple) -> list[tuple]:
+        conn = self.connect()
+        cursor = query_ledger.wrap(conn.cursor(), self.name)
+        left = timeout_for(None)
+        if left is None:
+            return cursor.execute(sql, params).fetchall()
+
+        # Interrupt the statement once the request budget is spent
+        stop_at = time.monotonic() + left
+        conn.set_progress_handler(lambda: time.monotonic() > stop_at, 10_000)
+        try:
+            return cursor.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            if "interrupted" in str(e):
+                raise DeadlineExceeded() from e
+            raise
+        finally:
+            conn.set_progress_handler(None, 0)
+
+    def summary_rows(self, role: str) -> list[tuple]:
+        return self._query(self._SUMMARY_SQL, (normalize_title(role),))
+
+    def salary_samples(self, role: str, level: str = None) -> list[tuple]:
+        # Answered from IDX_SALARIES_LOOKUP alone (covering)
+        sql = "SELECT GENDER_KEY, ANNUAL_SALARY FROM SALARIES WHERE JOB_TITLE_KEY = ?"
+        if level:
+            return self._query(sql + " AND LEVEL_KEY = ?", (normalize_title(role), level.strip().upper()))
+        return self._query(sql, (normalize_title(role),))
+
+    # filter name -> (column, normalizer); key columns keep filters on IDX_SALARIES_LOOKUP
+    _EXPORT_FILTER_COLUMNS = {
+        "role": ("JOB_TITLE_KEY", normalize_title),
+        "level": ("LEVEL_KEY", normalize_title),
+        "location": ("LOCATION_KEY", normalize_title),
+        "gender": ("GENDER_KEY", normalize_title),
+        "company_type": ("UPPER(TRIM(COMPANY_TYPE))", normalize_title),
+    }
+
+    def aggregate_batches(self, filters: dict, min_count: int = 1, batch_size: int = 1000):
+        where, params = ["1 = 1"], []
+        for name, (column, normalize) in self._EXPORT_FILTER_COLUMNS.items():
+            if filters.get(name):
+                where.append(f"{column} = ?")
+                params.append(normalize(filters[name]))
+        # Grouped in IDX_SALARIES_LOOKUP order so rows stream without a sort; labelled with the stored spelling
+        sql = f"""
+            SELECT MIN(JOB_TITLE), MIN(EXPERIENCE_LEVEL), MIN(LOCATION), MIN(GENDER),
+                   COUNT(*), ROUND(AVG(ANNUAL_SALARY)), MIN(ANNUAL_SALARY), MAX(ANNUAL_SALARY)
+            FROM SALARIES
+            WHERE {" AND ".join(where)}
+            GROUP BY JOB_TITLE_KEY, GENDER_KEY, LEVEL_KEY, LOCATION_KEY
+            HAVING COUNT(*) >= ?
+            ORDER BY JOB_TITLE_KEY, GENDER_KEY, LEVEL_KEY, LOCATION_KEY
+        """
+        # A private cursor: the thread's connection stays usable while the export streams
+        cursor = query_ledger.wrap(self.connect().cursor(), self.name).execute(sql, (*params, min_count))
+        try:
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    return
+                yield batch
+        finally:
+            cursor.close()
+
+    def insert_rows(self, rows: list[tuple]) -> None:
+        keyed = (
+            (*row, normalize_title(row[0]), normalize_title(row[3]),
+             normalize_title(row[2]), normalize_title(row[4]))
+            for row in rows
+        )
+        conn = self.connect()
+        with conn:  # one transaction per batch
+            query_ledger.wrap(conn.cursor(), self.name).executemany(
+                f"INSERT INTO SALARIES ({_INSERT_COLUMNS}, {', '.join(_KEY_COLUMNS)}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                keyed,
+            )
+
+
+# ============================================
+# SELECTION
+# ============================================
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def _resolve() -> SalaryBackend:
+    choice = os.getenv("SALARY_BACKEND", "").strip().lower()
+    if choice == "snowflake":
+        return SnowflakeBackend()
+    if choice == "sqlite":
+        return SQLiteBackend()
+    if choice:
+        raise ImportError(f"Unknown SALARY_BACKEND: {choice}")
+
+    try:
+        return SnowflakeBackend()
+    except ImportError:
+        pass
+    if os.path.exists(os.getenv("SALARY_DB_PATH", _DEFAULT_DB_PATH)):
+        return SQLiteBackend()
+    raise ImportError("No salary backend: install snowflake-connector-python or set SALARY_BACKEND=sqlite")
+
+
+def get_backend() -> SalaryBackend:
+    """Process-wide backend, resolved on first use."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = _resolve()
+    return _backend
+
+
+def require_backend() -> SalaryBackend:
+    """Resolve now; raises ImportError when nothing is configured (callers fall back to mocks)."""
+    return get_backend()
+
+
+# ============================================
+# AGGREGATE CACHE
+# ============================================
+
+def data_version() -> str:
+    """Bump SALARIES_DATA_VERSION whenever SALARIES is reseeded; every cached aggregate changes key."""
+    return f"{os.getenv('SALARIES_DATA_VERSION', 'seed-2026-02')}:{get_backend().name}"
+
+
+def aggregate_cache():
+    """Shared cache for per-role summary rows (raw backend rows, before the crowd overlay)."""
+    from cache import get_cache
+
+    return get_cache(
+        "salary-aggregates",
+        version=data_version(),
+        l1_ttl=float(os.getenv("BENCHMARK_CACHE_SECONDS", "30")),
+        l2_ttl=float(os.getenv("BENCHMARK_CACHE_L2_SECONDS", "600")),
+    )
+
+
+def invalidate_role(role: str) -> None:
+    """
+    Forget cached summary rows for role (after rows for it were written). With a
+    lagging summary (Snowflake dynamic table) forget them again once it has caught up.
+    """
+    key = normalize_title(role)
+    aggregate_cache().invalidate(("summary", key))
+    lag = get_backend().summary_lag
+    if lag > 0:
+        timer = threading.Timer(lag, lambda: aggregate_cache().invalidate(("summary", key)))
+        timer.daemon = True
+        timer.start()
+
+
+def summary_signature(role: str) -> str:
+    """
+    Short digest of role's (cached) summary rows, for ETags and keys of anything
+    derived from them: a bulk ingest in another process changes it too.
+    """
+    rows = aggregate_cache().get_or_set(
+        ("summary", normalize_title(role)),
+        lambda: get_backend().summary_rows(role),
+    )
+    # default=float: Snowflake DECIMALs digest like their JSON round trip through L2
+    raw = json.dumps([list(row) for row in rows], separators=(",", ":"), default=float)
+    return hashlib.sha1(raw.encode()).hexdigest()[:12]
+
+
+def fold_summary(rows: list[tuple], by_gender: bool = False) -> dict:
+    """
+    Combine summary_rows() into {key: (avg, min, max, count)}: key "ALL", or
+    the upper-case gender when by_gender.
+    """
+    totals = {}
+    for _level, _location, _company, gender, total, count, lo, hi in rows:
+        key = str(gender).strip().upper() if by_gender else "ALL"
+        seen = totals.get(key)
+        if seen is None:
+            totals[key] = (total, count, lo, hi)
+        else:
+            totals[key] = (seen[0] + total, seen[1] + count, min(seen[2], lo), max(seen[3], hi))
+    return {key: (total / count, lo, hi, count) for key, (total, count, lo, hi) in totals.items() if count}
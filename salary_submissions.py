@@ -0,0 +1,300 @@
+# salary_submissions.py
+"""
+InnovateHer 2026 - The Equity Gap: Crowd-Sourced Salary Submissions
+Opt-in user salaries update in-memory running aggregates immediately (Welford
+mean/variance, count, min/max per role/gender/segment) and are written to
+SALARIES in bulk by a background flusher — one multi-row insert per batch,
+never one INSERT per submission. A bounded buffer gives backpressure; the
+per-segment aggregates and per-role generations are LRU-capped, and aggregates
+idle past SUBMISSIONS_STATS_TTL_SECONDS are dropped once flushed to SALARIES.
+Exposes: submit(row), pending_overlay(role), pending_salaries(role),
+         role_generation(role), stats(role, min_count)
+"""
+
+import itertools
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from salary_backend import get_backend, invalidate_role, normalize_title
+
+_MAX_PENDING = int(os.getenv("SUBMISSIONS_MAX_PENDING", "10000"))
+_BATCH_SIZE = int(os.getenv("SUBMISSIONS_BATCH_SIZE", "500"))
+_FLUSH_SECONDS = float(os.getenv("SUBMISSIONS_FLUSH_SECONDS", "5"))
+# Keys come from user input: bound how many distinct segments / roles are tracked
+_MAX_SEGMENTS = int(os.getenv("SUBMISSIONS_MAX_SEGMENTS", "5000"))
+_MAX_ROLES = int(os.getenv("SUBMISSIONS_MAX_ROLES", "5000"))
+_STATS_TTL = float(os.getenv("SUBMISSIONS_STATS_TTL_SECONDS", "86400"))
+
+GENDERS = {"MALE": "Male", "FEMALE": "Female"}
+MIN_SALARY, MAX_SALARY = 10_000, 2_000_000
+
+
+# ============================================
+# RUNNING STATISTICS
+# ============================================
+
+class RunningStats:
+    """Welford's online mean/variance plus count/min/max."""
+
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        self.min = x if self.min is None else min(self.min, x)
+        self.max = x if self.max is None else max(self.max, x)
+
+    def merge(self, other: "RunningStats") -> None:
+        """Chan et al. parallel combination."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 2),
+            "stddev": round(self.variance ** 0.5, 2),
+            "min": self.min,
+            "max": self.max,
+        }
+
+
+# ============================================
+# SUBMISSION STORE
+# ============================================
+
+class SubmissionStore:
+    """
+    _stats:       recent submissions per (role_key, gender, segment) -> (stats, last
+                  update), least recently updated evicted past max_segments
+    _pending:     rows not yet in SALARIES, with per (role_key, gender) stats used to
+                  overlay live benchmarks until the flusher writes them
+    _generations: role_key -> a value from one process-wide sequence, LRU-capped;
+                  evicted roles read the highest evicted value, never an older one
+    """
+
+    def __init__(self, max_pending=_MAX_PENDING, batch_size=_BATCH_SIZE, flush_seconds=_FLUSH_SECONDS,
+                 max_segments=_MAX_SEGMENTS, max_roles=_MAX_ROLES, stats_ttl=_STATS_TTL):
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.max_segments = max_segments
+        self.max_roles = max_roles
+        self.stats_ttl = stats_ttl
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._stats: OrderedDict = OrderedDict()
+        self._pending: list[tuple] = []
+        self._pending_stats: dict[tuple, RunningStats] = {}
+        self._generations: OrderedDict = OrderedDict()
+        self._sequence = itertools.count(1)
+        self._evicted_generation = 0
+        self._flusher = None
+        self.flushed = 0
+        self.last_error = None
+
+    # --------------------------------------------
+    def submit(self, row: tuple) -> bool:
+        """
+        Accept a normalized SALARIES row. Returns False (caller should retry later)
+        when the write buffer is full.
+        """
+        title, salary, level, gender, location, _company = row
+        role_key = normalize_title(title)
+        with self._lock:
+            if len(self._pending) >= self.max_pending:
+                return False
+            self._pending.append(row)
+            key = (role_key, gender, f"{level}|{location}")
+            stats = self._stats.pop(key, (RunningStats(), 0))[0]
+            stats.add(salary)
+            self._stats[key] = (stats, time.monotonic())
+            while len(self._stats) > self.max_segments:
+                self._stats.popitem(last=False)
+            self._pending_stats.setdefault((role_key, gender), RunningStats()).add(salary)
+            self._generations.pop(role_key, None)
+            self._generations[role_key] = next(self._sequence)
+            while len(self._generations) > self.max_roles:
+                _role, evicted = self._generations.popitem(last=False)
+                self._evicted_generation = max(self._evicted_generation, evicted)
+            if len(self._pending) >= self.batch_size:
+                self._wake.notify()
+        self._ensure_flusher()
+        return True
+
+    def pending_overlay(self, role: str) -> dict[str, RunningStats]:
+        """Unflushed stats for role keyed by gender ("Male"/"Female")."""
+        role_key = normalize_title(role)
+        with self._lock:
+            return {
+                gender: self._copy(stats)
+                for (key, gender), stats in self._pending_stats.items()
+                if key == role_key
+            }
+
+    def pending_salaries(self, role: str) -> list[tuple]:
+        """Unflushed (gender, salary) pairs for role."""
+        role_key = normalize_title(role)
+        with self._lock:
+            return [(r[3], r[1]) for r in self._pending if normalize_title(r[0]) == role_key]
+
+    def role_generation(self, role: str) -> int:
+        """Changes on every accepted submission for role (cache/ETag invalidation)."""
+        with self._lock:
+            return self._generations.get(normalize_title(role), self._evicted_generation)
+
+    def stats(self, role: str = None, min_count: int = 1) -> list[dict]:
+        """Running aggregates; segments with fewer than min_count submissions are left out."""
+        role_key = normalize_title(role) if role else None
+        with self._lock:
+            return [
+                {"role_key": key, "gender": gender, "segment": segment, **s.to_dict()}
+                for (key, gender, segment), (s, _updated) in sorted(self._stats.items())
+                if (role_key is None or key == role_key) and s.count >= min_count
+            ]
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    # --------------------------------------------
+    @staticmethod
+    def _copy(stats: RunningStats) -> RunningStats:
+        out = RunningStats()
+        out.merge(stats)
+        return out
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or not self._flusher.is_alive():
+            with self._lock:
+                if self._flusher is None or not self._flusher.is_alive():
+                    self._flusher = threading.Thread(target=self._flush_loop, name="salary-flusher", daemon=True)
+                    self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._lock:
+                self._wake.wait_for(lambda: len(self._pending) >= self.batch_size, timeout=self.flush_seconds)
+            self.flush()
+
+    def flush(self) -> int:
+        """Write up to one batch of pending rows in a single bulk insert. Returns rows written."""
+        with self._lock:
+            batch = self._pending[:self.batch_size]
+        if not batch:
+            return 0
+        try:
+            get_backend().insert_rows(batch)
+        except Exception as e:
+            # keep the rows; the next interval retries (buffer bound gives backpressure)
+            self.last_error = str(e)
+            time.sleep(min(self.flush_seconds, 1.0))
+            return 0
+
+        with self._lock:
+            del self._pending[:len(batch)]
+            self._pending_stats = {}
+            for title, salary, _level, gender, _loc, _co in self._pending:
+                self._pending_stats.setdefault((normalize_title(title), gender), RunningStats()).add(salary)
+            # Idle aggregates are in SALARIES by now (the oldest-updated come first)
+            idle_before = time.monotonic() - self.stats_ttl
+            while self._stats and next(iter(self._stats.values()))[1] < idle_before:
+                self._stats.popitem(last=False)
+            self.flushed += len(batch)
+            self.last_error = None
+        # The rows now live in SALARIES; cached aggregates for these roles are stale
+        for role_key in {normalize_title(row[0]) for row in batch}:
+            invalidate_role(role_key)
+        return len(batch)
+
+
+# ============================================
+# PUBLIC API
+# ============================================
+
+_store = SubmissionStore()
+
+
+def normalize_submission(data: dict) -> tuple:
+    """Validate a submission body into a SALARIES row; raises ValueError."""
+    role = " ".join(str(data.get("role", "")).split())
+    if not role or len(role) > 100:
+        raise ValueError("role is required (max 100 characters)")
+
+    salary = float(data.get("salary", data.get("current_salary", 0)))
+    if not MIN_SALARY <= salary <= MAX_SALARY:
+        raise ValueError(f"salary must be between {MIN_SALARY:,} and {MAX_SALARY:,}")
+
+    gender = GENDERS.get(str(data.get("gender", "")).strip().upper())
+    if gender is None:
+        raise ValueError("gender must be Male or Female")
+
+    level = str(data.get("experience_level", "Unspecified")).strip().title()[:20] or "Unspecified"
+    location = " ".join(str(data.get("location", "Unspecified")).split())[:60] or "Unspecified"
+    company = " ".join(str(data.get("company_type", "Crowdsourced")).split())[:40] or "Crowdsourced"
+    return (role, int(round(salary)), level, gender, location, company)
+
+
+def submit(row: tuple) -> bool:
+    return _store.submit(row)
+
+
+def pending_overlay(role: str) -> dict:
+    return _store.pending_overlay(role)
+
+
+def pending_salaries(role: str) -> list[tuple]:
+    return _store.pending_salaries(role)
+
+
+def role_generation(role: str) -> int:
+    return _store.role_generation(role)
+
+
+def stats(role: str = None, min_count: int = 1) -> list[dict]:
+    return _store.stats(role, min_count)
+
+
+def pending_count() -> int:
+    return _store.pending_count()
+
+
+def combine(count: int, avg: float, lo, hi, overlay: RunningStats) -> tuple:
+    """Merge a backend (count, avg, min, max) aggregate with an unflushed overlay."""
+    if overlay is None or overlay.count == 0:
+        return count, avg, lo, hi
+    if not count:
+        return overlay.count, overlay.mean, overlay.min, overlay.max
+    total = count + overlay.count
+    return (
+        total,
+        (avg * count + overlay.mean * overlay.count) / total,
+        min(lo, overlay.min),
+        max(hi, overlay.max),
+    )
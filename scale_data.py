@@ -0,0 +1,295 @@
+# scale_data.py
+"""
+InnovateHer 2026 - The Equity Gap: Local Scale-Data Generator
+Reproduces snowflake_seed.sql offline: the 420 hand-verified seed rows plus the
+Snowflake GENERATOR cross join (ROLE_BASES x ROLE_GAPS x LEVELS x LOCATIONS x
+COMPANIES x GENDERS, +/-5% noise, ~3:2 male:female acceptance), vectorized in
+NumPy at any row count and streamed in chunks to CSV, SQLite or Parquet.
+
+    python scale_data.py --rows 10000000 --format parquet --out salaries.parquet
+    python scale_data.py --rows 2000000 --format sqlite --out salaries.db
+
+Exposes: load_seed_spec(path), iter_chunks(spec, rows, ...), write(...)
+"""
+
+import argparse
+import csv
+import os
+import re
+import sqlite3
+import sys
+import time
+
+import numpy as np
+
+_SEED_SQL = os.path.join(os.path.dirname(os.path.abspath(__file__)), "snowflake_seed.sql")
+
+COLUMNS = ("JOB_TITLE", "ANNUAL_SALARY", "EXPERIENCE_LEVEL", "GENDER", "LOCATION", "COMPANY_TYPE")
+_SEED_COMPANY_TYPE = "Mixed"  # SALARIES.COMPANY_TYPE default for the seed inserts
+
+_SEED_ROW = re.compile(r"^\('([^']+)',\s*(\d+),\s*'([^']+)',\s*'([^']+)',\s*'([^']+)'\)", re.M)
+_CTE_ROW = re.compile(r"SELECT\s+'([^']+)'(?:\s+AS\s+\w+)?\s*,\s*([\d.]+)", re.I)
+_ROWCOUNT = re.compile(r"GENERATOR\s*\(\s*ROWCOUNT\s*=>\s*(\d+)", re.I)
+_ACCEPT = re.compile(r"WHEN\s+G\.GEN\s*=\s*'(\w+)'\s+THEN\s+(\d+)\s+ELSE\s+(\d+)", re.I)
+_SENIOR = re.compile(r"WHEN\s+L\.LVL\s*=\s*'(\w+)'\s+THEN\s+([\d.]+)", re.I)
+_NOISE = re.compile(r"UNIFORM\(\s*(-?[\d.]+)\s*,\s*([\d.]+)\s*,\s*RANDOM\(\)\s*\)\)", re.I)
+
+
+# ============================================
+# SEED PARSING
+# ============================================
+
+def _cte(sql: str, name: str) -> list[tuple[str, float]]:
+    """Rows of a `NAME AS ( SELECT 'k', v UNION ALL ... )` CTE."""
+    match = re.search(rf"\b{name}\s+AS\s*\((.*?)\n\)", sql, re.S | re.I)
+    if not match:
+        raise ValueError(f"CTE {name} not found in seed SQL")
+    body = re.sub(r"--[^\n]*", "", match.group(1))
+    return [(k, float(v)) for k, v in _CTE_ROW.findall(body)]
+
+
+def load_seed_spec(path: str = _SEED_SQL) -> dict:
+    """Parse seed rows and generator multipliers out of snowflake_seed.sql."""
+    with open(path, encoding="utf-8") as f:
+        sql = f.read()
+
+    generator_sql = sql[sql.index("ROLE_BASES AS"):]
+    seed_sql = sql[:sql.index("ROLE_BASES AS")]
+
+    accept = _ACCEPT.search(generator_sql)
+    senior = _SENIOR.search(generator_sql)
+    noise = _NOISE.search(generator_sql)
+    rowcount = _ROWCOUNT.search(generator_sql)
+
+    bases = dict(_cte(generator_sql, "ROLE_BASES"))
+    gaps = dict(_cte(generator_sql, "ROLE_GAPS"))
+    genders = _cte(generator_sql, "GENDERS")
+    accepted_gender = accept.group(1) if accept else "Male"
+
+    return {
+        "seed_rows": [
+            (t, int(s), lvl, g, loc, _SEED_COMPANY_TYPE)
+            for t, s, lvl, g, loc in _SEED_ROW.findall(seed_sql)
+        ],
+        "titles": list(bases),
+        "bases": np.array([bases[t] for t in bases]),
+        "gaps": np.array([gaps[t] for t in bases]),
+        "levels": _cte(generator_sql, "LEVELS"),
+        "locations": _cte(generator_sql, "LOCATIONS"),
+        "companies": _cte(generator_sql, "COMPANIES"),
+        "genders": genders,
+        # UNIFORM(1, 100) <= 3 / 2  ->  acceptance probability per gender
+        "accept": np.array([
+            (int(accept.group(2)) if g == accepted_gender else int(accept.group(3))) / 100
+            if accept else 0.025
+            for g, _ in genders
+        ]),
+        "senior_level": senior.group(1) if senior else "Senior",
+        "senior_factor": float(senior.group(2)) if senior else 1.0,
+        "noise": (float(noise.group(1)), float(noise.group(2))) if noise else (-0.05, 0.05),
+        "generator_rowcount": int(rowcount.group(1)) if rowcount else 500,
+    }
+
+
+def expected_generated_rows(spec: dict) -> int:
+    """Mean row count the Snowflake GENERATOR insert produces."""
+    per_gender = (
+        spec["generator_rowcount"] * len(spec["titles"]) * len(spec["levels"])
+        * len(spec["locations"]) * len(spec["companies"])
+    )
+    return int(round(per_gender * spec["accept"].sum()))
+
+
+# ============================================
+# VECTORIZED GENERATOR
+# ============================================
+
+def iter_chunks(spec: dict, rows: int, chunk_rows: int = 1_000_000, seed: int | None = None,
+                include_seed: bool = True):
+    """
+    Yield dict-of-arrays chunks: integer codes into the spec vocabularies plus
+    ANNUAL_SALARY. Each generated row is one accepted cross-join combination, so
+    the gender mix follows the acceptance weights and the other dimensions are uniform.
+    """
+    rng = np.random.default_rng(seed)
+    vocab = vocabularies(spec)
+
+    if include_seed and spec["seed_rows"]:
+        index = {name: {v: i for i, v in enumerate(values)} for name, values in vocab.items()}
+        seed_cols = list(zip(*spec["seed_rows"]))
+        yield {
+            "JOB_TITLE": np.array([index["JOB_TITLE"][v] for v in seed_cols[0]], dtype=np.int16),
+            "ANNUAL_SALARY": np.array(seed_cols[1], dtype=np.int32),
+            "EXPERIENCE_LEVEL": np.array([index["EXPERIENCE_LEVEL"][v] for v in seed_cols[2]], dtype=np.int16),
+            "GENDER": np.array([index["GENDER"][v] for v in seed_cols[3]], dtype=np.int16),
+            "LOCATION": np.array([index["LOCATION"][v] for v in seed_cols[4]], dtype=np.int16),
+            "COMPANY_TYPE": np.array([index["COMPANY_TYPE"][v] for v in seed_cols[5]], dtype=np.int16),
+        }
+
+    level_mult = np.array([m for _, m in spec["levels"]])
+    loc_mult = np.array([m for _, m in spec["locations"]])
+    co_mult = np.array([m for _, m in spec["companies"]])
+    penalty = np.array([p for _, p in spec["genders"]])
+    gender_p = spec["accept"] / spec["accept"].sum()
+    senior = np.array([lvl == spec["senior_level"] for lvl, _ in spec["levels"]])
+    lo, hi = spec["noise"]
+
+    remaining = rows
+    while remaining > 0:
+        n = min(chunk_rows, remaining)
+        remaining -= n
+
+        title = rng.integers(0, len(spec["titles"]), n, dtype=np.int16)
+        level = rng.integers(0, len(level_mult), n, dtype=np.int16)
+        loc = rng.integers(0, len(loc_mult), n, dtype=np.int16)
+        company = rng.integers(0, len(co_mult), n, dtype=np.int16)
+        gender = rng.choice(len(gender_p), n, p=gender_p).astype(np.int16)
+
+        gap = spec["gaps"][title] * np.where(senior[level], spec["senior_factor"], 1.0)
+        salary = (
+            spec["bases"][title] * level_mult[level] * loc_mult[loc] * co_mult[company]
+            * (1.0 - penalty[gender] * gap)
+            * (1.0 + rng.uniform(lo, hi, n))
+        )
+        yield {
+            "JOB_TITLE": title,
+            # Snowflake ROUND() is half-away-from-zero; salaries are positive
+            "ANNUAL_SALARY": np.floor(salary + 0.5).astype(np.int32),
+            "EXPERIENCE_LEVEL": level,
+            "GENDER": gender,
+            "LOCATION": loc,
+            "COMPANY_TYPE": company,
+        }
+
+
+def vocabularies(spec: dict) -> dict[str, list[str]]:
+    """Code -> string tables for the categorical columns (seed-only values appended)."""
+    vocab = {
+        "JOB_TITLE": list(spec["titles"]),
+        "EXPERIENCE_LEVEL": [v for v, _ in spec["levels"]],
+        "GENDER": [v for v, _ in spec["genders"]],
+        "LOCATION": [v for v, _ in spec["locations"]],
+        "COMPANY_TYPE": [v for v, _ in spec["companies"]],
+    }
+    for row in spec["seed_rows"]:
+        for col, value in zip(COLUMNS, row):
+            if col in vocab and value not in vocab[col]:
+                vocab[col].append(value)
+    return vocab
+
+
+def decode_rows(chunk: dict, vocab: dict):
+    """Iterate a chunk as tuples of SALARIES column values."""
+    cols = [
+        np.asarray(vocab[c], dtype=object)[chunk[c]] if c in vocab else chunk[c].tolist()
+        for c in COLUMNS
+    ]
+    return zip(*cols)
+
+
+# ============================================
+# WRITERS (streaming, one chunk in memory at a time)
+# ============================================
+
+def _write_csv(chunks, vocab, out):
+    with open(out, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        for chunk in chunks:
+            writer.writerows(decode_rows(chunk, vocab))
+            yield len(chunk["ANNUAL_SALARY"])
+
+
+def _write_sqlite(chunks, vocab, out):
+    conn = sqlite3.connect(out)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS SALARIES (JOB_TITLE TEXT, ANNUAL_SALARY INTEGER, "
+            "EXPERIENCE_LEVEL TEXT, GENDER TEXT, LOCATION TEXT, COMPANY_TYPE TEXT DEFAULT 'Mixed')"
+        )
+        sql = f"INSERT INTO SALARIES ({', '.join(COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)"
+        for chunk in chunks:
+            with conn:
+                conn.executemany(sql, decode_rows(chunk, vocab))
+            yield len(chunk["ANNUAL_SALARY"])
+    finally:
+        conn.close()
+
+
+def _write_parquet(chunks, vocab, out):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    dictionaries = {c: pa.array(v) for c, v in vocab.items()}
+    writer = None
+    try:
+        for chunk in chunks:
+            arrays = [
+                pa.DictionaryArray.from_arrays(pa.array(chunk[c].astype(np.int32)), dictionaries[c])
+                if c in vocab else pa.array(chunk[c])
+                for c in COLUMNS
+            ]
+            table = pa.Table.from_arrays(arrays, names=list(COLUMNS))
+            if writer is None:
+                writer = pq.ParquetWriter(out, table.schema, compression="zstd")
+            writer.write_table(table)
+            yield len(chunk["ANNUAL_SALARY"])
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+WRITERS = {"csv": _write_csv, "sqlite": _write_sqlite, "parquet": _write_parquet}
+
+
+def write(fmt: str, out: str, rows: int, chunk_rows: int = 1_000_000, seed: int | None = None,
+          include_seed: bool = True, spec: dict | None = None, progress=None) -> int:
+    """Generate `rows` rows (+ seed rows) into `out`. Returns rows written."""
+    spec = spec or load_seed_spec()
+    vocab = vocabularies(spec)
+    chunks = iter_chunks(spec, rows, chunk_rows, seed, include_seed)
+    written = 0
+    for n in WRITERS[fmt](chunks, vocab, out):
+        written += n
+        if progress:
+            progress(written)
+    return written
+
+
+# ============================================
+# CLI
+# ============================================
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Generate SALARIES rows locally at scale.")
+    parser.add_argument("--rows", type=int, default=None,
+                        help="generated rows (default: the seed script's expected count)")
+    parser.add_argument("--format", choices=sorted(WRITERS), default="csv")
+    parser.add_argument("--out", required=True)
+    parser.add_argument("--chunk-rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed for reproducible output")
+    parser.add_argument("--no-seed-rows", action="store_true", help="skip the 420 hand-verified rows")
+    parser.add_argument("--sql", default=_SEED_SQL)
+    args = parser.parse_args(argv)
+
+    spec = load_seed_spec(args.sql)
+    rows = args.rows if args.rows is not None else expected_generated_rows(spec)
+    if not 0 <= rows <= 10**9:
+        parser.error("--rows must be between 0 and 1e9")
+
+    start = time.perf_counter()
+
+    def progress(done):
+        rate = done / max(time.perf_counter() - start, 1e-9)
+        print(f"\r{done:,} rows  ({rate:,.0f} rows/s)", end="", file=sys.stderr)
+
+    written = write(args.format, args.out, rows, args.chunk_rows, args.seed,
+                    not args.no_seed_rows, spec, progress)
+    print(f"\nWrote {written:,} rows to {args.out} in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
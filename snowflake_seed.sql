@@ -34,6 +34,10 @@ USE SCHEMA PUBLIC;
 
 -- =============================================
 -- PART 1: Schema with COMPANY_TYPE column
+-- JOB_TITLE_KEY is the normalized lookup key (trimmed, single-spaced,
+-- upper-case — salary_backend.normalize_title). The app filters on it
+-- directly, so lookups prune micro-partitions instead of evaluating
+-- UPPER(JOB_TITLE) on every row. Existing tables: migrations/001_job_title_key.sql
 -- =============================================
 
 CREATE OR REPLACE TABLE SALARIES (
@@ -42,8 +46,10 @@ CREATE OR REPLACE TABLE SALARIES (
     EXPERIENCE_LEVEL STRING,
     GENDER STRING,
     LOCATION STRING,
-    COMPANY_TYPE STRING DEFAULT 'Mixed'
-);
+    COMPANY_TYPE STRING DEFAULT 'Mixed',
+    JOB_TITLE_KEY STRING
+)
+CLUSTER BY (JOB_TITLE_KEY, GENDER);
 
 -- =============================================
 -- PART 2: 420 hand-verified seed rows (real source data)
@@ -501,7 +507,7 @@ INSERT INTO SALARIES (JOB_TITLE, ANNUAL_SALARY, EXPERIENCE_LEVEL, GENDER, LOCATI
 -- while adding COMPANY_TYPE dimension and volume
 -- =============================================
 
-INSERT INTO SALARIES (JOB_TITLE, ANNUAL_SALARY, EXPERIENCE_LEVEL, GENDER, LOCATION, COMPANY_TYPE)
+INSERT INTO SALARIES (JOB_TITLE, ANNUAL_SALARY, EXPERIENCE_LEVEL, GENDER, LOCATION, COMPANY_TYPE, JOB_TITLE_KEY)
 WITH
 -- Per-role base salaries (Male, Entry) anchored to our seed data averages
 ROLE_BASES AS (
@@ -576,7 +582,8 @@ SELECT
     L.LVL,
     G.GEN,
     LO.LOC,
-    C.CTYPE
+    C.CTYPE,
+    UPPER(R.TITLE)
 FROM NUMS N
 CROSS JOIN ROLE_BASES R
 CROSS JOIN ROLE_GAPS RG
@@ -591,6 +598,40 @@ WHERE R.TITLE = RG.TITLE
     ELSE 2
   END;
 
+-- PART 2 rows are listed without the key; derive it once here
+UPDATE SALARIES
+SET JOB_TITLE_KEY = UPPER(TRIM(REGEXP_REPLACE(JOB_TITLE, '\\s+', ' ')))
+WHERE JOB_TITLE_KEY IS NULL;
+
+
+-- =============================================
+-- PART 4: SALARY_SUMMARY — what every benchmark lookup reads
+-- Sum / count / min / max per role, level, location, company type and
+-- gender: a few hundred rows per role however large SALARIES grows. The
+-- app combines a role's rows in Python (salary_backend.fold_summary).
+-- Snowflake refreshes it incrementally from SALARIES' change stream;
+-- existing accounts: migrations/002_salary_summary.sql
+-- =============================================
+
+CREATE OR REPLACE DYNAMIC TABLE SALARY_SUMMARY
+    TARGET_LAG = '1 minute'
+    WAREHOUSE = COMPUTE_WH
+    REFRESH_MODE = INCREMENTAL
+    CLUSTER BY (JOB_TITLE_KEY)
+AS
+SELECT
+    JOB_TITLE_KEY,
+    EXPERIENCE_LEVEL,
+    LOCATION,
+    COMPANY_TYPE,
+    GENDER,
+    SUM(ANNUAL_SALARY)   AS SALARY_SUM,
+    COUNT(ANNUAL_SALARY) AS SALARY_COUNT,
+    MIN(ANNUAL_SALARY)   AS SALARY_MIN,
+    MAX(ANNUAL_SALARY)   AS SALARY_MAX
+FROM SALARIES
+GROUP BY JOB_TITLE_KEY, EXPERIENCE_LEVEL, LOCATION, COMPANY_TYPE, GENDER;
+
 
 -- =============================================
 -- ANALYTICAL QUERIES FOR DEMO
@@ -0,0 +1,98 @@
+# static_frontend.py
+"""
+InnovateHer 2026 - The Equity Gap: Built Frontend Server
+Optionally serves frontend/dist from the API process (SERVE_FRONTEND=1) so one
+process and one hop serve the whole product.
+- Precompressed .br / .gz siblings (written by the Vite build) are sent as-is
+- Hashed /assets/* get far-future immutable caching; index.html always revalidates
+- Files go out through send_file -> wsgi.file_wrapper (sendfile under gunicorn),
+  or X-Sendfile when FRONTEND_X_SENDFILE=1 and a front server handles it
+Exposes: init_frontend(app)
+"""
+
+import mimetypes
+import os
+
+from flask import abort, request, send_file
+from werkzeug.security import safe_join
+
+_DEFAULT_DIST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend", "dist")
+
+_IMMUTABLE_MAX_AGE = 31536000  # 1 year — Vite content-hashes everything under assets/
+_OTHER_MAX_AGE = 3600          # unhashed files copied from public/
+_PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+# Paths owned by the API, never answered with the SPA shell
+_API_PREFIXES = ("api/", "health")
+
+
+# ============================================
+# HELPERS
+# ============================================
+
+def _pick_precompressed(path: str) -> tuple[str, str | None]:
+    """Best precompressed sibling the client accepts: (file_path, coding or None)."""
+    available = [(coding, path + ext) for coding, ext in _PRECOMPRESSED if os.path.isfile(path + ext)]
+    if available:
+        best = request.accept_encodings.best_match([coding for coding, _ in available])
+        for coding, sibling in available:
+            if coding == best:
+                return sibling, coding
+    return path, None
+
+
+def _send(path: str, rel_path: str):
+    """send_file with precompressed negotiation and cache policy for rel_path."""
+    mimetype = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    chosen, coding = _pick_precompressed(path)
+
+    if rel_path.startswith("assets/"):
+        max_age = _IMMUTABLE_MAX_AGE
+    elif rel_path == "index.html":
+        max_age = None  # send_file marks it no-cache: always revalidate via ETag
+    else:
+        max_age = _OTHER_MAX_AGE
+
+    resp = send_file(chosen, mimetype=mimetype, conditional=True, etag=True, max_age=max_age)
+    resp.vary.add("Accept-Encoding")
+    if coding:
+        resp.headers["Content-Encoding"] = coding
+    if max_age is not None:
+        resp.cache_control.public = True
+    if max_age == _IMMUTABLE_MAX_AGE:
+        resp.cache_control.immutable = True
+    return resp
+
+
+# ============================================
+# PUBLIC API
+# ============================================
+
+def init_frontend(app, dist_dir: str | None = None) -> bool:
+    """Register the SPA routes if enabled and a build exists. Returns True if registered."""
+    if os.getenv("SERVE_FRONTEND", "0") != "1":
+        return False
+
+    dist = os.path.abspath(dist_dir or os.getenv("FRONTEND_DIST", _DEFAULT_DIST))
+    index = os.path.join(dist, "index.html")
+    if not os.path.isfile(index):
+        return False
+
+    if os.getenv("FRONTEND_X_SENDFILE", "0") == "1":
+        app.config["USE_X_SENDFILE"] = True
+
+    @app.route("/", defaults={"rel_path": ""}, methods=["GET", "HEAD"])
+    @app.route("/<path:rel_path>", methods=["GET", "HEAD"])
+    def frontend(rel_path: str):
+        """GET /<path> — Built SPA assets; unknown paths get index.html (client routing)."""
+        if rel_path.startswith(_API_PREFIXES):
+            abort(404)
+
+        full = safe_join(dist, rel_path) if rel_path else None
+        if full and os.path.isfile(full):
+            return _send(full, rel_path)
+        if rel_path.startswith("assets/"):
+            abort(404)  # a missing hashed asset must not come back as HTML
+        return _send(index, "index.html")
+
+    return True
@@ -0,0 +1,72 @@
+# test_audit.py
+"""
+InnovateHer 2026 - The Equity Gap: Pay-Equity Audit Tests
+CSV ingest edge cases, and the bincount-assembled OLS against a dense
+dummy-matrix least-squares fit. Run: python -m pytest -q
+"""
+
+import io
+import math
+
+import numpy as np
+import pytest
+
+from audit import AuditError, fit_audit, read_payroll
+
+LEVELS = ["Junior", "Mid", "Senior"]
+LOCATIONS = ["NYC", "Austin"]
+
+
+def _payroll_csv(n=400, gap=0.08, seed=0):
+    rng = np.random.default_rng(seed)
+    lines = ["Gender,Level,Location,Salary"]
+    rows = []
+    for _ in range(n):
+        female = rng.random() < 0.5
+        level = int(rng.integers(0, 3))
+        location = int(rng.integers(0, 2))
+        log_pay = 11 + 0.3 * level + 0.1 * location - gap * female + rng.normal(0, 0.05)
+        pay = round(math.exp(log_pay), 2)
+        rows.append((female, level, location, pay))
+        lines.append(f"{'F' if female else 'M'},{LEVELS[level]},{LOCATIONS[location]},\"${pay:,.2f}\"")
+    return "\n".join(lines).encode(), rows
+
+
+def test_adjusted_gap_matches_dense_ols():
+    data, rows = _payroll_csv()
+    result = fit_audit(read_payroll(io.BytesIO(data)))
+
+    # Dense design: intercept, female, level dummies (drop first), location dummy
+    x = np.array([[1, f, lvl == 1, lvl == 2, loc == 1] for f, lvl, loc, _pay in rows], dtype=float)
+    y = np.log([pay for *_rest, pay in rows])
+    beta = np.linalg.lstsq(x, y, rcond=None)[0]
+    assert result["adjusted_gap"]["log_coefficient"] == pytest.approx(beta[1], abs=1e-6)
+    assert result["adjusted_gap"]["gap_percent"] == pytest.approx((1 - math.exp(beta[1])) * 100, abs=0.01)
+    assert result["adjusted_gap"]["p_value"] < 0.001
+    assert result["employees"] == len(rows)
+
+
+def test_segments_report_gap_only_for_large_groups():
+    data, _rows = _payroll_csv(n=60)
+    data += b"\nF,Intern,NYC,40000\nM,Intern,NYC,42000"
+    segments = fit_audit(read_payroll(io.BytesIO(data)))["segments"]["level"]
+    by_name = {row["segment"]: row for row in segments}
+    assert by_name["Intern"]["gap_percent"] is None
+    assert by_name["Senior"]["gap_percent"] is not None
+
+
+def test_skipped_rows_are_counted():
+    data = b"sex,pay\nF,50000\nM,55000\nF,52000\nM,51000\nX,60000\nM,n/a\nF,0\nM,inf"
+    payroll = read_payroll(io.BytesIO(data))
+    assert payroll["skipped"] == {"invalid_salary": 3, "other_gender": 1}
+    assert len(payroll["salary"]) == 4
+
+
+@pytest.mark.parametrize("data", [
+    b"",
+    b"name,title\nA,Engineer",
+    b"gender,salary\nF,50000\nM,60000",  # one of each: no gap to estimate
+])
+def test_unusable_uploads_raise_audit_error(data):
+    with pytest.raises(AuditError):
+        fit_audit(read_payroll(io.BytesIO(data)))
@@ -0,0 +1,70 @@
+# test_bank_sim.py
+"""
+InnovateHer 2026 - The Equity Gap: Career Break Simulator Tests
+Progress reporting across the Nessie path and the deterministic fallback,
+with banking_service replaced by an in-memory stand-in. Run: python -m pytest -q
+"""
+
+import sys
+import types
+
+import pytest
+
+from bank_sim import run_simulation
+
+
+def _fake_nessie(months_served: int):
+    """banking_service whose drain stops after months_served months (deadline / API failure)."""
+    module = types.ModuleType("backend.banking_service")
+    module.INITIAL_BALANCE = 25000
+    module.MONTHLY_EXPENSES = 3000
+    module.calls = 0
+    module.create_victim_account = lambda: {"account_id": "acct"}
+
+    def simulate_drain(account_id, months, on_progress=None):
+        module.calls += 1
+        timeline = []
+        for month in range(1, min(months, months_served) + 1):
+            entry = {"month": month, "balance": max(0, 25000 - 3000 * month)}
+            timeline.append(entry)
+            if on_progress:
+                on_progress(entry)
+        return timeline
+
+    module.simulate_drain = simulate_drain
+    return module
+
+
+@pytest.fixture
+def nessie(monkeypatch):
+    def install(months_served):
+        module = _fake_nessie(months_served)
+        monkeypatch.setitem(sys.modules, "backend.banking_service", module)
+        return module
+    return install
+
+
+def test_partial_nessie_fallback_reports_each_month_once(nessie):
+    nessie(months_served=3)
+    events = []
+    result = run_simulation(6, 3000, 25000, on_progress=lambda m, b: events.append((m, b)))
+    assert [m for m, _b in events] == [1, 2, 3, 4, 5, 6]
+    assert [b for _m, b in events] == result["chart_data"][1:]
+
+
+def test_full_nessie_run_is_the_result(nessie):
+    module = nessie(months_served=24)
+    events = []
+    result = run_simulation(4, 3000, 25000, on_progress=lambda m, b: events.append((m, b)))
+    assert module.calls == 1
+    assert result["chart_data"] == [25000, 22000, 19000, 16000, 13000]
+    assert [b for _m, b in events] == result["chart_data"][1:]
+
+
+def test_other_scenarios_skip_nessie(nessie):
+    module = nessie(months_served=24)
+    events = []
+    result = run_simulation(3, 1000, 5000, on_progress=lambda m, b: events.append((m, b)))
+    assert module.calls == 0
+    assert result["chart_data"] == [5000, 4000, 3000, 2000]
+    assert events == [(1, 4000), (2, 3000), (3, 2000)]
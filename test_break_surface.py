@@ -0,0 +1,45 @@
+# test_break_surface.py
+"""
+InnovateHer 2026 - The Equity Gap: Career Break Surface Tests
+The vectorized grid must agree cell for cell with bank_sim's scalar drain, and
+grid axes must be sized before they are built. Run: python -m pytest -q
+"""
+
+import pytest
+
+from bank_sim import compound_opportunity_cost, run_deterministic_simulation
+from break_surface import MAX_CELLS, MAX_MONTHS, axis_length, compute_surface, grid_axis
+
+SPENDS = [0, 1500, 3000, 7777]
+SAVINGS = [0, 10000, 25000]
+
+
+def test_surface_matches_scalar_simulation():
+    surface = compute_surface(SPENDS, SAVINGS)
+    for i, savings in enumerate(SAVINGS):
+        for j, spend in enumerate(SPENDS):
+            for months in (1, 6, MAX_MONTHS):
+                scalar = run_deterministic_simulation(months, spend, savings)
+                assert surface["ending_balance"][i][j][months - 1] == scalar["chart_data"][-1]
+                assert surface["opportunity_cost"][i][j][months - 1] == pytest.approx(
+                    compound_opportunity_cost(scalar["chart_data"]), abs=1
+                )
+
+
+def test_depletion_month():
+    surface = compute_surface([3000, 0, 100], [10000])
+    assert surface["depletion_month"][0] == [4, None, None]  # 10000 / 3000 -> dry in month 4
+    balances = surface["ending_balance"][0][0]
+    assert balances[2] > 0 and balances[3] == 0
+
+
+def test_axis_length_matches_grid_axis():
+    for start, stop, step in [(0, 10000, 500), (500, 500, 100), (9000, 1000, 1000), (0, 7, 3)]:
+        assert axis_length(start, stop, step) == len(grid_axis(start, stop, step))
+    assert grid_axis(9000, 1000, 4000) == [1000, 5000, 9000]  # reversed bounds are swapped
+
+
+def test_oversized_axis_is_rejected_without_building_it():
+    assert axis_length(0, 10**12, 1) == 10**12 + 1
+    with pytest.raises(ValueError):
+        grid_axis(0, MAX_CELLS, 1)
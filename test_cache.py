@@ -0,0 +1,193 @@
+# test_cache.py
+"""
+InnovateHer 2026 - The Equity Gap: Two-Tier Cache Tests
+L1 / L2 behaviour against FakeRedis, an in-memory stand-in for the three
+Redis commands cache.py uses (get, set with ex, delete). Run: python -m pytest -q
+"""
+
+import threading
+import time
+
+import pytest
+
+import cache
+from cache import TwoTierCache
+
+
+class FakeRedis:
+    """get / set(ex=) / delete on a dict; down=True makes every call fail like a dead server."""
+
+    def __init__(self):
+        self.data = {}
+        self.down = False
+        self.calls = 0
+
+    def _check(self):
+        self.calls += 1
+        if self.down:
+            raise ConnectionError("fake redis is down")
+
+    def get(self, key):
+        self._check()
+        value, expires = self.data.get(key, (None, 0))
+        return value if expires > time.monotonic() else None
+
+    def set(self, key, value, ex=None):
+        self._check()
+        self.data[key] = (value, time.monotonic() + (ex or 3600))
+
+    def delete(self, key):
+        self._check()
+        self.data.pop(key, None)
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(cache, "_l2_client", fake)
+    monkeypatch.setattr(cache, "_l2_down_until", 0.0)
+    return fake
+
+
+class Counter:
+    def __init__(self, value="computed", delay=0.0):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return self.value
+
+
+def test_l1_hit_skips_compute_and_l2(redis):
+    c = TwoTierCache("t", version="v1")
+    compute = Counter()
+    assert c.get_or_set("k", compute) == "computed"
+    calls = redis.calls
+    assert c.get_or_set("k", compute) == "computed"
+    assert compute.calls == 1
+    assert redis.calls == calls
+    assert c.metrics["l1_hits"] == 1
+
+
+def test_l2_hit_promotes_to_l1(redis):
+    writer = TwoTierCache("t", version="v1")
+    reader = TwoTierCache("t", version="v1")  # another node: same L2, empty L1
+    writer.get_or_set("k", Counter({"n": 1}))
+
+    compute = Counter()
+    assert reader.get_or_set("k", compute) == {"n": 1}
+    assert compute.calls == 0
+    assert reader.metrics["l2_hits"] == 1
+
+    calls = redis.calls
+    assert reader.get("k") == {"n": 1}
+    assert redis.calls == calls
+    assert reader.metrics["l1_hits"] == 1
+
+
+def test_cached_none_is_a_hit(redis):
+    c = TwoTierCache("t")
+    compute = Counter(value=None)
+    c.get_or_set("k", compute)
+    assert c.get_or_set("k", compute) is None
+    assert compute.calls == 1
+
+
+def test_version_change_misses(redis):
+    TwoTierCache("t", version="v1").get_or_set("k", Counter("old"))
+    assert TwoTierCache("t", version="v2").get_or_set("k", Counter("new")) == "new"
+
+
+def test_redis_down_falls_back_to_compute_and_cools_down(redis):
+    redis.down = True
+    c = TwoTierCache("t")
+    compute = Counter()
+    assert c.get_or_set("k", compute) == "computed"
+    assert c.metrics["l2_errors"] >= 1
+    assert cache._l2() is None  # cooling down: later requests skip L2 entirely
+    assert c.get_or_set("k", compute) == "computed"
+    assert compute.calls == 1  # L1 still serves
+
+
+def test_invalidate_drops_both_tiers(redis):
+    c = TwoTierCache("t")
+    c.get_or_set("k", Counter("first"))
+    c.invalidate("k")
+    assert not redis.data
+    assert c.get_or_set("k", Counter("second")) == "second"
+
+
+def test_should_cache_false_is_not_stored(redis):
+    c = TwoTierCache("t")
+    c.get_or_set("k", Counter([]), should_cache=bool)
+    assert c.get("k", "missing") == "missing"
+
+
+def test_concurrent_misses_compute_once(redis):
+    c = TwoTierCache("t")
+    compute = Counter(delay=0.1)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(c.get_or_set("k", compute))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == ["computed"] * 8
+    assert compute.calls == 1
+    assert c.metrics["coalesced"] == 7
+
+
+def test_failed_compute_lets_waiters_retry(redis):
+    c = TwoTierCache("t")
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        time.sleep(0.05)
+        raise RuntimeError("backend down")
+
+    errors = []
+    leader = threading.Thread(target=lambda: errors.append(pytest.raises(RuntimeError, c.get_or_set, "k", failing)))
+    leader.start()
+    started.wait()
+    assert c.get_or_set("k", Counter("retried")) == "retried"
+    leader.join()
+    assert errors
+
+
+def test_every_tier_returns_a_fresh_copy(redis):
+    c = TwoTierCache("t")
+    computed = c.get_or_set("k", Counter({"rows": [("a", 1)]}))
+    assert computed == {"rows": [["a", 1]]}  # same shape as an L2 hit
+    computed["rows"].append("mutated")
+    first = c.get("k")
+    first["rows"].clear()
+    assert c.get("k") == {"rows": [["a", 1]]}
+    assert c.metrics["l1_hits"] == 2
+
+
+def test_stuck_compute_does_not_block_waiters(redis, monkeypatch):
+    monkeypatch.setattr(cache, "_FLIGHT_WAIT", 0.05)
+    c = TwoTierCache("t")
+    release = threading.Event()
+    started = threading.Event()
+
+    def stuck():
+        started.set()
+        release.wait(5)
+        return "late"
+
+    leader = threading.Thread(target=lambda: c.get_or_set("k", stuck))
+    leader.start()
+    started.wait()
+    try:
+        assert c.get_or_set("k", Counter("local")) == "local"
+        assert c.metrics["flight_timeouts"] == 1
+    finally:
+        release.set()
+        leader.join()
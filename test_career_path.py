@@ -0,0 +1,91 @@
+# test_career_path.py
+"""
+InnovateHer 2026 - The Equity Gap: Career Path Engine Tests
+Input validation, and incremental recomputation matching a from-scratch run.
+Run: python -m pytest -q
+"""
+
+import pytest
+
+from career_path import MAX_YEARS, CareerPath, get_career_path, parse_events, parse_params
+
+
+def test_parse_params_clamps_and_defaults():
+    params = parse_params({"years": 500, "salary": "abc"})
+    assert params["years"] == MAX_YEARS
+    assert params["salary"] == parse_params({})["salary"]
+
+
+@pytest.mark.parametrize("value", ["nan", "inf", "-inf", float("inf")])
+def test_parse_params_rejects_non_finite(value):
+    with pytest.raises(ValueError):
+        parse_params({"salary": value})
+
+
+@pytest.mark.parametrize("event", [
+    {"type": "break", "year": "inf"},
+    {"type": "job_switch", "year": 2, "salary": "nan"},
+    {"type": "raise", "year": 2, "raise_percent": "inf"},
+])
+def test_parse_events_rejects_non_finite(event):
+    with pytest.raises(ValueError):
+        parse_events([event])
+
+
+def test_incremental_edit_matches_fresh_path():
+    params = parse_params({"years": 20})
+    events = parse_events([{"type": "break", "year": 5, "months": 6}])
+    edited = parse_events([
+        {"type": "break", "year": 5, "months": 6},
+        {"type": "promotion", "year": 12, "raise_percent": 15},
+    ])
+
+    path = CareerPath(params)
+    path.set_events(events)
+    assert path.set_events(edited) == 12  # only years 12+ are recomputed
+
+    fresh = CareerPath(params)
+    fresh.set_events(edited)
+    assert path.result()["net_worth_trajectory"] == fresh.result()["net_worth_trajectory"]
+
+
+def test_break_costs_net_worth():
+    path = CareerPath(parse_params({"years": 10}))
+    path.set_events(parse_events([{"type": "break", "year": 3, "months": 12}]))
+    result = path.result()
+    assert result["cost_of_events"] > 0
+    assert result["final_net_worth"] == result["net_worth_trajectory"][-1]
+
+
+def test_unchanged_events_recompute_nothing():
+    path = CareerPath(parse_params({"years": 10}))
+    events = parse_events([{"type": "raise", "year": 4, "raise_percent": 5}])
+    path.set_events(events)
+    assert path.set_events(events) == 11
+
+
+def test_get_career_path_reuses_until_params_change():
+    params = parse_params({"years": 10})
+    first = get_career_path("test-client", params)
+    assert get_career_path("test-client", dict(params)) is first
+    assert get_career_path("test-client", parse_params({"years": 11})) is not first
+
+
+@pytest.mark.parametrize("key, value, expected", [
+    ("annual_raise", 1e10, 1.0),
+    ("annual_raise", -3, -0.5),
+    ("investment_return", 1e200, 1.0),
+    ("savings_rate", 5, 1.0),
+    ("employer_match", -1, 0.0),
+    ("break_monthly_spend", -100, 0.0),
+])
+def test_parse_params_clamps_rates(key, value, expected):
+    assert parse_params({key: value})[key] == expected
+
+
+@pytest.mark.parametrize("raw", [{"annual_raise": 1e10}, {"investment_return": 1e200}, {"annual_raise": -3}])
+def test_extreme_rates_give_a_bounded_monotone_path(raw):
+    path = CareerPath(parse_params({**raw, "years": MAX_YEARS}))
+    salary = path.result()["salary_trajectory"]
+    assert all(s >= 0 for s in salary)
+    assert salary == sorted(salary) or salary == sorted(salary, reverse=True)
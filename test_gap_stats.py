@@ -0,0 +1,107 @@
+# test_gap_stats.py
+"""
+InnovateHer 2026 - The Equity Gap: Gap Confidence Interval Tests
+bootstrap_gap() on synthetic salaries, and gap_confidence() caching against an
+in-memory backend. Run: python -m pytest -q
+"""
+
+import numpy as np
+import pytest
+
+import gap_stats
+import salary_backend
+from gap_stats import bootstrap_gap, gap_confidence
+
+
+class FakeBackend:
+    """summary_rows / salary_samples over a list of (gender, level, salary)."""
+
+    name = "fake"
+    summary_lag = 0
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.sample_reads = 0
+
+    def summary_rows(self, role):
+        totals = {}
+        for gender, level, salary in self.rows:
+            count, total = totals.get((level, gender), (0, 0.0))
+            totals[(level, gender)] = (count + 1, total + salary)
+        return [(level, "Remote", "Tech", gender, total, count, 0, 0)
+                for (level, gender), (count, total) in totals.items()]
+
+    def salary_samples(self, role, level=None):
+        self.sample_reads += 1
+        return [(g, s) for g, lvl, s in self.rows if not level or lvl.upper() == level.upper()]
+
+
+def _rows(n=200, male_mean=100_000, female_mean=90_000, seed=1):
+    rng = np.random.default_rng(seed)
+    rows = [("Male", "Senior", float(s)) for s in rng.normal(male_mean, 8000, n)]
+    rows += [("Female", "Senior", float(s)) for s in rng.normal(female_mean, 8000, n)]
+    return rows
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    fake = FakeBackend(_rows())
+    monkeypatch.setattr(salary_backend, "_backend", fake)
+    monkeypatch.setattr(gap_stats, "_cache", type(gap_stats._cache)())
+    salary_backend.invalidate_role("Test Engineer")
+    return fake
+
+
+def test_interval_covers_true_gap():
+    rng = np.random.default_rng(0)
+    male = rng.normal(100_000, 10_000, 500)
+    female = rng.normal(90_000, 10_000, 500)
+    result = bootstrap_gap(male, female, resamples=1000)
+    assert result["gap_ci"]["low"] < 10_000 < result["gap_ci"]["high"]
+    assert result["gap_percent_ci"]["low"] < 10.0 < result["gap_percent_ci"]["high"]
+    assert result["ci_method"] == "bootstrap"
+
+
+def test_same_seed_same_interval():
+    male, female = [100, 110, 120, 130], [90, 95, 100, 105]
+    assert bootstrap_gap(male, female, resamples=200, seed=7) == bootstrap_gap(male, female, resamples=200, seed=7)
+
+
+def test_too_few_salaries():
+    assert bootstrap_gap([100_000], [90_000, 95_000]) is None
+
+
+def test_chunked_resampling_matches_shape(monkeypatch):
+    monkeypatch.setattr(gap_stats, "_MAX_MATRIX_CELLS", 1000)  # forces several index-matrix chunks
+    means = gap_stats._resample_means(np.arange(100.0), np.random.default_rng(0), 250)
+    assert means.shape == (250,)
+    assert 40 < means.mean() < 60
+
+
+def test_large_groups_use_normal_approximation(monkeypatch):
+    monkeypatch.setattr(gap_stats, "_MAX_BOOTSTRAP_N", 10)
+    result = bootstrap_gap(np.arange(50.0) + 100, np.arange(50.0), resamples=500)
+    assert result["ci_method"] == "normal"
+
+
+def test_gap_confidence_is_cached(backend):
+    first = gap_confidence("Test Engineer", version="t")
+    assert gap_confidence("Test Engineer", version="t") == first
+    assert backend.sample_reads == 1
+
+
+def test_gap_confidence_recomputes_after_new_rows(backend):
+    before = gap_confidence("Test Engineer", version="t")
+    backend.rows += [("Female", "Senior", 40_000.0)] * 50
+    salary_backend.invalidate_role("Test Engineer")
+    after = gap_confidence("Test Engineer", version="t")
+    assert backend.sample_reads == 2
+    assert after["gap_ci"]["low"] > before["gap_ci"]["low"]
+
+
+def test_summary_signature_follows_new_rows(backend):
+    before = salary_backend.summary_signature("Test Engineer")
+    assert salary_backend.summary_signature("test  engineer") == before
+    backend.rows.append(("Female", "Senior", 70_000.0))
+    salary_backend.invalidate_role("Test Engineer")
+    assert salary_backend.summary_signature("Test Engineer") != before
@@ -0,0 +1,61 @@
+# test_http_cache.py
+"""
+InnovateHer 2026 - The Equity Gap: Conditional-Request Tests
+ETag revalidation through the compression layer: a 304 names the variant
+the client holds and varies on Accept-Encoding. Run: python -m pytest -q
+"""
+
+import pytest
+from flask import Flask
+
+from http_cache import conditional_json, make_etag
+from http_codec import init_codec
+
+ETAG = make_etag("test", {"n": 1}, "v1")
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    init_codec(app)
+    app.builds = 0
+
+    @app.route("/data")
+    def data():
+        def build():
+            app.builds += 1
+            return {"values": list(range(2000))}, 200
+        return conditional_json(ETAG, build, 60)
+
+    client = app.test_client()
+    client.builds = lambda: app.builds
+    return client
+
+
+def test_plain_etag_round_trip(client):
+    first = client.get("/data")
+    assert first.headers["ETag"] == f'"{ETAG}"'
+    second = client.get("/data", headers={"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 304
+    assert second.headers["ETag"] == f'"{ETAG}"'
+    assert client.builds() == 1
+
+
+@pytest.mark.parametrize("coding", ["gzip", "br"])
+def test_304_echoes_compressed_variant(client, coding):
+    first = client.get("/data", headers={"Accept-Encoding": coding})
+    if first.headers.get("Content-Encoding") != coding:
+        pytest.skip(f"{coding} not available")
+    assert first.headers["ETag"] == f'"{ETAG}-{coding}"'
+
+    second = client.get("/data", headers={"Accept-Encoding": coding, "If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 304
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert "Accept-Encoding" in second.headers["Vary"]
+    assert client.builds() == 1
+
+
+def test_stale_etag_rebuilds(client):
+    response = client.get("/data", headers={"If-None-Match": '"something-else"'})
+    assert response.status_code == 200
+    assert "Accept-Encoding" in response.headers["Vary"]
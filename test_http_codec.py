@@ -0,0 +1,102 @@
+# test_http_codec.py
+"""
+InnovateHer 2026 - The Equity Gap: Response Encoding Tests
+compact-v1 round trip (prefix sums + rebuilt labels) and negotiated
+compression of buffered and streamed bodies. Run: python -m pytest -q
+"""
+
+import gzip
+import itertools
+import zlib
+
+import pytest
+from flask import Flask, jsonify
+from werkzeug.datastructures import Accept
+
+import http_codec
+from http_codec import COMPACT_FORMAT, compact_encode, delta_encode, encode_stream, init_codec, wants_compact
+
+
+def _compact_decode(payload: dict) -> dict:
+    """What the client does: prefix-sum the delta fields, rebuild year_labels."""
+    out = {k: v for k, v in payload.items() if k != "encoding"}
+    for field in http_codec._DELTA_FIELDS:
+        if isinstance(out.get(field), list):
+            out[field] = list(itertools.accumulate(out[field]))
+    years = len(out["male_trajectory"]) - 1
+    out["year_labels"] = ["Start"] + [f"Year {i}" for i in range(1, years + 1)]
+    return out
+
+
+def test_compact_round_trip():
+    payload = {
+        "male_trajectory": [100000, 103000, 106090, 109273],
+        "female_trajectory": [90000, 92700, 95481, 98345],
+        "gap_trajectory": [10000, 10300, 10609, 10928],
+        "year_labels": ["Start", "Year 1", "Year 2", "Year 3"],
+        "chart_data": [25000, 22000, 19000, 16000],
+        "total_loss": 12345,
+    }
+    encoded = compact_encode(payload)
+    assert encoded["encoding"] == COMPACT_FORMAT
+    assert "year_labels" not in encoded
+    assert encoded["chart_data"] == [25000, -3000, -3000, -3000]
+    assert _compact_decode(encoded) == payload
+
+
+def test_delta_encode_empty_and_negative():
+    assert delta_encode([]) == []
+    assert list(itertools.accumulate(delta_encode([5, -2, 7, 7]))) == [5, -2, 7, 7]
+
+
+def test_wants_compact():
+    assert wants_compact({"format": "Compact"})
+    assert not wants_compact({"format": "json"})
+    assert not wants_compact({})
+
+
+@pytest.mark.parametrize("coding", ["gzip", "br"])
+def test_encode_stream_round_trip(coding):
+    if coding == "br" and http_codec.brotli is None:
+        pytest.skip("brotli not installed")
+    chunks = [f'{{"row": {i}}}\n'.encode() for i in range(200)]
+    stream, chosen = encode_stream(iter(chunks), Accept([(coding, 1)]))
+    assert chosen == coding
+    body = b"".join(stream)
+    decoded = gzip.decompress(body) if coding == "gzip" else http_codec.brotli.decompress(body)
+    assert decoded == b"".join(chunks)
+
+
+def test_encode_stream_identity():
+    chunks = [b"a", b"b"]
+    stream, coding = encode_stream(chunks, Accept([("identity", 1)]))
+    assert coding is None and list(stream) == chunks
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    init_codec(app)
+
+    @app.route("/big")
+    def big():
+        return jsonify({"values": list(range(2000))})
+
+    @app.route("/small")
+    def small():
+        return jsonify({"ok": True})
+
+    return app.test_client()
+
+
+def test_large_json_is_gzipped(client):
+    response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert zlib.decompress(response.data, 31).startswith(b'{"values":[0,1,2')
+
+
+def test_small_json_is_not_compressed(client):
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+    assert "Accept-Encoding" in response.headers["Vary"]
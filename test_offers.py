@@ -0,0 +1,70 @@
+# test_offers.py
+"""
+InnovateHer 2026 - The Equity Gap: Offer Comparison Tests
+The broadcast NPV grid against a per-year loop, vesting, and breakevens.
+Run: python -m pytest -q
+"""
+
+import pytest
+
+from offers import compare_offers, parse_grid, parse_offers
+
+
+def _npv(flows, rate, horizon):
+    return sum(flow / (1 + rate) ** year for year, flow in enumerate(flows[:horizon + 1]))
+
+
+def test_npv_matches_loop():
+    offers = parse_offers([
+        {"name": "Startup", "base": 120000, "equity": {"grant_value": 200000}},
+        {"name": "BigCo", "base": 140000, "bonus_percent": 15, "signing_bonus": 20000},
+    ])
+    horizons, rates, headline = parse_grid({"horizons": [1, 4, 10], "discount_rates": [0, 0.08]})
+    result = compare_offers(offers, horizons, rates, headline)
+    assert result["discount_rates"] == [0.0, 0.05, 0.08]  # headline rate added
+    for offer in result["offers"]:
+        for r, rate in enumerate(rates):
+            for h, horizon in enumerate(horizons):
+                # cash_flows are rounded to whole dollars: allow $1 per year
+                expected = _npv(offer["cash_flows"], rate, horizon)
+                assert offer["npv"][r][h] == pytest.approx(expected, abs=horizon + 1)
+
+
+def test_equity_cliff_and_vesting():
+    offers = parse_offers([
+        {"base": 100000, "equity": {"grant_value": 48000, "vesting_years": 4, "cliff_months": 12}},
+        {"base": 100000},
+    ])
+    equity = compare_offers(offers, [5], [0.0], 0.0)["offers"][0]["equity"]
+    assert equity == [0, 12000, 12000, 12000, 12000, 0]
+
+
+def test_breakeven_year():
+    offers = parse_offers([
+        {"name": "Slow", "base": 100000, "raise_percent": 10},
+        {"name": "Fast", "base": 110000, "raise_percent": 0, "signing_bonus": 5000},
+    ])
+    result = compare_offers(offers, [10], [0.0], 0.0)
+    assert result["best"] == "Slow"
+    (breakeven,) = result["breakevens"]
+    assert breakeven["offer"] == "Slow" and breakeven["overtakes"] == "Fast"
+    flows = {o["name"]: o["cash_flows"] for o in result["offers"]}
+    ahead = [sum(flows["Slow"][:y + 1]) >= sum(flows["Fast"][:y + 1]) for y in range(11)]
+    assert ahead[breakeven["year"] - 1] is False and all(ahead[breakeven["year"]:])
+
+
+@pytest.mark.parametrize("raw", [
+    [{"base": 100000}],
+    [{"base": 100000}, {"bonus_percent": 10}],
+    [{"base": 100000}, {"base": "lots"}],
+    [{"base": 100000}, {"base": -5}],
+])
+def test_parse_offers_rejects(raw):
+    with pytest.raises(ValueError):
+        parse_offers(raw)
+
+
+@pytest.mark.parametrize("raw", [{"horizons": [0]}, {"discount_rates": [1.5]}, {"horizons": ["x"]}])
+def test_parse_grid_rejects(raw):
+    with pytest.raises(ValueError):
+        parse_grid(raw)
@@ -0,0 +1,100 @@
+# test_query_ledger.py
+"""
+InnovateHer 2026 - The Equity Gap: Query Ledger Tests
+Fingerprint normalization, the per-fingerprint rollup, and the cursor proxy
+over an in-memory SQLite database. Run: python -m pytest -q
+"""
+
+import json
+import sqlite3
+from collections import deque
+
+import pytest
+
+import query_ledger
+from query_ledger import fingerprint, mongo_statement, record, recent, top, wrap
+
+
+@pytest.fixture(autouse=True)
+def ledger(monkeypatch, tmp_path):
+    monkeypatch.setattr(query_ledger, "_ENABLED", True)
+    monkeypatch.setattr(query_ledger, "_ring", deque(maxlen=100))
+    monkeypatch.setattr(query_ledger, "_rollup", {})
+    monkeypatch.setattr(query_ledger, "_PATH", str(tmp_path / "ledger.json"))
+    monkeypatch.setattr(query_ledger, "_ensure_writer", lambda: None)
+
+
+@pytest.mark.parametrize("a, b", [
+    ("SELECT * FROM T WHERE A = 1", "SELECT * FROM T WHERE A = ?"),
+    ("SELECT * FROM T WHERE A = 'x'", "SELECT * FROM T WHERE A = 'it''s'"),
+    ("SELECT * FROM T WHERE A = %s", "SELECT * FROM T WHERE A = :name"),
+    ("SELECT * FROM T WHERE A IN (1, 2, 3)", "SELECT * FROM T WHERE A IN (%s)"),
+    ("INSERT INTO T VALUES (?, ?), (?, ?)", "INSERT INTO T VALUES (1, 'a'), (2, 'b'), (3, 'c')"),
+    ("SELECT A FROM T -- trailing\nWHERE B = -2.5", "SELECT A   FROM T /* x */ WHERE B = ?"),
+])
+def test_same_shape_same_fingerprint(a, b):
+    assert fingerprint(a) == fingerprint(b)
+
+
+def test_identifiers_keep_their_digits():
+    _fp, text = fingerprint("SELECT COL1, T2.X FROM T2 WHERE Y = 3")
+    assert text == "SELECT COL1, T2.X FROM T2 WHERE Y = ?"
+    assert fingerprint("SELECT A FROM T")[0] != fingerprint("SELECT B FROM T")[0]
+
+
+def test_mongo_statement_hides_values():
+    statement = mongo_statement("tips", "find", {"role": "Engineer", "category": "equity"})
+    assert statement == "tips.find({category: ?, role: ?})"
+
+
+def test_rollup_and_top():
+    for ms in (5.0, 15.0):
+        record("sqlite", "SELECT * FROM T WHERE A = 1", 1, ms, 10)
+    record("sqlite", "SELECT * FROM U", 0, 100.0, 1, error="OperationalError")
+
+    report = top(by="calls")
+    assert report["fingerprints"] == 2 and report["calls"] == 3
+    first = report["queries"][0]
+    assert first["calls"] == 2 and first["avg_ms"] == 10.0 and first["max_ms"] == 15.0
+    assert first["rows_per_call"] == 10.0
+    assert top(by="total_ms")["queries"][0]["errors"] == 1
+    assert recent(1)[0]["error"] == "OperationalError"
+
+
+def test_fingerprint_cap_overflows(monkeypatch):
+    monkeypatch.setattr(query_ledger, "_MAX_FINGERPRINTS", 2)
+    for table in ("A", "B", "C", "D"):
+        record("sqlite", f"SELECT * FROM {table}", 0, 1.0, 0)
+    fingerprints = {q["fingerprint"]: q["calls"] for q in top()["queries"]}
+    assert fingerprints["overflow"] == 2 and len(fingerprints) == 3
+
+
+def test_cursor_records_rows_and_time():
+    conn = sqlite3.connect(":memory:")
+    cursor = wrap(conn.cursor(), "sqlite")
+    cursor.execute("CREATE TABLE T (A INTEGER)")
+    cursor.executemany("INSERT INTO T VALUES (?)", [(i,) for i in range(5)])
+    rows = cursor.execute("SELECT A FROM T WHERE A > ?", (1,)).fetchall()
+    assert len(rows) == 3
+    assert list(cursor.execute("SELECT A FROM T")) == [(i,) for i in range(5)]
+    cursor.close()
+
+    queries = {q["fingerprint"]: q for q in top()["queries"]}
+    insert = queries[fingerprint("INSERT INTO T VALUES (?)")[0]]
+    assert insert["statement"] == "INSERT INTO T VALUES (?...)"
+    assert insert["rows"] == 5 and insert["params_max"] == 5
+    assert queries[fingerprint("SELECT A FROM T WHERE A > ?")[0]]["rows"] == 3
+    assert queries[fingerprint("SELECT A FROM T")[0]]["rows"] == 5
+
+
+def test_failed_statement_is_recorded():
+    cursor = wrap(sqlite3.connect(":memory:").cursor(), "sqlite")
+    with pytest.raises(sqlite3.OperationalError):
+        cursor.execute("SELECT * FROM MISSING")
+    assert top()["queries"][0]["errors"] == 1
+
+
+def test_flush_writes_rollup(tmp_path):
+    record("mongo", mongo_statement("tips", "find", {"role": "x"}), 1, 2.0, 3)
+    with open(query_ledger.flush(), encoding="utf-8") as f:
+        assert json.load(f)["queries"][0]["statement"] == "tips.find({role: ?})"
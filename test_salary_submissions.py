@@ -0,0 +1,72 @@
+# test_salary_submissions.py
+"""
+InnovateHer 2026 - The Equity Gap: Crowd Submission Store Tests
+Bounded bookkeeping for user-supplied keys, and aggregates aging out once
+flushed. Run: python -m pytest -q
+"""
+
+import pytest
+
+import salary_submissions
+from salary_submissions import SubmissionStore, normalize_submission
+
+
+class FakeBackend:
+    def __init__(self):
+        self.rows = []
+
+    def insert_rows(self, rows):
+        self.rows += rows
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    fake = FakeBackend()
+    monkeypatch.setattr(salary_submissions, "get_backend", lambda: fake)
+    monkeypatch.setattr(salary_submissions, "invalidate_role", lambda role: None)
+    return fake
+
+
+def _row(role="Engineer", location="NYC", salary=100000):
+    return normalize_submission({"role": role, "salary": salary, "gender": "female", "location": location})
+
+
+def _store(**kwargs):
+    store = SubmissionStore(**kwargs)
+    store._ensure_flusher = lambda: None  # flush by hand
+    return store
+
+
+def test_distinct_keys_are_capped():
+    store = _store(max_segments=3, max_roles=3)
+    for i in range(10):
+        assert store.submit(_row(role=f"Role {i}", location=f"City {i}"))
+    assert len(store._stats) == 3
+    assert len(store._generations) == 3
+    assert [s["role_key"] for s in store.stats()] == ["ROLE 7", "ROLE 8", "ROLE 9"]
+
+
+def test_generation_changes_and_never_goes_back():
+    store = _store(max_roles=1)
+    before = store.role_generation("Engineer")
+    store.submit(_row("Engineer"))
+    seen = store.role_generation("Engineer")
+    assert seen != before
+    store.submit(_row("Designer"))  # evicts Engineer
+    assert store.role_generation("Engineer") >= seen
+
+
+def test_flushed_idle_stats_age_out(backend):
+    store = _store(stats_ttl=0)
+    store.submit(_row())
+    assert store.stats()
+    assert store.flush() == 1
+    assert backend.rows and not store.stats()
+    assert store.pending_count() == 0
+
+
+def test_recent_stats_survive_flush(backend):
+    store = _store(stats_ttl=3600)
+    store.submit(_row())
+    store.flush()
+    assert store.stats()[0]["count"] == 1
@@ -1,55 +1,38 @@
 """
 InnovateHer 2026 - The Equity Gap: Truth Engine
-Snowflake-powered salary benchmark tool
+Salary benchmark tool (Snowflake, or the embedded SQLite copy — see salary_backend.py)
 """
 
-import os
-from dotenv import load_dotenv
-import snowflake.connector
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 
-# Load environment variables from .env file
-load_dotenv()
+from salary_backend import aggregate_cache, fold_summary, get_backend, normalize_title, require_backend
+from salary_submissions import RunningStats, combine, pending_overlay
+
+# Importing this module without any backend raises ImportError (app.py uses mocks)
+require_backend()
 
 app = Flask(__name__)
 CORS(app)
 
-# ============================================
-# SNOWFLAKE CONFIG - Loaded from .env file
-# ============================================
-SNOWFLAKE_CONFIG = {
-    "user": os.getenv("SNOWFLAKE_USER"),
-    "password": os.getenv("SNOWFLAKE_PASSWORD"),
-    "account": os.getenv("SNOWFLAKE_ACCOUNT"),
-    "warehouse": "COMPUTE_WH",
-    "database": "HACKATHON_DB",
-    "schema": "PUBLIC"
-}
-
-
-def get_snowflake_connection():
-    return snowflake.connector.connect(**SNOWFLAKE_CONFIG)
-
 
 def get_market_benchmark(role: str) -> dict:
-    conn = None
     try:
-        conn = get_snowflake_connection()
-        cursor = conn.cursor()
-        
-        query = """
-            SELECT 
-                AVG(ANNUAL_SALARY) as avg_salary,
-                MIN(ANNUAL_SALARY) as min_salary,
-                MAX(ANNUAL_SALARY) as max_salary,
-                COUNT(*) as sample_size
-            FROM SALARIES 
-            WHERE UPPER(JOB_TITLE) = UPPER(%s)
-        """
-        
-        cursor.execute(query, (role,))
-        result = cursor.fetchone()
+        # Same cached summary rows as get_gender_benchmark, folded over every segment
+        rows = aggregate_cache().get_or_set(
+            ("summary", normalize_title(role)),
+            lambda: get_backend().summary_rows(role),
+        )
+        result = fold_summary(rows).get("ALL")
+
+        # Fold in crowd submissions that have not been flushed to SALARIES yet
+        overlay = RunningStats()
+        for stats in pending_overlay(role).values():
+            overlay.merge(stats)
+        if overlay.count:
+            avg, lo, hi, count = result or (None, None, None, 0)
+            count, avg, lo, hi = combine(count, avg, lo, hi, overlay)
+            result = (avg, lo, hi, count)
         
         if result and result[0] is not None:
             return {
@@ -73,9 +56,6 @@ def get_market_benchmark(role: str) -> dict:
             "success": False,
             "error": str(e)
         }
-    finally:
-        if conn:
-            conn.close()
 
 
 # ============================================